@@ -158,7 +158,7 @@ class BuyAndHoldBenchmark:
         Returns:
             Dictionary with summary statistics
         """
-        if not curve.points:
+        if len(curve) == 0:
             return {
                 "start_date": None,
                 "end_date": None,
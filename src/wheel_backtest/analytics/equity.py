@@ -3,11 +3,14 @@
 Provides daily tracking of portfolio value for backtesting.
 """
 
-from dataclasses import dataclass, field
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
 from datetime import date
-from typing import Iterator
+from typing import overload
 
+import numpy as np
 import pandas as pd
+from numpy.typing import ArrayLike
 
 
 @dataclass
@@ -25,7 +28,6 @@ class EquityPoint:
         return self.cash + self.stock_value + self.options_value
 
 
-@dataclass
 class EquityCurve:
     """Time series of portfolio equity values.
 
@@ -33,9 +35,103 @@ class EquityCurve:
     - Cash holdings
     - Stock positions (marked to market)
     - Options positions (marked to market)
+
+    Values are stored column-wise in NumPy arrays; EquityPoint objects are
+    only built when points are accessed. Reading or assigning points hands
+    the curve over to a plain list, as in earlier versions, so edits to that
+    list are still seen by every other method (at the cost of rebuilding
+    the columns from it on each read).
     """
 
-    points: list[EquityPoint] = field(default_factory=list)
+    def __init__(self, points: Iterable[EquityPoint] | None = None):
+        """Initialize equity curve.
+
+        Args:
+            points: Initial equity points (optional)
+        """
+        self._size = 0
+        self._dates: np.ndarray = np.empty(0, dtype=object)
+        self._cash: np.ndarray = np.empty(0, dtype=np.float64)
+        self._stock_value: np.ndarray = np.empty(0, dtype=np.float64)
+        self._options_value: np.ndarray = np.empty(0, dtype=np.float64)
+        self._points: list[EquityPoint] | None = None
+
+        for point in points or ():
+            self.add_point(point.date, point.cash, point.stock_value, point.options_value)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        dates: Sequence[date] | np.ndarray,
+        cash: ArrayLike,
+        stock_value: ArrayLike,
+        options_value: ArrayLike | None = None,
+    ) -> "EquityCurve":
+        """Create EquityCurve from column arrays.
+
+        Float64 arrays are used as-is rather than copied.
+
+        Args:
+            dates: Date of each snapshot
+            cash: Cash balance per date
+            stock_value: Value of stock holdings per date
+            options_value: Mark-to-market value of options per date (optional)
+
+        Returns:
+            EquityCurve instance
+
+        Raises:
+            ValueError: If the arrays differ in length
+        """
+        curve = cls()
+        curve._dates = np.asarray(dates, dtype=object)
+        curve._cash = np.asarray(cash, dtype=np.float64)
+        curve._stock_value = np.asarray(stock_value, dtype=np.float64)
+        n = len(curve._dates)
+        if options_value is None:
+            curve._options_value = np.zeros(n)
+        else:
+            curve._options_value = np.asarray(options_value, dtype=np.float64)
+
+        if not (
+            curve._cash.shape == curve._stock_value.shape == curve._options_value.shape == (n,)
+        ):
+            raise ValueError("Equity arrays must all have the same length")
+
+        curve._size = n
+        return curve
+
+    @property
+    def points(self) -> list[EquityPoint]:
+        """All equity points, in date order.
+
+        The returned list backs the curve from then on; mutating it changes
+        the curve.
+        """
+        if self._points is None:
+            self._points = list(map(self._point, range(self._size)))
+        return self._points
+
+    @points.setter
+    def points(self, points: list[EquityPoint]) -> None:
+        self._points = points
+
+    def _sync_columns(self) -> None:
+        """Rebuild the column arrays from the points list, if one was handed out."""
+        points = self._points
+        if points is None:
+            return
+        n = len(points)
+        self._dates = np.empty(n, dtype=object)
+        self._dates[:] = [point.date for point in points]
+        self._cash = np.fromiter((point.cash for point in points), np.float64, n)
+        self._stock_value = np.fromiter(
+            (point.stock_value for point in points), np.float64, n
+        )
+        self._options_value = np.fromiter(
+            (point.options_value for point in points), np.float64, n
+        )
+        self._size = n
 
     def add_point(
         self,
@@ -52,43 +148,115 @@ class EquityCurve:
             stock_value: Value of stock holdings
             options_value: Mark-to-market value of options positions
         """
-        self.points.append(
-            EquityPoint(
-                date=trade_date,
-                cash=cash,
-                stock_value=stock_value,
-                options_value=options_value,
-            )
+        if self._points is not None:
+            self._points.append(EquityPoint(trade_date, cash, stock_value, options_value))
+            return
+        n = self._size
+        if n == len(self._dates):
+            self._resize(max(2 * n, 64))
+        self._dates[n] = trade_date
+        self._cash[n] = cash
+        self._stock_value[n] = stock_value
+        self._options_value[n] = options_value
+        self._size = n + 1
+
+    def _resize(self, capacity: int) -> None:
+        """Reallocate the column arrays, keeping the stored points."""
+        n = self._size
+        for name in ("_dates", "_cash", "_stock_value", "_options_value"):
+            old = getattr(self, name)
+            column = np.empty(capacity, dtype=old.dtype)
+            column[:n] = old[:n]
+            setattr(self, name, column)
+
+    def _point(self, i: int) -> EquityPoint:
+        return EquityPoint(
+            date=self._dates[i],
+            cash=float(self._cash[i]),
+            stock_value=float(self._stock_value[i]),
+            options_value=float(self._options_value[i]),
         )
 
     def __len__(self) -> int:
-        return len(self.points)
+        if self._points is not None:
+            return len(self._points)
+        return self._size
 
     def __iter__(self) -> Iterator[EquityPoint]:
-        return iter(self.points)
+        if self._points is not None:
+            return iter(self._points)
+        return map(self._point, range(self._size))
+
+    @overload
+    def __getitem__(self, index: int) -> EquityPoint: ...
 
-    def __getitem__(self, index: int) -> EquityPoint:
-        return self.points[index]
+    @overload
+    def __getitem__(self, index: slice) -> list[EquityPoint]: ...
+
+    def __getitem__(self, index: int | slice) -> EquityPoint | list[EquityPoint]:
+        if self._points is not None:
+            return self._points[index]
+        rows = range(self._size)[index]
+        if isinstance(rows, range):
+            return [self._point(i) for i in rows]
+        return self._point(rows)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, EquityCurve):
+            return NotImplemented
+        self._sync_columns()
+        other._sync_columns()
+        n = self._size
+        return (
+            n == other._size
+            and self._dates[:n].tolist() == other._dates[:n].tolist()
+            and np.array_equal(self._cash[:n], other._cash[:n])
+            and np.array_equal(self._stock_value[:n], other._stock_value[:n])
+            and np.array_equal(self._options_value[:n], other._options_value[:n])
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(points={list(self)!r})"
 
     @property
     def start_date(self) -> date | None:
         """First date in curve."""
-        return self.points[0].date if self.points else None
+        self._sync_columns()
+        return self._dates[0] if self._size else None
 
     @property
     def end_date(self) -> date | None:
         """Last date in curve."""
-        return self.points[-1].date if self.points else None
+        self._sync_columns()
+        return self._dates[self._size - 1] if self._size else None
 
     @property
     def start_value(self) -> float | None:
         """Initial portfolio value."""
-        return self.points[0].total if self.points else None
+        return self[0].total if len(self) else None
 
     @property
     def end_value(self) -> float | None:
         """Final portfolio value."""
-        return self.points[-1].total if self.points else None
+        return self[-1].total if len(self) else None
+
+    def as_arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        """Dates and total values as NumPy arrays.
+
+        Cheaper than to_dataframe() when only the total series is needed,
+        e.g. for plotting.
+
+        Returns:
+            Tuple of (dates as datetime64[D], total portfolio values)
+        """
+        self._sync_columns()
+        n = self._size
+        dates = self._dates[:n].astype("datetime64[D]")
+        total = self._cash[:n] + self._stock_value[:n]
+        total += self._options_value[:n]
+        return dates, total
 
     def to_dataframe(self) -> pd.DataFrame:
         """Convert to pandas DataFrame.
@@ -96,24 +264,27 @@ class EquityCurve:
         Returns:
             DataFrame with columns: date, cash, stock_value, options_value, total
         """
-        if not self.points:
+        self._sync_columns()
+        n = self._size
+        if not n:
             return pd.DataFrame(
                 columns=["date", "cash", "stock_value", "options_value", "total"]
             )
 
-        data = [
+        cash = self._cash[:n]
+        stock_value = self._stock_value[:n]
+        options_value = self._options_value[:n]
+
+        return pd.DataFrame(
             {
-                "date": p.date,
-                "cash": p.cash,
-                "stock_value": p.stock_value,
-                "options_value": p.options_value,
-                "total": p.total,
-            }
-            for p in self.points
-        ]
-        df = pd.DataFrame(data)
-        df = df.set_index("date")
-        return df
+                "cash": cash,
+                "stock_value": stock_value,
+                "options_value": options_value,
+                "total": cash + stock_value + options_value,
+            },
+            index=pd.Index(self._dates[:n], dtype=object, name="date"),
+            copy=True,
+        )
 
     @classmethod
     def from_dataframe(cls, df: pd.DataFrame) -> "EquityCurve":
@@ -126,16 +297,23 @@ class EquityCurve:
         Returns:
             EquityCurve instance
         """
-        curve = cls()
-        for idx, row in df.iterrows():
-            trade_date = idx.date() if hasattr(idx, "date") else idx
-            curve.add_point(
-                trade_date=trade_date,
-                cash=row.get("cash", 0.0),
-                stock_value=row.get("stock_value", 0.0),
-                options_value=row.get("options_value", 0.0),
-            )
-        return curve
+        index = df.index
+        if isinstance(index, pd.DatetimeIndex):
+            dates = index.date
+        else:
+            dates = index.to_numpy(dtype=object)
+
+        def column(name: str) -> np.ndarray:
+            if name in df.columns:
+                return df[name].to_numpy(dtype=np.float64)
+            return np.zeros(len(df))
+
+        return cls.from_arrays(
+            dates,
+            cash=column("cash"),
+            stock_value=column("stock_value"),
+            options_value=column("options_value"),
+        )
 
     def get_returns(self) -> pd.Series:
         """Calculate daily returns.
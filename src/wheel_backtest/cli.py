@@ -326,7 +326,7 @@ def benchmark(
         initial_capital=config.initial_capital,
     )
 
-    if not curve.points:
+    if len(curve) == 0:
         console.print("[red]Error: No price data available for the specified period.[/red]")
         return
 
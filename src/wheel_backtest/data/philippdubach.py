@@ -4,6 +4,7 @@ Free historical options data from https://github.com/philippdubach/options-data
 Coverage: 104 tickers, 2008-2025, full Greeks included.
 """
 
+import hashlib
 import io
 import logging
 import urllib.request
@@ -11,8 +12,9 @@ from datetime import date
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
 import pandas as pd
-import pyarrow.parquet as pq
+import pyarrow.dataset as ds
 
 from wheel_backtest.data.cache import DataCache
 from wheel_backtest.data.provider import OptionsDataProvider
@@ -71,6 +73,8 @@ class PhilippdubachProvider(OptionsDataProvider):
         """
         self._cache = cache
         self._data: dict[str, pd.DataFrame] = {}  # In-memory cache for session
+        # Per-ticker (sorted normalized trade dates, row order) for date lookups
+        self._date_index: dict[str, tuple[np.ndarray, np.ndarray]] = {}
 
     @property
     def name(self) -> str:
@@ -150,29 +154,57 @@ class PhilippdubachProvider(OptionsDataProvider):
 
         return df
 
+    def _get_date_index(
+        self, ticker: str, df: pd.DataFrame
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Get sorted normalized trade dates and the row order that sorts them.
+
+        Built once per ticker so repeated chain lookups are O(log N).
+
+        Args:
+            ticker: Stock symbol
+            df: Full options data for ticker
+
+        Returns:
+            Tuple of (sorted trade dates, positional row order)
+        """
+        ticker = ticker.upper()
+        if ticker not in self._date_index:
+            days = df["trade_date"].dt.normalize().to_numpy()
+            order = np.argsort(days, kind="stable")
+            self._date_index[ticker] = (days[order], order)
+        return self._date_index[ticker]
+
     def get_filtered_options(
         self,
         ticker: str,
         start_date: date,
         end_date: date,
+        columns: Optional[list[str]] = None,
     ) -> pd.DataFrame:
         """Get options data filtered to a date range using PyArrow predicate pushdown.
 
         This is much faster than loading all data and filtering in pandas,
-        especially for large datasets.
+        especially for large datasets. Row groups outside the date range are
+        skipped using parquet statistics and only the requested columns are
+        read.
 
         Args:
             ticker: Stock symbol
             start_date: Start date for filter
             end_date: End date for filter
+            columns: Columns to load (optional, defaults to all)
 
         Returns:
             DataFrame with options data in the date range
         """
         ticker = ticker.upper()
 
-        # Create cache suffix for this date range
+        # Create cache suffix for this date range (and column projection)
         cache_suffix = f"{start_date}_{end_date}"
+        if columns is not None:
+            columns_key = hashlib.md5(",".join(sorted(columns)).encode()).hexdigest()[:8]
+            cache_suffix = f"{cache_suffix}_{columns_key}"
 
         # Check cache first
         cached = self._cache.get(self.name, ticker, "options_filtered", suffix=cache_suffix)
@@ -187,13 +219,14 @@ class PhilippdubachProvider(OptionsDataProvider):
             # Use PyArrow to filter while reading
             logger.info(f"Filtering cached data with PyArrow: {ticker} {start_date} to {end_date}")
 
-            # Read parquet with PyArrow filters
-            table = pq.read_table(
-                cache_path,
-                filters=[
-                    ("trade_date", ">=", pd.Timestamp(start_date)),
-                    ("trade_date", "<=", pd.Timestamp(end_date)),
-                ],
+            # Scan with a dataset filter so row groups are pruned by statistics
+            dataset = ds.dataset(cache_path, format="parquet")
+            if columns is not None:
+                columns = [c for c in columns if c in dataset.schema.names]
+            table = dataset.to_table(
+                columns=columns,
+                filter=(ds.field("trade_date") >= pd.Timestamp(start_date))
+                & (ds.field("trade_date") <= pd.Timestamp(end_date)),
             )
             df = table.to_pandas()
 
@@ -221,7 +254,9 @@ class PhilippdubachProvider(OptionsDataProvider):
             start_ts = pd.Timestamp(start_date).normalize()
             end_ts = pd.Timestamp(end_date).normalize()
             mask = (full_df["trade_date"].dt.normalize() >= start_ts) & (full_df["trade_date"].dt.normalize() <= end_ts)
-            df = full_df[mask].copy()
+            df = full_df[mask]
+            if columns is not None:
+                df = df[[c for c in columns if c in df.columns]]
 
         # Cache the filtered result
         self._cache.put(self.name, ticker, "options_filtered", df, suffix=cache_suffix)
@@ -240,12 +275,14 @@ class PhilippdubachProvider(OptionsDataProvider):
             DataFrame with options chain for that date
         """
         df = self._ensure_data_loaded(ticker)
+        days, order = self._get_date_index(ticker, df)
 
-        # Filter to specific date using pandas Timestamp comparison (much faster than .dt.date)
-        trade_date_ts = pd.Timestamp(trade_date).normalize()
-        mask = df["trade_date"].dt.normalize() == trade_date_ts
+        # Binary search the sorted trade dates instead of scanning the column
+        trade_date_ts = pd.Timestamp(trade_date).normalize().to_datetime64()
+        start = days.searchsorted(trade_date_ts, side="left")
+        end = days.searchsorted(trade_date_ts, side="right")
 
-        chain = df[mask].copy()
+        chain = df.iloc[order[start:end]]
 
         if chain.empty:
             logger.warning(f"No options data for {ticker} on {trade_date}")
@@ -14,13 +14,17 @@ Usage:
 from wheel_backtest.engine.backtest import (
     BacktestResult,
     Transaction,
+    TransactionLog,
     WheelBacktest,
+    run_backtests_parallel,
 )
 from wheel_backtest.engine.options import (
     Fill,
     OptionOrder,
     OptionSelector,
     OrderAction,
+    PreparedChain,
+    SelectedOption,
 )
 from wheel_backtest.engine.portfolio import (
     OptionPosition,
@@ -44,9 +48,13 @@ __all__ = [
     "OrderAction",
     "Portfolio",
     "PositionSide",
+    "PreparedChain",
+    "SelectedOption",
     "Transaction",
+    "TransactionLog",
     "WheelBacktest",
     "WheelEvent",
     "WheelState",
     "WheelStrategy",
+    "run_backtests_parallel",
 ]
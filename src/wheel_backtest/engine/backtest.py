@@ -3,26 +3,64 @@
 Coordinates the wheel strategy execution across historical data.
 """
 
+import math
+import os
 import time
-from dataclasses import dataclass, field
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field, fields
 from datetime import date
-from typing import Optional
+from typing import Iterator, Optional, Union, cast
 
+import numpy as np
 import pandas as pd
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeRemainingColumn
 from rich.table import Table
 
-from wheel_backtest.analytics.equity import EquityCurve, EquityPoint
+from wheel_backtest.analytics.equity import EquityCurve
 from wheel_backtest.analytics.metrics import MetricsCalculator, PerformanceMetrics
 from wheel_backtest.config import BacktestConfig
 from wheel_backtest.data import DataCache, PhilippdubachProvider, YFinanceProvider
-from wheel_backtest.engine.options import OptionSelector
+from wheel_backtest.engine.options import (
+    EXPIRATION_DAY_COLUMN,
+    OptionSelector,
+    expiration_days,
+)
 from wheel_backtest.engine.portfolio import Portfolio
 from wheel_backtest.engine.wheel import WheelEvent, WheelStrategy
 
 console = Console()
 
+# Shared empty chain returned when no options data is available.
+# Never mutate it; callers only check .empty.
+_EMPTY_CHAIN = pd.DataFrame()
+
+# Trading days between refreshes of the progress bar description
+_PROGRESS_UPDATE_INTERVAL = 20
+
+# Option columns the strategy reads; everything else is left on disk
+_OPTION_COLUMNS = ("trade_date", "expiration", "option_type", "strike", "bid", "ask", "delta")
+
+
+def _downcast_options(df: pd.DataFrame) -> pd.DataFrame:
+    """Shrink option chain dtypes to reduce memory traffic in the day loop.
+
+    Only _OPTION_COLUMNS are read from disk. Prices used for fills
+    (bid/ask), strike and delta stay float64 so that accounting results
+    are unchanged; option_type becomes categorical.
+
+    Args:
+        df: Options data as returned by the provider
+
+    Returns:
+        The same DataFrame with downcast columns
+    """
+    if "option_type" in df.columns:
+        df["option_type"] = df["option_type"].astype("category")
+
+    return df
+
 
 @dataclass
 class BacktestResult:
@@ -88,6 +126,163 @@ class Transaction:
     notes: str = ""
 
 
+_TRANSACTION_FIELDS = tuple(f.name for f in fields(Transaction))
+
+# Numeric fields are stored in typed arrays (array module typecodes);
+# the rest stay in lists. A missing delta is stored as NaN.
+_TRANSACTION_TYPECODES = {
+    "quantity": "q",
+    "price": "d",
+    "value": "d",
+    "commission": "d",
+    "cash_after": "d",
+    "shares_after": "q",
+    "equity_after": "d",
+    "delta": "d",
+}
+
+
+# Text fields with compact dtypes: actions are short Arrow strings and
+# instruments repeat across the events of a position
+_TRANSACTION_TEXT_DTYPES = {
+    "action": "string[pyarrow]",
+    "instrument": "category",
+}
+
+
+class TransactionLog:
+    """Column-oriented store of transaction records.
+
+    Transactions are kept as one column per field rather than one object
+    per record: numeric fields in compact typed arrays, text and dates in
+    lists. Logging an event is a handful of appends and the DataFrame is
+    built column-wise in a single step.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty log."""
+        self._columns: dict[str, Union[list, array]] = {
+            name: array(_TRANSACTION_TYPECODES[name]) if name in _TRANSACTION_TYPECODES else []
+            for name in _TRANSACTION_FIELDS
+        }
+
+    def __len__(self) -> int:
+        return len(self._columns["date"])
+
+    def __iter__(self) -> Iterator[Transaction]:
+        for values in zip(*self._columns.values()):
+            transaction = Transaction(*values)
+            if transaction.delta is not None and math.isnan(transaction.delta):
+                transaction.delta = None
+            yield transaction
+
+    def append(self, transaction: Transaction) -> None:
+        """Append a Transaction record.
+
+        Args:
+            transaction: Transaction to store
+        """
+        self.add(**{name: getattr(transaction, name) for name in _TRANSACTION_FIELDS})
+
+    def add(
+        self,
+        date: date,
+        action: str,
+        instrument: str,
+        quantity: int,
+        price: float,
+        value: float,
+        commission: float,
+        cash_after: float,
+        shares_after: int,
+        equity_after: float,
+        delta: Optional[float] = None,
+        notes: str = "",
+    ) -> None:
+        """Record a transaction without building a Transaction object.
+
+        Args match the fields of Transaction.
+        """
+        columns = self._columns
+        columns["date"].append(date)
+        columns["action"].append(action)
+        columns["instrument"].append(instrument)
+        columns["quantity"].append(quantity)
+        columns["price"].append(price)
+        columns["value"].append(value)
+        columns["commission"].append(commission)
+        columns["cash_after"].append(cash_after)
+        columns["shares_after"].append(shares_after)
+        columns["equity_after"].append(equity_after)
+        columns["delta"].append(math.nan if delta is None else delta)
+        columns["notes"].append(notes)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Convert the log to a DataFrame.
+
+        Returns:
+            DataFrame with one column per Transaction field
+        """
+        data: dict[str, Union[list, np.ndarray]] = {}
+        for name, column in self._columns.items():
+            if isinstance(column, array):
+                # np.array copies through the buffer protocol; a frombuffer
+                # view would lock the array against further appends
+                data[name] = np.array(column)
+            else:
+                data[name] = column
+        frame: pd.DataFrame = pd.DataFrame(data).astype(_TRANSACTION_TEXT_DTYPES)
+        return frame
+
+
+def _premium_values(details: dict) -> tuple[float, int, float]:
+    """Price, quantity and value of an option sale."""
+    price = details["premium"]
+    quantity = details.get("contracts", 1)
+    return price, quantity, price * quantity * 100
+
+
+def _shares_acquired_values(details: dict) -> tuple[float, int, float]:
+    """Price, quantity and value of shares bought on put assignment."""
+    quantity = details["shares_acquired"]
+    price = details["strike"]
+    return price, quantity, quantity * price
+
+
+def _shares_sold_values(details: dict) -> tuple[float, int, float]:
+    """Price, quantity and value of shares sold on call assignment."""
+    quantity = details["shares_sold"]
+    price = details["strike"]
+    return price, quantity, quantity * price
+
+
+def _no_values(details: dict) -> tuple[float, int, float]:
+    """Events that move no cash or shares (e.g. expiring worthless)."""
+    return 0.0, 0, 0.0
+
+
+def _generic_event_values(details: dict) -> tuple[float, int, float]:
+    """Infer values from the detail keys of an unrecognized event type."""
+    if "premium" in details:
+        return _premium_values(details)
+    if "shares_acquired" in details:
+        return _shares_acquired_values(details)
+    if "shares_sold" in details:
+        return _shares_sold_values(details)
+    return _no_values(details)
+
+
+# Event type -> (instrument option label, value extractor)
+_EVENT_HANDLERS = {
+    "sell_put": ("PUT", _premium_values),
+    "sell_call": ("CALL", _premium_values),
+    "put_assigned": ("PUT", _shares_acquired_values),
+    "call_assigned": ("CALL", _shares_sold_values),
+    "put_expired": ("PUT", _no_values),
+    "call_expired": ("CALL", _no_values),
+}
+
+
 class WheelBacktest:
     """Main backtest orchestrator for the wheel strategy.
 
@@ -95,13 +290,15 @@ class WheelBacktest:
     a complete historical backtest.
     """
 
-    def __init__(self, config: BacktestConfig):
+    def __init__(self, config: BacktestConfig, quiet: bool = False):
         """Initialize backtest with configuration.
 
         Args:
             config: Backtest configuration
+            quiet: Suppress console output and the progress bar
         """
         self.config = config
+        self._console = Console(quiet=True) if quiet else console
 
         # Initialize data providers
         cache = DataCache(config.cache_dir)
@@ -127,11 +324,15 @@ class WheelBacktest:
         )
 
         # Results tracking
-        self.equity_curve = EquityCurve(points=[])
-        self.transactions: list[Transaction] = []
+        self.equity_curve = EquityCurve()
+        self.transactions = TransactionLog()
 
         # Pre-filtered options data (for performance)
         self._options_data_filtered: Optional[pd.DataFrame] = None
+        # Per-day chains keyed by normalized trade date, built once in pre-filter
+        self._chain_by_date: Optional[dict[pd.Timestamp, pd.DataFrame]] = None
+        # Chains fetched through the provider fallback, memoized per date
+        self._chain_cache: dict[date, pd.DataFrame] = {}
 
     def run(self) -> BacktestResult:
         """Execute the backtest.
@@ -143,14 +344,14 @@ class WheelBacktest:
         timings = {}
         start_time = time.time()
 
-        console.print(f"\n[bold]Running Wheel Strategy Backtest: {self.config.ticker}[/bold]")
+        self._console.print(f"\n[bold]Running Wheel Strategy Backtest: {self.config.ticker}[/bold]")
 
         # Get underlying price data to determine date range
-        console.print("[dim]Loading underlying price data...[/dim]")
+        self._console.print("[dim]Loading underlying price data...[/dim]")
         t0 = time.time()
         prices = self._get_price_data()
         timings['data_loading'] = time.time() - t0
-        console.print(f"[dim]Loaded {len(prices)} days in {timings['data_loading']:.2f}s[/dim]")
+        self._console.print(f"[dim]Loaded {len(prices)} days in {timings['data_loading']:.2f}s[/dim]")
 
         if prices.empty:
             raise ValueError(f"No price data available for {self.config.ticker}")
@@ -159,25 +360,29 @@ class WheelBacktest:
         start_date = prices.index[0].date()
         end_date = prices.index[-1].date()
 
-        console.print(f"Period: {start_date} to {end_date}")
-        console.print(f"Trading Days: {len(prices)}")
-        console.print(f"Initial Capital: ${self.config.initial_capital:,.2f}\n")
+        self._console.print(f"Period: {start_date} to {end_date}")
+        self._console.print(f"Trading Days: {len(prices)}")
+        self._console.print(f"Initial Capital: ${self.config.initial_capital:,.2f}\n")
 
         # Pre-filter options data to backtest date range for performance
-        console.print("[dim]Pre-filtering options data to date range...[/dim]")
+        self._console.print("[dim]Pre-filtering options data to date range...[/dim]")
         t0 = time.time()
         self._prefilter_options_data(start_date, end_date)
         t_prefilter = time.time() - t0
-        console.print(f"[dim]Pre-filtered options data in {t_prefilter:.2f}s[/dim]")
+        self._console.print(f"[dim]Pre-filtered options data in {t_prefilter:.2f}s[/dim]")
         timings['prefilter'] = t_prefilter
 
-        # Record initial equity point (all cash, no stock/options)
-        self.equity_curve.add_point(
-            trade_date=start_date,
-            cash=self.config.initial_capital,
-            stock_value=0.0,
-            options_value=0.0,
-        )
+        # Cash and shares only change on days the strategy emits events, so
+        # the loop snapshots them on those days only; the daily equity curve
+        # is forward-filled from the snapshots in one pass after the loop.
+        # Slot 0 holds the initial equity point (all cash, no stock/options).
+        num_days = len(prices)
+        trade_dates = prices.index.date.tolist()
+        close_arr = prices["close"].to_numpy(dtype=np.float64)
+        close_prices = close_arr.tolist()
+        snapshot_slots = [0]
+        snapshot_cash = [self.config.initial_capital]
+        snapshot_shares = [0]
 
         # Run backtest day by day
         t_execution = time.time()
@@ -189,21 +394,34 @@ class WheelBacktest:
             BarColumn(),
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
             TimeRemainingColumn(),
-            console=console,
+            console=self._console,
+            disable=self._console.quiet,
+            # Rendering happens on Rich's refresh thread at a capped rate,
+            # independent of how many days the loop processes
+            refresh_per_second=4,
+            transient=True,
         ) as progress:
             task = progress.add_task(
-                f"Processing {len(prices)} days", total=len(prices)
+                f"Processing {num_days} days", total=num_days
             )
 
-            for idx, (trade_date, price_row) in enumerate(prices.iterrows(), 1):
-                trade_date_obj = trade_date.date()
-                underlying_price = float(price_row["close"])
+            # Iterate plain lists rather than boxing each row as a Series
+            for idx, (trade_date_obj, underlying_price) in enumerate(
+                zip(trade_dates, close_prices), 1
+            ):
+                # Update progress description periodically; the bar itself
+                # advances every day
+                if idx % _PROGRESS_UPDATE_INTERVAL == 0 or idx == num_days:
+                    progress.update(
+                        task,
+                        description=f"Processing {trade_date_obj} (Day {idx}/{num_days})",
+                    )
 
-                # Update progress with current date
-                progress.update(
-                    task,
-                    description=f"Processing {trade_date_obj} (Day {idx}/{len(prices)})",
-                )
+                # Most days nothing can happen: an option is open and has
+                # not expired. Skip the chain fetch and strategy entirely.
+                if not self.strategy.has_pending_work(trade_date_obj):
+                    progress.advance(task)
+                    continue
 
                 # Get options chain for this date (track time)
                 t0 = time.time()
@@ -218,31 +436,41 @@ class WheelBacktest:
                         options_chain=options_chain,
                     )
 
-                    # Log transactions from events
-                    for event in events:
-                        self._log_event(event, underlying_price)
-
-                # Record equity for this day
-                stock_value = self.portfolio.shares * underlying_price
-                # TODO: mark options to market properly
-                options_value = 0.0  # Simplified for now
-                self.equity_curve.add_point(
-                    trade_date=trade_date_obj,
-                    cash=self.portfolio.cash,
-                    stock_value=stock_value,
-                    options_value=options_value,
-                )
+                    if events:
+                        # Events are logged after the whole day is processed,
+                        # so they all share the same end-of-day equity
+                        equity_now = self.portfolio.get_equity(underlying_price)
+                        for event in events:
+                            self._log_event(event, underlying_price, equity_now)
+
+                        snapshot_slots.append(idx)
+                        snapshot_cash.append(self.portfolio.cash)
+                        snapshot_shares.append(self.portfolio.shares)
 
                 progress.advance(task)
 
+        # Map every day to the latest snapshot at or before it
+        latest = np.searchsorted(snapshot_slots, np.arange(num_days + 1), side="right") - 1
+        cash_values = np.array(snapshot_cash, dtype=np.float64)[latest]
+        shares_held = np.array(snapshot_shares, dtype=np.int64)[latest]
+        stock_values = shares_held * np.concatenate(([0.0], close_arr))
+
+        # TODO: mark options to market properly (options value is zero for now)
+        self.equity_curve = EquityCurve.from_arrays(
+            dates=[start_date] + trade_dates,
+            cash=cash_values,
+            stock_value=stock_values,
+        )
+
         # Get final results
         timings['execution'] = time.time() - t_execution
         timings['options_fetch'] = t_options_fetch
-        final_equity = self.equity_curve.points[-1].total
+        final_equity = self.equity_curve.end_value
+        assert final_equity is not None  # the curve always holds the start date
 
-        console.print(f"\n[bold green]Backtest Complete![/bold green]")
-        console.print(f"Final Equity: ${final_equity:,.2f}")
-        console.print(
+        self._console.print(f"\n[bold green]Backtest Complete![/bold green]")
+        self._console.print(f"Final Equity: ${final_equity:,.2f}")
+        self._console.print(
             f"Total Return: ${final_equity - self.config.initial_capital:,.2f} "
             f"({(final_equity / self.config.initial_capital - 1) * 100:.2f}%)"
         )
@@ -268,7 +496,7 @@ class WheelBacktest:
         ])
 
         # Display timing summary
-        console.print("\n")
+        self._console.print("\n")
         table = Table(title="⏱️  Performance Timing Summary", show_header=True, header_style="bold")
         table.add_column("Phase", style="cyan")
         table.add_column("Time", justify="right", style="green")
@@ -290,7 +518,7 @@ class WheelBacktest:
         table.add_section()
         table.add_row("[bold]Total Time[/bold]", f"[bold]{timings['total']:.2f}s[/bold]", "[bold]100%[/bold]")
 
-        console.print(table)
+        self._console.print(table)
 
         return BacktestResult(
             ticker=self.config.ticker,
@@ -327,11 +555,14 @@ class WheelBacktest:
             end_date=end,
         )
 
-        # Filter to configured range if provided
-        if self.config.start_date:
-            prices = prices[prices.index >= pd.Timestamp(self.config.start_date)]
-        if self.config.end_date:
-            prices = prices[prices.index <= pd.Timestamp(self.config.end_date)]
+        # Filter to configured range if provided; label slicing on the sorted
+        # index binary-searches the bounds instead of building masks
+        if self.config.start_date or self.config.end_date:
+            if not prices.index.is_monotonic_increasing:
+                prices = prices.sort_index()
+            start_ts = pd.Timestamp(self.config.start_date) if self.config.start_date else None
+            end_ts = pd.Timestamp(self.config.end_date) if self.config.end_date else None
+            prices = prices.loc[start_ts:end_ts]
 
         return prices
 
@@ -350,11 +581,28 @@ class WheelBacktest:
             ticker=self.config.ticker,
             start_date=start_date,
             end_date=end_date,
+            columns=list(_OPTION_COLUMNS),
+        )
+
+        # Shrink dtypes before slicing so every per-day chain is smaller
+        df = _downcast_options(self._options_data_filtered)
+        self._options_data_filtered = df
+
+        # Normalize trade dates once and index the chains by day so the
+        # per-day lookup is O(1) instead of a full-column mask scan
+        df["trade_date"] = df["trade_date"].dt.normalize()
+        # Expiration days once for the whole range, reused by every chain
+        df[EXPIRATION_DAY_COLUMN] = expiration_days(df["expiration"])
+        # Grouping the datetime trade_date column yields Timestamp keys
+        days = cast(
+            Iterator[tuple[pd.Timestamp, pd.DataFrame]],
+            iter(df.groupby("trade_date", sort=False)),
         )
+        self._chain_by_date = dict(days)
 
         # Log result
         filtered_size = len(self._options_data_filtered)
-        console.print(
+        self._console.print(
             f"[dim]Loaded {filtered_size:,} rows for date range "
             f"{start_date} to {end_date}[/dim]"
         )
@@ -369,62 +617,67 @@ class WheelBacktest:
             DataFrame with options chain data
         """
         # Use pre-filtered data if available (much faster)
-        if self._options_data_filtered is not None:
-            trade_date_ts = pd.Timestamp(trade_date).normalize()
-            mask = self._options_data_filtered["trade_date"].dt.normalize() == trade_date_ts
-            return self._options_data_filtered[mask].copy()
+        if self._chain_by_date is not None:
+            return self._chain_by_date.get(pd.Timestamp(trade_date), _EMPTY_CHAIN)
 
         # Fallback to provider if pre-filtering not done
+        cached = self._chain_cache.get(trade_date)
+        if cached is not None:
+            return cached
+
         try:
-            return self.options_provider.get_options_chain(
+            chain = self.options_provider.get_options_chain(
                 ticker=self.config.ticker,
                 trade_date=trade_date,
             )
-        except Exception:
-            # If no options data available for this date, return empty DataFrame
-            return pd.DataFrame()
-
-    def _log_event(self, event: WheelEvent, underlying_price: float) -> None:
+        except (ValueError, OSError):
+            # Ticker not covered or data could not be read/downloaded
+            chain = _EMPTY_CHAIN
+
+        self._chain_cache[trade_date] = chain
+        return chain
+
+    def _log_event(
+        self,
+        event: WheelEvent,
+        underlying_price: float,
+        equity_after: Optional[float] = None,
+    ) -> None:
         """Log a wheel event as a transaction.
 
         Args:
             event: Wheel strategy event
             underlying_price: Current underlying price
+            equity_after: Portfolio equity after the event (computed if omitted)
         """
         details = event.details
         action = event.event_type
 
+        # Known event types dispatch straight to their value extractor
+        option_type: Optional[str]
+        handler = _EVENT_HANDLERS.get(action)
+        if handler is not None:
+            option_type, values = handler
+        else:
+            option_type = ("PUT" if "put" in action else "CALL") if "strike" in details else None
+            values = _generic_event_values
+        price, quantity, value = values(details)
+
         # Determine instrument description
-        if "strike" in details:
-            option_type = "PUT" if "put" in action else "CALL"
+        if option_type is not None:
             expiry = details.get("expiration", "")
             instrument = f"{option_type} ${details['strike']:.0f} {expiry}"
         else:
             instrument = self.config.ticker
 
-        # Calculate values
-        if "premium" in details:
-            price = details["premium"]
-            quantity = details.get("contracts", 1)
-            value = price * quantity * 100
-        elif "shares_acquired" in details:
-            quantity = details["shares_acquired"]
-            price = details["strike"]
-            value = quantity * price
-        elif "shares_sold" in details:
-            quantity = details["shares_sold"]
-            price = details["strike"]
-            value = quantity * price
-        else:
-            price = 0.0
-            quantity = 0
-            value = 0.0
+        if equity_after is None:
+            equity_after = self.portfolio.get_equity(underlying_price)
 
         commission = details.get("commission", 0.0)
         delta = details.get("delta")  # Will be None for non-option transactions
 
-        # Create transaction record
-        transaction = Transaction(
+        # Record transaction
+        self.transactions.add(
             date=event.date,
             action=action,
             instrument=instrument,
@@ -434,13 +687,11 @@ class WheelBacktest:
             commission=commission,
             cash_after=self.portfolio.cash,
             shares_after=self.portfolio.shares,
-            equity_after=self.portfolio.get_equity(underlying_price),
+            equity_after=equity_after,
             delta=delta,
             notes=f"State: {event.state_after.value}",
         )
 
-        self.transactions.append(transaction)
-
     def get_transactions_df(self) -> pd.DataFrame:
         """Get transactions as a DataFrame.
 
@@ -450,4 +701,47 @@ class WheelBacktest:
         if not self.transactions:
             return pd.DataFrame()
 
-        return pd.DataFrame([vars(t) for t in self.transactions])
+        return self.transactions.to_dataframe()
+
+
+def _run_single_backtest(config: BacktestConfig) -> BacktestResult:
+    """Run one backtest; module-level so worker processes can unpickle it."""
+    return WheelBacktest(config, quiet=True).run()
+
+
+def run_backtests_parallel(
+    configs: list[BacktestConfig],
+    max_workers: Optional[int] = None,
+) -> list[BacktestResult]:
+    """Run independent backtests in parallel worker processes.
+
+    Each backtest is CPU-bound and shares no state with the others, so
+    parameter sweeps and multi-ticker runs scale with the number of cores.
+    Configs that share a cache directory should have their data cached
+    beforehand to avoid concurrent downloads of the same file. Workers run
+    quietly; only a line per finished backtest is printed.
+
+    Args:
+        configs: Backtest configurations to run
+        max_workers: Number of worker processes (defaults to CPU count)
+
+    Returns:
+        Results in the same order as configs
+    """
+    if not configs:
+        return []
+
+    if max_workers is None:
+        max_workers = min(len(configs), os.cpu_count() or 1)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_run_single_backtest, config) for config in configs]
+        index_of = {future: i for i, future in enumerate(futures)}
+        for completed, future in enumerate(as_completed(futures), 1):
+            future.result()
+            console.print(
+                f"[dim]Finished backtest {completed}/{len(configs)}: "
+                f"{configs[index_of[future]].ticker}[/dim]"
+            )
+
+    return [future.result() for future in futures]
@@ -3,11 +3,12 @@
 Provides logic for selecting strikes and managing option orders.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, timedelta
 from enum import Enum
-from typing import Optional
+from typing import NamedTuple, Optional, Protocol, Sequence, Union
 
+import numpy as np
 import pandas as pd
 
 from wheel_backtest.engine.portfolio import OptionType
@@ -22,7 +23,11 @@ class OrderAction(Enum):
     SELL_TO_CLOSE = "sell_to_close"  # Close long position
 
 
-@dataclass
+# Actions that receive premium
+_SELL_ACTIONS = frozenset({OrderAction.SELL_TO_OPEN, OrderAction.SELL_TO_CLOSE})
+
+
+@dataclass(slots=True)
 class OptionOrder:
     """An option order to be filled.
 
@@ -43,10 +48,12 @@ class OptionOrder:
     limit_price: Optional[float] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Fill:
     """A filled order.
 
+    Premium totals are computed once at construction.
+
     Attributes:
         order: The original order
         fill_price: Price per share at which order was filled
@@ -54,6 +61,8 @@ class Fill:
         underlying_price: Underlying price at fill
         delta: Option delta at fill (optional)
         commission: Commission paid
+        total_premium: Total premium for the fill (per share * contracts * 100)
+        net_premium: Net premium after commission (negative for buys)
     """
 
     order: OptionOrder
@@ -62,19 +71,373 @@ class Fill:
     underlying_price: float
     delta: Optional[float] = None
     commission: float = 0.0
+    total_premium: float = field(init=False)
+    net_premium: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Compute premium totals."""
+        total_premium = self.fill_price * self.order.quantity * 100
+        if self.order.action in _SELL_ACTIONS:
+            net_premium = total_premium - self.commission
+        else:
+            net_premium = -(total_premium + self.commission)
+        object.__setattr__(self, "total_premium", total_premium)
+        object.__setattr__(self, "net_premium", net_premium)
 
-    @property
-    def total_premium(self) -> float:
-        """Total premium for the fill (per share * contracts * 100)."""
-        return self.fill_price * self.order.quantity * 100
+
+class SelectedOption(NamedTuple):
+    """An option picked from a chain by OptionSelector.
+
+    Attributes:
+        expiration: Expiration date
+        strike: Strike price
+        option_type: PUT or CALL
+        bid: Bid price per share
+        ask: Ask price per share
+        mid_price: Mid price per share
+        delta: Option delta (None if the chain has no delta column)
+        dte: Days to expiration from the trade date
+    """
+
+    expiration: date
+    strike: float
+    option_type: OptionType
+    bid: float
+    ask: float
+    mid_price: float
+    delta: Optional[float]
+    dte: int
+
+
+# Optional chain column with expirations as int32 days since the epoch
+EXPIRATION_DAY_COLUMN = "_exp_day"
+
+
+_NO_EXPIRATIONS = np.array([], dtype="datetime64[D]")
+_NO_EXPIRATIONS.setflags(write=False)
+
+
+def expiration_days(expiration: pd.Series) -> np.ndarray:
+    """Convert an expiration column to int32 days since the epoch.
+
+    Args:
+        expiration: Datetime expiration column
+
+    Returns:
+        Array of day numbers (time of day is dropped)
+    """
+    return expiration.to_numpy().astype("datetime64[D]").astype(np.int32)
+
+
+def _as_sorted_strikes(strikes: Union[np.ndarray, Sequence[float]]) -> np.ndarray:
+    """Convert strikes to a float array, sorting anything that is not an array."""
+    if isinstance(strikes, np.ndarray):
+        return strikes.astype(np.float64, copy=False)
+    return np.sort(np.asarray(strikes, dtype=np.float64))
+
+
+def _nearest_strike(strikes: np.ndarray, target: float) -> float:
+    """Find the strike closest to target in a sorted, non-empty array.
+
+    Ties go to the lower strike.
+    """
+    idx = int(np.searchsorted(strikes, target))
+    if idx == len(strikes):
+        return float(strikes[-1])
+    if idx > 0 and abs(strikes[idx - 1] - target) <= abs(strikes[idx] - target):
+        return float(strikes[idx - 1])
+    return float(strikes[idx])
+
+
+def _pick_delta_index(
+    strikes: np.ndarray,
+    deltas: np.ndarray,
+    target_delta: float,
+    underlying_price: float,
+    cost_basis: Optional[float],
+    is_put: bool,
+) -> int:
+    """Find the row whose delta is closest to the target on the OTM side.
+
+    Puts target a negative delta among strikes at or below the underlying;
+    calls target a positive delta among strikes at or above it (and at or
+    above cost basis if given). Rows with a NaN delta are skipped and the
+    first row wins ties.
+
+    Args:
+        strikes: Strike per row
+        deltas: Delta per row (NaN if unknown)
+        target_delta: Target absolute delta value
+        underlying_price: Current underlying price
+        cost_basis: Minimum call strike (optional)
+        is_put: True for puts, False for calls
+
+    Returns:
+        Row position of the best option, or -1 if none qualifies
+    """
+    if is_put:
+        target_signed_delta = -abs(target_delta)
+        mask = strikes <= underlying_price
+    else:
+        target_signed_delta = abs(target_delta)
+        mask = strikes >= underlying_price
+        if cost_basis is not None:
+            mask &= strikes >= cost_basis
+
+    mask &= ~np.isnan(deltas)
+    candidates = np.flatnonzero(mask)
+    if len(candidates) == 0:
+        return -1
+
+    best = np.abs(deltas[candidates] - target_signed_delta).argmin()
+    return int(candidates[best])
+
+
+class _ChainLeg(NamedTuple):
+    """Arrays for one option type and expiration of a prepared chain.
+
+    Rows are in original frame order; first_row maps each strike to the
+    first row quoting it. The delta_* arrays hold the rows with a known
+    delta ordered by strike, so the OTM gate of a delta pick is a bisect.
+    """
+
+    strikes: np.ndarray
+    bids: np.ndarray
+    asks: np.ndarray
+    deltas: Optional[np.ndarray]
+    unique_strikes: np.ndarray
+    first_row: dict[float, int]
+    delta_rows: np.ndarray
+    delta_strikes: np.ndarray
+    delta_values: np.ndarray
+
+    def nearest_delta_row(
+        self,
+        target_delta: float,
+        underlying_price: float,
+        cost_basis: Optional[float],
+        is_put: bool,
+    ) -> int:
+        """Find the row whose delta is closest to the target on the OTM side.
+
+        Same rules as _pick_delta_index: the first row in frame order wins
+        ties.
+
+        Args:
+            target_delta: Target absolute delta value
+            underlying_price: Current underlying price
+            cost_basis: Minimum call strike (optional)
+            is_put: True for puts, False for calls
+
+        Returns:
+            Row position within the leg, or -1 if none qualifies
+        """
+        if is_put:
+            target_signed_delta = -abs(target_delta)
+            window = slice(0, int(np.searchsorted(self.delta_strikes, underlying_price, side="right")))
+        else:
+            target_signed_delta = abs(target_delta)
+            floor = underlying_price if cost_basis is None else max(underlying_price, cost_basis)
+            window = slice(int(np.searchsorted(self.delta_strikes, floor, side="left")), None)
+
+        rows = self.delta_rows[window]
+        if len(rows) == 0:
+            return -1
+
+        diffs = np.abs(self.delta_values[window] - target_signed_delta)
+        return int(rows[diffs == diffs.min()].min())
+
+
+class PreparedChain:
+    """Options chain grouped by option type and expiration date.
+
+    Built once per chain by OptionSelector.prepare_chain so that selection
+    looks groups up instead of re-masking the frame and converting every
+    expiration to a Python date on each call.
+
+    Attributes:
+        frame: The underlying options chain DataFrame
+    """
+
+    def __init__(self, frame: pd.DataFrame):
+        """Index the chain rows by option type.
+
+        Args:
+            frame: Options chain DataFrame with option_type and expiration
+                columns (expiration days are read from EXPIRATION_DAY_COLUMN
+                when present)
+        """
+        self.frame = frame
+        self._groups: dict[tuple[str, date], np.ndarray] = {}
+        self._expirations: dict[str, np.ndarray] = {}
+        self._rows: dict[tuple[str, date], pd.DataFrame] = {}
+        self._legs: dict[tuple[str, date], _ChainLeg] = {}
+        # (strike, bid, ask, delta) columns; delta is None without a delta column
+        self._columns: Optional[
+            tuple[np.ndarray, np.ndarray, np.ndarray, Optional[np.ndarray]]
+        ] = None
+        self._type_codes: dict[str, int] = {}
+
+        if frame.empty:
+            return
+
+        # Integer codes per option type: categorical chains already carry
+        # them, others are factorized once
+        option_types = frame["option_type"]
+        if isinstance(option_types.dtype, pd.CategoricalDtype):
+            self._codes = option_types.cat.codes.to_numpy()
+            type_values = option_types.cat.categories
+        else:
+            self._codes, type_values = pd.factorize(option_types)
+        self._type_codes = {type_str: code for code, type_str in enumerate(type_values)}
+
+        if EXPIRATION_DAY_COLUMN in frame.columns:
+            self._exp_days = frame[EXPIRATION_DAY_COLUMN].to_numpy()
+        else:
+            self._exp_days = expiration_days(frame["expiration"])
+
+    def _group_type(self, type_str: str) -> np.ndarray:
+        """Group the rows of one option type by expiration on first use.
+
+        Only the option types actually queried are scanned, so a day that
+        sells one leg never groups the other.
+
+        Args:
+            type_str: Option type value ("put" or "call")
+
+        Returns:
+            Sorted expirations of the type
+        """
+        code = self._type_codes.get(type_str)
+        type_pos = np.flatnonzero(self._codes == code) if code is not None else ()
+        if len(type_pos) == 0:
+            self._expirations[type_str] = _NO_EXPIRATIONS
+            return _NO_EXPIRATIONS
+
+        exps, inverse = np.unique(self._exp_days[type_pos], return_inverse=True)
+        # Stable sort keeps rows of each expiration in frame order
+        grouped = type_pos[np.argsort(inverse, kind="stable")]
+        bounds = np.cumsum(np.bincount(inverse))[:-1]
+        exp_array = exps.astype("datetime64[D]")
+        exp_array.setflags(write=False)
+        self._expirations[type_str] = exp_array
+        for exp, positions in zip(exp_array.tolist(), np.split(grouped, bounds)):
+            self._groups[(type_str, exp)] = positions
+        return exp_array
 
     @property
-    def net_premium(self) -> float:
-        """Net premium after commission."""
-        if self.order.action in (OrderAction.SELL_TO_OPEN, OrderAction.SELL_TO_CLOSE):
-            return self.total_premium - self.commission
+    def empty(self) -> bool:
+        """True if the chain has no rows."""
+        return self.frame.empty
+
+    def expirations(self, type_str: str) -> np.ndarray:
+        """Get the sorted expiration dates available for an option type.
+
+        Args:
+            type_str: Option type value ("put" or "call")
+
+        Returns:
+            Sorted, read-only datetime64[D] array, computed once per type
+        """
+        expirations = self._expirations.get(type_str)
+        if expirations is None:
+            expirations = self._group_type(type_str)
+        return expirations
+
+    def rows(self, type_str: str, expiration: date) -> pd.DataFrame:
+        """Get the chain rows for one option type and expiration.
+
+        Args:
+            type_str: Option type value ("put" or "call")
+            expiration: Expiration date
+
+        Returns:
+            Rows in original frame order (empty if none), cached per key
+        """
+        key = (type_str, expiration)
+        rows = self._rows.get(key)
+        if rows is None:
+            self.expirations(type_str)
+            positions = self._groups.get(key)
+            if positions is None:
+                return self.frame.iloc[0:0]
+            rows = self._rows[key] = self.frame.iloc[positions]
+        return rows
+
+    def leg(self, type_str: str, expiration: date) -> Optional[_ChainLeg]:
+        """Get strike, quote and delta arrays for one option type and expiration.
+
+        Args:
+            type_str: Option type value ("put" or "call")
+            expiration: Expiration date
+
+        Returns:
+            Arrays for the rows (cached per key), or None if there are none
+        """
+        key = (type_str, expiration)
+        leg = self._legs.get(key)
+        if leg is not None:
+            return leg
+
+        self.expirations(type_str)
+        positions = self._groups.get(key)
+        if positions is None:
+            return None
+
+        if self._columns is None:
+            frame = self.frame
+            self._columns = (
+                frame["strike"].to_numpy(dtype=np.float64),
+                frame["bid"].to_numpy(dtype=np.float64, na_value=np.nan),
+                frame["ask"].to_numpy(dtype=np.float64, na_value=np.nan),
+                (
+                    frame["delta"].to_numpy(dtype=np.float64, na_value=np.nan)
+                    if "delta" in frame.columns
+                    else None
+                ),
+            )
+
+        strike_column, bid_column, ask_column, delta_column = self._columns
+        strikes = strike_column[positions]
+        deltas = None
+        first_row: dict[float, int] = {}
+        for i, strike in enumerate(strikes.tolist()):
+            first_row.setdefault(strike, i)
+
+        if delta_column is not None:
+            deltas = delta_column[positions]
+            known = np.flatnonzero(~np.isnan(deltas))
+            delta_rows = known[np.argsort(strikes[known], kind="stable")]
+            delta_values = deltas[delta_rows]
         else:
-            return -(self.total_premium + self.commission)
+            delta_rows = np.empty(0, dtype=np.intp)
+            delta_values = np.empty(0, dtype=np.float64)
+
+        leg = self._legs[key] = _ChainLeg(
+            strikes=strikes,
+            bids=bid_column[positions],
+            asks=ask_column[positions],
+            deltas=deltas,
+            unique_strikes=np.unique(strikes),
+            first_row=first_row,
+            delta_rows=delta_rows,
+            delta_strikes=strikes[delta_rows],
+            delta_values=delta_values,
+        )
+        return leg
+
+
+class SelectOptionFn(Protocol):
+    """Signature of OptionSelector.select_option_from_chain and compiled selectors."""
+
+    def __call__(
+        self,
+        chain: Union[pd.DataFrame, PreparedChain],
+        option_type: OptionType,
+        underlying_price: float,
+        trade_date: date,
+        cost_basis: Optional[float] = None,
+    ) -> Optional[SelectedOption]: ...
 
 
 class OptionSelector:
@@ -125,43 +488,84 @@ class OptionSelector:
         else:
             self.otm_pct = otm_pct if otm_pct is not None else 0.05
 
+    @staticmethod
+    def from_lists(
+        expirations: Sequence[date] = (),
+        strikes: Sequence[float] = (),
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Convert list inputs to the arrays the selection methods take.
+
+        Args:
+            expirations: Expiration dates (order is kept)
+            strikes: Strike prices (sorted ascending)
+
+        Returns:
+            Tuple of (datetime64[D] expirations, sorted float strikes)
+        """
+        return (
+            np.array(expirations, dtype="datetime64[D]"),
+            _as_sorted_strikes(list(strikes)),
+        )
+
+    @staticmethod
+    def prepare_chain(chain: Union[pd.DataFrame, PreparedChain]) -> PreparedChain:
+        """Group an options chain for repeated selection.
+
+        Args:
+            chain: Options chain DataFrame, or an already prepared chain
+
+        Returns:
+            PreparedChain wrapping the chain
+        """
+        if isinstance(chain, PreparedChain):
+            return chain
+        return PreparedChain(chain)
+
     def select_expiration(
         self,
-        available_expirations: list[date],
+        available_expirations: np.ndarray,
         trade_date: date,
     ) -> Optional[date]:
         """Select best expiration date.
 
-        Finds expiration closest to target DTE that meets minimum.
+        Finds expiration closest to target DTE that meets minimum. Ties
+        go to the expiration listed first.
 
         Args:
-            available_expirations: List of available expiration dates
+            available_expirations: datetime64[D] array of expiration dates
+                (a list of dates is still accepted, see from_lists)
             trade_date: Current trade date
 
         Returns:
             Selected expiration date, or None if none available
         """
-        if not available_expirations:
-            return None
-
-        # Filter to expirations meeting minimum DTE
-        valid_exps = []
+        if isinstance(available_expirations, np.ndarray):
+            exps = available_expirations.astype("datetime64[D]", copy=False)
+            dtes = (exps - np.datetime64(trade_date, "D")).astype(np.int64)
+            valid = dtes >= self.dte_min
+            if not valid.any():
+                return None
+            idx = np.abs(dtes[valid] - self.dte_target).argmin()
+            selected: date = exps[valid][idx].item()
+            return selected
+
+        # Legacy list input: single pass keeping the closest valid expiration
+        best_exp = None
+        best_diff = None
         for exp in available_expirations:
             dte = (exp - trade_date).days
-            if dte >= self.dte_min:
-                valid_exps.append((exp, dte))
-
-        if not valid_exps:
-            return None
+            if dte < self.dte_min:
+                continue
+            diff = abs(dte - self.dte_target)
+            if best_diff is None or diff < best_diff:
+                best_exp, best_diff = exp, diff
 
-        # Find closest to target DTE
-        valid_exps.sort(key=lambda x: abs(x[1] - self.dte_target))
-        return valid_exps[0][0]
+        return best_exp
 
     def select_put_strike(
         self,
         underlying_price: float,
-        available_strikes: list[float],
+        available_strikes: np.ndarray,
     ) -> Optional[float]:
         """Select strike for a short put.
 
@@ -169,31 +573,28 @@ class OptionSelector:
 
         Args:
             underlying_price: Current underlying price
-            available_strikes: List of available strikes
+            available_strikes: Float array of strikes, sorted ascending
+                (a list is still accepted and sorted, see from_lists)
 
         Returns:
             Selected strike, or None if none available
         """
-        if not available_strikes:
-            return None
+        strikes = _as_sorted_strikes(available_strikes)
 
         # Target strike is otm_pct below current price
         target_strike = underlying_price * (1 - self.otm_pct)
 
-        # Find closest strike at or below target
-        valid_strikes = [s for s in available_strikes if s <= underlying_price]
-
-        if not valid_strikes:
+        # Only strikes at or below the current price are valid
+        cutoff = np.searchsorted(strikes, underlying_price, side="right")
+        if cutoff == 0:
             return None
 
-        # Find closest to target
-        valid_strikes.sort(key=lambda x: abs(x - target_strike))
-        return valid_strikes[0]
+        return _nearest_strike(strikes[:cutoff], target_strike)
 
     def select_call_strike(
         self,
         underlying_price: float,
-        available_strikes: list[float],
+        available_strikes: np.ndarray,
         cost_basis: Optional[float] = None,
     ) -> Optional[float]:
         """Select strike for a short call.
@@ -203,35 +604,30 @@ class OptionSelector:
 
         Args:
             underlying_price: Current underlying price
-            available_strikes: List of available strikes
+            available_strikes: Float array of strikes, sorted ascending
+                (a list is still accepted and sorted, see from_lists)
             cost_basis: Cost basis per share (optional, ensures profit if called)
 
         Returns:
             Selected strike, or None if none available
         """
-        if not available_strikes:
-            return None
+        strikes = _as_sorted_strikes(available_strikes)
 
         # Target strike is otm_pct above current price
         target_strike = underlying_price * (1 + self.otm_pct)
+        floor = underlying_price
 
         # For covered calls, ensure strike is at least at cost basis
         if cost_basis is not None:
             target_strike = max(target_strike, cost_basis)
+            floor = max(floor, cost_basis)
 
-        # Find closest strike at or above target
-        valid_strikes = [s for s in available_strikes if s >= underlying_price]
-
-        # For covered calls, further filter to strikes at or above cost basis
-        if cost_basis is not None:
-            valid_strikes = [s for s in valid_strikes if s >= cost_basis]
-
-        if not valid_strikes:
+        # Only strikes at or above the floor are valid
+        start = np.searchsorted(strikes, floor, side="left")
+        if start == len(strikes):
             return None
 
-        # Find closest to target
-        valid_strikes.sort(key=lambda x: abs(x - target_strike))
-        return valid_strikes[0]
+        return _nearest_strike(strikes[start:], target_strike)
 
     def select_strike_by_delta(
         self,
@@ -256,133 +652,205 @@ class OptionSelector:
         if options_df.empty or "delta" not in options_df.columns:
             return None
 
-        # Filter to options with valid delta
-        valid_options = options_df[options_df["delta"].notna()].copy()
-        if valid_options.empty:
-            return None
-
-        # For puts: target negative delta (e.g., -0.20)
-        # For calls: target positive delta (e.g., +0.20)
-        if option_type == OptionType.PUT:
-            target_signed_delta = -abs(target_delta)
-            # Filter to OTM puts (strike < underlying)
-            valid_options = valid_options[valid_options["strike"] <= underlying_price]
-        else:  # CALL
-            target_signed_delta = abs(target_delta)
-            # Filter to OTM calls (strike > underlying)
-            valid_options = valid_options[valid_options["strike"] >= underlying_price]
+        deltas = options_df["delta"].to_numpy(dtype=np.float64, na_value=np.nan)
+        strikes = options_df["strike"].to_numpy(dtype=np.float64)
 
-            # For covered calls, ensure strikes are at or above cost basis
-            if cost_basis is not None:
-                valid_options = valid_options[valid_options["strike"] >= cost_basis]
-
-        if valid_options.empty:
+        idx = _pick_delta_index(
+            strikes,
+            deltas,
+            target_delta,
+            underlying_price,
+            cost_basis,
+            is_put=option_type == OptionType.PUT,
+        )
+        if idx < 0:
             return None
-
-        # Find option with delta closest to target
-        valid_options["delta_diff"] = abs(valid_options["delta"] - target_signed_delta)
-        best_option = valid_options.loc[valid_options["delta_diff"].idxmin()]
-
-        return float(best_option["strike"])
+        return float(strikes[idx])
 
     def select_option_from_chain(
         self,
-        chain: pd.DataFrame,
+        chain: Union[pd.DataFrame, PreparedChain],
         option_type: OptionType,
         underlying_price: float,
         trade_date: date,
         cost_basis: Optional[float] = None,
-    ) -> Optional[dict]:
+    ) -> Optional[SelectedOption]:
         """Select best option from options chain.
 
         Args:
             chain: Options chain DataFrame with columns:
                    expiration, strike, option_type, bid, ask, delta
+                   (or a chain from prepare_chain)
             option_type: PUT or CALL
             underlying_price: Current underlying price
             trade_date: Current trade date
             cost_basis: Cost basis for covered calls (optional)
 
         Returns:
-            Dict with selected option details, or None if none found
+            SelectedOption with the option details, or None if none found
         """
-        if chain.empty:
-            return None
+        return self.compile()(chain, option_type, underlying_price, trade_date, cost_basis)
 
-        # Filter to correct option type
-        type_str = option_type.value
-        type_chain = chain[chain["option_type"] == type_str].copy()
+    @property
+    def settings(self) -> tuple:
+        """Values compile() binds: (dte_target, dte_min, put_delta, call_delta, otm_pct)."""
+        return (self.dte_target, self.dte_min, self.put_delta, self.call_delta, self.otm_pct)
 
-        if type_chain.empty:
-            return None
+    def compile(self) -> SelectOptionFn:
+        """Specialize option selection for the current settings.
 
-        # Get unique expirations
-        expirations = sorted(type_chain["expiration"].dt.date.unique())
-        selected_exp = self.select_expiration(expirations, trade_date)
+        The returned function takes the same arguments as
+        select_option_from_chain, with the DTE, delta and OTM settings bound
+        as closure constants and the per-type targets resolved up front.
+        Later changes to the selector's attributes are not seen by it, so
+        compile again after changing them.
 
-        if selected_exp is None:
-            return None
+        Returns:
+            Function selecting an option from a chain
+        """
+        dte_target = self.dte_target
+        dte_min = self.dte_min
+        put_delta = self.put_delta
+        call_delta = self.call_delta
+        put_strike_ratio = 1 - self.otm_pct
+        call_strike_ratio = 1 + self.otm_pct
+        prepare_chain = self.prepare_chain
+
+        def select(
+            chain: Union[pd.DataFrame, PreparedChain],
+            option_type: OptionType,
+            underlying_price: float,
+            trade_date: date,
+            cost_basis: Optional[float] = None,
+        ) -> Optional[SelectedOption]:
+            chain = prepare_chain(chain)
+            if chain.empty:
+                return None
+
+            is_put = option_type == OptionType.PUT
+            type_str = option_type.value
+
+            # Expiration closest to target DTE that meets minimum
+            expirations = chain.expirations(type_str)
+            dtes = (expirations - np.datetime64(trade_date, "D")).astype(np.int64)
+            valid = np.flatnonzero(dtes >= dte_min)
+            if len(valid) == 0:
+                return None
+            exp_idx = valid[np.abs(dtes[valid] - dte_target).argmin()]
+            selected_exp = expirations[exp_idx].item()
+            leg = chain.leg(type_str, selected_exp)
+            assert leg is not None  # selected_exp comes from chain.expirations()
+
+            # Select strike - try delta first, fall back to OTM percentage
+            selected_strike = None
+            target_delta = put_delta if is_put else call_delta
+            if target_delta is not None and leg.deltas is not None:
+                idx = leg.nearest_delta_row(target_delta, underlying_price, cost_basis, is_put)
+                if idx >= 0:
+                    selected_strike = float(leg.strikes[idx])
+
+            if selected_strike is None:
+                strikes = leg.unique_strikes
+                if is_put:
+                    cutoff = np.searchsorted(strikes, underlying_price, side="right")
+                    if cutoff == 0:
+                        return None
+                    selected_strike = _nearest_strike(
+                        strikes[:cutoff], underlying_price * put_strike_ratio
+                    )
+                else:
+                    target_strike = underlying_price * call_strike_ratio
+                    floor = underlying_price
+                    if cost_basis is not None:
+                        target_strike = max(target_strike, cost_basis)
+                        floor = max(floor, cost_basis)
+                    start = np.searchsorted(strikes, floor, side="left")
+                    if start == len(strikes):
+                        return None
+                    selected_strike = _nearest_strike(strikes[start:], target_strike)
+
+            # Get the specific option (first row quoting the strike)
+            row = leg.first_row[selected_strike]
+            bid = leg.bids[row].item()
+            ask = leg.asks[row].item()
+
+            return SelectedOption(
+                expiration=selected_exp,
+                strike=selected_strike,
+                option_type=option_type,
+                bid=bid,
+                ask=ask,
+                mid_price=(bid + ask) / 2,
+                delta=leg.deltas[row].item() if leg.deltas is not None else None,
+                dte=int(dtes[exp_idx]),
+            )
 
-        # Filter to selected expiration
-        exp_chain = type_chain[type_chain["expiration"].dt.date == selected_exp]
+        return select
 
-        # Select strike - try delta first, fall back to OTM percentage
-        selected_strike = None
+    def select_all(
+        self,
+        history: pd.DataFrame,
+        underlying_prices: pd.Series,
+        option_type: OptionType,
+        cost_basis: Optional[float] = None,
+    ) -> pd.DataFrame:
+        """Select an option for every trade date of a historical chain.
 
-        # Determine which delta to use based on option type
-        target_delta = self.put_delta if option_type == OptionType.PUT else self.call_delta
+        The history is split by trade date in one groupby pass and each day
+        is picked with a single compiled selector, giving the same result as
+        calling select_option_from_chain day by day.
 
-        # Try delta-based selection if configured and data available
-        if target_delta is not None:
-            selected_strike = self.select_strike_by_delta(
-                options_df=exp_chain,
-                option_type=option_type,
-                target_delta=target_delta,
-                underlying_price=underlying_price,
-                cost_basis=cost_basis,
+        Args:
+            history: Options data for many days with a trade_date column
+                plus the chain columns used by select_option_from_chain
+            underlying_prices: Underlying price per trade date
+            option_type: PUT or CALL
+            cost_basis: Cost basis for covered calls (optional)
+
+        Returns:
+            DataFrame of SelectedOption fields indexed by trade_date, with
+            one row per date that has a price and a qualifying option
+        """
+        if EXPIRATION_DAY_COLUMN not in history.columns and not history.empty:
+            history = history.assign(
+                **{EXPIRATION_DAY_COLUMN: expiration_days(history["expiration"])}
             )
 
-        # Fall back to OTM percentage if delta selection failed
-        if selected_strike is None:
-            strikes = sorted(exp_chain["strike"].unique())
-            if option_type == OptionType.PUT:
-                selected_strike = self.select_put_strike(underlying_price, strikes)
-            else:
-                selected_strike = self.select_call_strike(
-                    underlying_price, strikes, cost_basis
+        prices = underlying_prices.copy()
+        prices.index = pd.DatetimeIndex(prices.index).normalize()
+        price_by_date = prices.to_dict()
+
+        select = self.compile()
+        dates = []
+        selected = []
+        if not history.empty:
+            trade_dates = history["trade_date"].dt.normalize()
+            for trade_ts, day_chain in history.groupby(trade_dates, sort=True):
+                underlying_price = price_by_date.get(trade_ts)
+                if underlying_price is None:
+                    continue
+                option = select(
+                    day_chain, option_type, float(underlying_price), trade_ts.date(), cost_basis
                 )
-
-        if selected_strike is None:
-            return None
-
-        # Get the specific option
-        option = exp_chain[exp_chain["strike"] == selected_strike].iloc[0]
-
-        # Calculate mid price
-        bid = float(option["bid"])
-        ask = float(option["ask"])
-        mid_price = (bid + ask) / 2
-
-        return {
-            "expiration": selected_exp,
-            "strike": selected_strike,
-            "option_type": option_type,
-            "bid": bid,
-            "ask": ask,
-            "mid_price": mid_price,
-            "delta": float(option["delta"]) if "delta" in option else None,
-            "dte": (selected_exp - trade_date).days,
-        }
+                if option is not None:
+                    dates.append(trade_ts)
+                    selected.append(option)
+
+        return pd.DataFrame.from_records(
+            selected,
+            columns=list(SelectedOption._fields),
+            index=pd.DatetimeIndex(dates, name="trade_date"),
+        )
 
     def create_sell_order(
         self,
-        option_info: dict,
+        option_info: SelectedOption,
         quantity: int = 1,
     ) -> OptionOrder:
         """Create a sell-to-open order from selected option.
 
         Args:
-            option_info: Dict from select_option_from_chain
+            option_info: Option from select_option_from_chain
             quantity: Number of contracts
 
         Returns:
@@ -390,9 +858,9 @@ class OptionSelector:
         """
         return OptionOrder(
             action=OrderAction.SELL_TO_OPEN,
-            option_type=option_info["option_type"],
-            strike=option_info["strike"],
-            expiration=option_info["expiration"],
+            option_type=option_info.option_type,
+            strike=option_info.strike,
+            expiration=option_info.expiration,
             quantity=quantity,
-            limit_price=option_info["mid_price"],
+            limit_price=option_info.mid_price,
         )
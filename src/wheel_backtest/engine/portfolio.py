@@ -4,9 +4,9 @@ Tracks cash, stock positions, and option positions with full
 accounting for the wheel strategy.
 """
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import date
-from decimal import Decimal
 from enum import Enum
 from typing import Optional
 
@@ -25,10 +25,14 @@ class PositionSide(Enum):
     SHORT = "short"
 
 
-@dataclass
+@dataclass(eq=False, frozen=True, slots=True)
 class OptionPosition:
     """An open option position.
 
+    Positions are immutable and compare and hash by identity: two contracts
+    with identical terms opened separately are distinct holdings. The
+    side/type flags and notional value are computed once at construction.
+
     Attributes:
         option_type: PUT or CALL
         side: LONG or SHORT
@@ -39,6 +43,12 @@ class OptionPosition:
         entry_date: Date position was opened
         underlying_price_at_entry: Underlying price when opened
         delta_at_entry: Delta when position was opened (optional)
+        multiplier: Shares per contract
+        shares: Shares represented (quantity * multiplier)
+        is_short: True if this is a short position
+        is_put: True if this is a put option
+        is_call: True if this is a call option
+        notional_value: Notional value of position (strike * shares)
     """
 
     option_type: OptionType
@@ -50,26 +60,23 @@ class OptionPosition:
     entry_date: date
     underlying_price_at_entry: float
     delta_at_entry: Optional[float] = None
-
-    @property
-    def is_short(self) -> bool:
-        """True if this is a short position."""
-        return self.side == PositionSide.SHORT
-
-    @property
-    def is_put(self) -> bool:
-        """True if this is a put option."""
-        return self.option_type == OptionType.PUT
-
-    @property
-    def is_call(self) -> bool:
-        """True if this is a call option."""
-        return self.option_type == OptionType.CALL
-
-    @property
-    def notional_value(self) -> float:
-        """Notional value of position (strike * quantity * 100)."""
-        return self.strike * self.quantity * 100
+    multiplier: int = 100
+    shares: int = field(init=False)
+    is_short: bool = field(init=False)
+    is_put: bool = field(init=False)
+    is_call: bool = field(init=False)
+    notional_value: float = field(init=False)
+    # +1 for puts, -1 for calls: intrinsic value is max(0, sign * (strike - S))
+    _sign: float = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Compute share count, side/type flags and notional value."""
+        object.__setattr__(self, "shares", self.quantity * self.multiplier)
+        object.__setattr__(self, "is_short", self.side == PositionSide.SHORT)
+        object.__setattr__(self, "is_put", self.option_type == OptionType.PUT)
+        object.__setattr__(self, "is_call", self.option_type == OptionType.CALL)
+        object.__setattr__(self, "notional_value", self.strike * self.shares)
+        object.__setattr__(self, "_sign", 1.0 if self.is_put else -1.0)
 
     def is_expired(self, current_date: date) -> bool:
         """Check if option has expired."""
@@ -84,10 +91,7 @@ class OptionPosition:
         Returns:
             True if ITM
         """
-        if self.is_put:
-            return underlying_price < self.strike
-        else:  # CALL
-            return underlying_price > self.strike
+        return self._sign * (self.strike - underlying_price) > 0.0
 
     def intrinsic_value(self, underlying_price: float) -> float:
         """Calculate intrinsic value per share.
@@ -98,13 +102,10 @@ class OptionPosition:
         Returns:
             Intrinsic value (0 if OTM)
         """
-        if self.is_put:
-            return max(0.0, self.strike - underlying_price)
-        else:  # CALL
-            return max(0.0, underlying_price - self.strike)
+        return max(0.0, self._sign * (self.strike - underlying_price))
 
 
-@dataclass
+@dataclass(slots=True, init=False, repr=False)
 class Portfolio:
     """Portfolio state tracking cash, shares, and options.
 
@@ -114,12 +115,119 @@ class Portfolio:
     - Open option positions
 
     All values are tracked precisely for accurate P&L calculation.
+
+    Reserved cash, the next expiration and the short position counts are
+    kept in sync with the positions by the methods that open, close,
+    expire and assign them, so option_positions is a read-only view.
     """
 
-    cash: float = 0.0
-    shares: int = 0
-    option_positions: list[OptionPosition] = field(default_factory=list)
-    contract_multiplier: int = 100
+    cash: float
+    shares: int
+    _option_positions: list[OptionPosition]
+    contract_multiplier: int
+    _reserved_cash: float = field(compare=False)
+    _next_expiration: Optional[date] = field(compare=False)
+    _short_put_count: int = field(compare=False)
+    _short_call_count: int = field(compare=False)
+
+    def __init__(
+        self,
+        cash: float = 0.0,
+        shares: int = 0,
+        option_positions: Iterable[OptionPosition] = (),
+        contract_multiplier: int = 100,
+    ):
+        """Initialize portfolio.
+
+        Args:
+            cash: Cash balance
+            shares: Stock shares held
+            option_positions: Open option positions
+            contract_multiplier: Shares per option contract
+        """
+        self.cash = cash
+        self.shares = shares
+        self._option_positions = list(option_positions)
+        self.contract_multiplier = contract_multiplier
+        self._positions_changed()
+
+    @property
+    def option_positions(self) -> tuple[OptionPosition, ...]:
+        """Open option positions, in the order they were opened."""
+        return tuple(self._option_positions)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(cash={self.cash!r}, shares={self.shares!r}, "
+            f"option_positions={self._option_positions!r}, "
+            f"contract_multiplier={self.contract_multiplier!r})"
+        )
+
+    def _position_index(self, position: OptionPosition) -> int:
+        """Find a held position by identity.
+
+        Args:
+            position: Position to look up
+
+        Returns:
+            Index of the position in the held positions
+
+        Raises:
+            ValueError: If the position is not held
+        """
+        for index, held in enumerate(self._option_positions):
+            if held is position:
+                return index
+        raise ValueError("Position not found in portfolio")
+
+    def _positions_changed(self) -> None:
+        """Recompute aggregates derived from the option positions.
+
+        Called whenever a position is opened or removed, so per-day queries
+        read the aggregates instead of scanning the book.
+        """
+        reserved = 0.0
+        next_expiration = None
+        short_puts = short_calls = 0
+        for pos in self._option_positions:
+            if pos.is_short:
+                if pos.is_put:
+                    reserved += pos.strike * pos.shares
+                    short_puts += 1
+                else:
+                    short_calls += 1
+            if next_expiration is None or pos.expiration < next_expiration:
+                next_expiration = pos.expiration
+        self._reserved_cash = reserved
+        self._next_expiration = next_expiration
+        self._short_put_count = short_puts
+        self._short_call_count = short_calls
+
+    @property
+    def short_put_count(self) -> int:
+        """Number of open short put positions."""
+        return self._short_put_count
+
+    @property
+    def short_call_count(self) -> int:
+        """Number of open short call positions."""
+        return self._short_call_count
+
+    @property
+    def next_expiration(self) -> Optional[date]:
+        """Earliest expiration among open option positions (None if flat)."""
+        return self._next_expiration
+
+    def has_expired_positions(self, current_date: date) -> bool:
+        """Check whether any open option has expired.
+
+        Args:
+            current_date: Date to check against
+
+        Returns:
+            True if at least one position is expired on current_date
+        """
+        return self._next_expiration is not None and current_date >= self._next_expiration
 
     def deposit(self, amount: float) -> None:
         """Add cash to portfolio.
@@ -234,24 +342,26 @@ class Portfolio:
         if quantity <= 0:
             raise ValueError("Quantity must be positive")
 
-        # Receive premium (credit)
-        total_premium = premium_per_share * quantity * self.contract_multiplier
-        net_credit = total_premium - commission
-        self.cash += net_credit
-
         position = OptionPosition(
             option_type=option_type,
             side=PositionSide.SHORT,
             strike=strike,
             expiration=expiration,
             quantity=quantity,
+            multiplier=self.contract_multiplier,
             entry_price=premium_per_share,
             entry_date=trade_date,
             underlying_price_at_entry=underlying_price,
             delta_at_entry=delta,
         )
 
-        self.option_positions.append(position)
+        # Receive premium (credit)
+        total_premium = premium_per_share * position.shares
+        net_credit = total_premium - commission
+        self.cash += net_credit
+
+        self._option_positions.append(position)
+        self._positions_changed()
         return position
 
     def close_option_position(
@@ -270,25 +380,25 @@ class Portfolio:
         Returns:
             P&L from closing the position
         """
-        if position not in self.option_positions:
-            raise ValueError("Position not found in portfolio")
+        index = self._position_index(position)
 
         if position.is_short:
             # Buy to close - pay the premium
-            total_cost = close_price * position.quantity * self.contract_multiplier
+            total_cost = close_price * position.shares
             self.cash -= (total_cost + commission)
 
             # P&L = entry premium - exit cost
-            pnl = (position.entry_price - close_price) * position.quantity * self.contract_multiplier - commission
+            pnl = (position.entry_price - close_price) * position.shares - commission
         else:
             # Sell to close (long position) - receive premium
-            total_proceeds = close_price * position.quantity * self.contract_multiplier
+            total_proceeds = close_price * position.shares
             self.cash += (total_proceeds - commission)
 
             # P&L = exit proceeds - entry cost
-            pnl = (close_price - position.entry_price) * position.quantity * self.contract_multiplier - commission
+            pnl = (close_price - position.entry_price) * position.shares - commission
 
-        self.option_positions.remove(position)
+        del self._option_positions[index]
+        self._positions_changed()
         return pnl
 
     def expire_option_worthless(self, position: OptionPosition) -> float:
@@ -302,17 +412,17 @@ class Portfolio:
         Returns:
             P&L from expiration (premium kept for shorts)
         """
-        if position not in self.option_positions:
-            raise ValueError("Position not found in portfolio")
+        index = self._position_index(position)
 
         if position.is_short:
             # Keep full premium - already received at entry
-            pnl = position.entry_price * position.quantity * self.contract_multiplier
+            pnl = position.entry_price * position.shares
         else:
             # Lose full premium paid
-            pnl = -position.entry_price * position.quantity * self.contract_multiplier
+            pnl = -position.entry_price * position.shares
 
-        self.option_positions.remove(position)
+        del self._option_positions[index]
+        self._positions_changed()
         return pnl
 
     def exercise_put_assignment(
@@ -335,10 +445,9 @@ class Portfolio:
         if not position.is_put or not position.is_short:
             raise ValueError("Can only exercise assignment on short puts")
 
-        if position not in self.option_positions:
-            raise ValueError("Position not found in portfolio")
+        index = self._position_index(position)
 
-        shares_to_buy = position.quantity * self.contract_multiplier
+        shares_to_buy = position.shares
         cost = position.strike * shares_to_buy
 
         if cost > self.cash:
@@ -353,7 +462,8 @@ class Portfolio:
         intrinsic_loss = (position.strike - underlying_price) * shares_to_buy
         pnl = position.entry_price * shares_to_buy - intrinsic_loss
 
-        self.option_positions.remove(position)
+        del self._option_positions[index]
+        self._positions_changed()
         return pnl
 
     def exercise_call_assignment(
@@ -376,10 +486,9 @@ class Portfolio:
         if not position.is_call or not position.is_short:
             raise ValueError("Can only exercise assignment on short calls")
 
-        if position not in self.option_positions:
-            raise ValueError("Position not found in portfolio")
+        index = self._position_index(position)
 
-        shares_to_sell = position.quantity * self.contract_multiplier
+        shares_to_sell = position.shares
 
         if shares_to_sell > self.shares:
             raise ValueError(f"Insufficient shares for assignment: need {shares_to_sell}, have {self.shares}")
@@ -393,7 +502,8 @@ class Portfolio:
         # We "lose" the upside above strike but gained the premium
         pnl = position.entry_price * shares_to_sell
 
-        self.option_positions.remove(position)
+        del self._option_positions[index]
+        self._positions_changed()
         return pnl
 
     def get_equity(self, underlying_price: float, option_mid_prices: Optional[dict] = None) -> float:
@@ -408,16 +518,20 @@ class Portfolio:
         """
         stock_value = self.shares * underlying_price
 
+        # Common between trades: nothing to mark
+        if not self._option_positions:
+            return self.cash + stock_value
+
         # Mark options to market
         options_value = 0.0
-        for pos in self.option_positions:
+        for pos in self._option_positions:
             if option_mid_prices and pos in option_mid_prices:
                 mid_price = option_mid_prices[pos]
             else:
                 # Use intrinsic value as approximation
                 mid_price = pos.intrinsic_value(underlying_price)
 
-            position_value = mid_price * pos.quantity * self.contract_multiplier
+            position_value = mid_price * pos.shares
 
             if pos.is_short:
                 # Short options: liability (negative value to us)
@@ -437,22 +551,30 @@ class Portfolio:
         Returns:
             Available buying power
         """
-        # Reserve cash for short puts
-        reserved = 0.0
-        for pos in self.option_positions:
-            if pos.is_put and pos.is_short:
-                reserved += pos.strike * pos.quantity * self.contract_multiplier
-
-        return max(0.0, self.cash - reserved)
+        # Cash reserved for short puts is kept up to date as positions change
+        return max(0.0, self.cash - self._reserved_cash)
 
     def has_open_positions(self) -> bool:
         """Check if there are any open option positions."""
-        return len(self.option_positions) > 0
+        return bool(self._option_positions)
 
     def get_short_puts(self) -> list[OptionPosition]:
         """Get all open short put positions."""
-        return [p for p in self.option_positions if p.is_put and p.is_short]
+        return [p for p in self._option_positions if p.is_put and p.is_short]
 
     def get_short_calls(self) -> list[OptionPosition]:
         """Get all open short call positions."""
-        return [p for p in self.option_positions if p.is_call and p.is_short]
+        return [p for p in self._option_positions if p.is_call and p.is_short]
+
+    def get_short_options(self) -> tuple[list[OptionPosition], list[OptionPosition]]:
+        """Split open short positions by type in a single pass.
+
+        Returns:
+            Tuple of (short puts, short calls)
+        """
+        short_puts: list[OptionPosition] = []
+        short_calls: list[OptionPosition] = []
+        for p in self._option_positions:
+            if p.is_short:
+                (short_puts if p.is_put else short_calls).append(p)
+        return short_puts, short_calls
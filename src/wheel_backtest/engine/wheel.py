@@ -7,14 +7,22 @@ Implements the wheel options strategy:
 4. Repeat
 """
 
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import date
 from enum import Enum
-from typing import Optional
+from typing import Optional, Union
 
 import pandas as pd
 
-from wheel_backtest.engine.options import Fill, OptionOrder, OptionSelector, OrderAction
+from wheel_backtest.engine.options import (
+    Fill,
+    OptionOrder,
+    OptionSelector,
+    OrderAction,
+    PreparedChain,
+    SelectOptionFn,
+)
 from wheel_backtest.engine.portfolio import OptionPosition, OptionType, Portfolio
 
 
@@ -26,7 +34,24 @@ class WheelState(Enum):
     SELLING_CALLS = "selling_calls"  # Holding stock with open short calls
 
 
-@dataclass
+# Wheel transitions as a truth table over holdings:
+# (has shares, has short calls, has short puts) -> (state, open a new position)
+_TRANSITIONS: dict[tuple[bool, bool, bool], tuple[WheelState, bool]] = {
+    # No stock: sell a put unless one is already open
+    (False, False, False): (WheelState.SELLING_PUTS, True),
+    (False, False, True): (WheelState.SELLING_PUTS, False),
+    (False, True, False): (WheelState.SELLING_PUTS, True),
+    (False, True, True): (WheelState.SELLING_PUTS, False),
+    # Stock without calls: sell a call
+    (True, False, False): (WheelState.HOLDING_STOCK, True),
+    (True, False, True): (WheelState.HOLDING_STOCK, True),
+    # Stock with calls open: wait for them
+    (True, True, False): (WheelState.SELLING_CALLS, False),
+    (True, True, True): (WheelState.SELLING_CALLS, False),
+}
+
+
+@dataclass(frozen=True, slots=True)
 class WheelEvent:
     """An event in the wheel strategy execution.
 
@@ -70,12 +95,77 @@ class WheelStrategy:
         """
         self.portfolio = portfolio
         self.selector = selector
-        self.contracts_per_trade = contracts_per_trade
-        self.commission = commission_per_contract
+        self._contracts_per_trade = contracts_per_trade
+        self._commission = commission_per_contract
+        self._update_trade_totals()
         self.enable_call_entry_protection = enable_call_entry_protection
         self.call_entry_protection_dollars = call_entry_protection_dollars
+        self.reset()
+
+    @property
+    def selector(self) -> OptionSelector:
+        """Option selector for strike/expiration selection."""
+        return self._selector
+
+    @selector.setter
+    def selector(self, selector: OptionSelector) -> None:
+        self._selector = selector
+        self._compile_selector()
+
+    def _compile_selector(self) -> None:
+        """Compile the selector for its current settings."""
+        self._select_option: SelectOptionFn = self._selector.compile()
+        self._compiled_settings = self._selector.settings
+
+    def _selection(self) -> SelectOptionFn:
+        """Compiled selector, recompiled if the selector's settings changed."""
+        if self._selector.settings != self._compiled_settings:
+            self._compile_selector()
+        return self._select_option
+
+    @property
+    def contracts_per_trade(self) -> int:
+        """Number of contracts per trade."""
+        return self._contracts_per_trade
+
+    @contracts_per_trade.setter
+    def contracts_per_trade(self, contracts: int) -> None:
+        self._contracts_per_trade = contracts
+        self._update_trade_totals()
+
+    @property
+    def commission(self) -> float:
+        """Commission per contract."""
+        return self._commission
+
+    @commission.setter
+    def commission(self, commission: float) -> None:
+        self._commission = commission
+        self._update_trade_totals()
+
+    def _update_trade_totals(self) -> None:
+        """Derive the per-trade share count and commission from the trade size."""
+        self._trade_shares = self._contracts_per_trade * 100
+        self._trade_commission = self._commission * self._contracts_per_trade
+
+    def reset(self, portfolio: Optional[Portfolio] = None) -> None:
+        """Return the strategy to its initial state for another run.
+
+        Keeps the compiled selector and trade settings, so a sweep can
+        reuse one strategy across runs. Event lists handed out earlier are
+        left intact.
+
+        Args:
+            portfolio: Portfolio for the next run (keeps the current one if None)
+        """
+        if portfolio is not None:
+            self.portfolio = portfolio
         self._state = WheelState.SELLING_PUTS
         self._events: list[WheelEvent] = []
+        # Counts and premium totals accumulate as events are logged, so
+        # get_summary does not rescan the event history
+        self._event_counts: Counter[str] = Counter()
+        self._premium_collected = {"sell_put": 0.0, "sell_call": 0.0}
         self._cost_basis: Optional[float] = None  # Per-share cost basis when holding stock
 
     @property
@@ -85,8 +175,12 @@ class WheelStrategy:
 
     @property
     def events(self) -> list[WheelEvent]:
-        """List of all wheel events."""
-        return self._events.copy()
+        """List of all wheel events.
+
+        This is the strategy's own list, returned without copying; treat it
+        as read-only.
+        """
+        return self._events
 
     def _log_event(
         self,
@@ -105,22 +199,30 @@ class WheelStrategy:
             details=details,
         )
         self._events.append(event)
+        self._event_counts[event_type] += 1
+        if event_type in self._premium_collected:
+            self._premium_collected[event_type] += (
+                details.get("premium", 0) * details.get("contracts", 1) * 100
+            )
         return event
 
     def process_day(
         self,
         trade_date: date,
         underlying_price: float,
-        options_chain: pd.DataFrame,
+        options_chain: Union[pd.DataFrame, PreparedChain],
     ) -> list[WheelEvent]:
         """Process a single trading day.
 
         Handles expirations, assignments, and opens new positions as needed.
+        The chain is grouped at most once, and only on days a position is
+        opened; an already prepared chain is used as is.
 
         Args:
             trade_date: Current trading date
             underlying_price: Current underlying price
-            options_chain: Available options chain for this date
+            options_chain: Available options chain for this date, raw or
+                prepared with OptionSelector.prepare_chain
 
         Returns:
             List of events that occurred this day
@@ -131,16 +233,33 @@ class WheelStrategy:
         expiration_events = self._handle_expirations(trade_date, underlying_price)
         day_events.extend(expiration_events)
 
-        # Step 2: Update state based on holdings
-        self._update_state()
-
-        # Step 3: Open new positions if appropriate
-        if self._should_open_position():
+        # Step 2: Update state based on holdings, then open new positions
+        # if appropriate
+        if self._update_state():
             open_events = self._open_position(trade_date, underlying_price, options_chain)
             day_events.extend(open_events)
 
         return day_events
 
+    def has_pending_work(self, trade_date: date) -> bool:
+        """Check whether process_day could change anything on this date.
+
+        A day is a no-op when no open option has expired and the strategy
+        already holds the position it wants. Callers can skip fetching the
+        options chain and calling process_day on such days.
+
+        Args:
+            trade_date: Current trading date
+
+        Returns:
+            True if the day needs to be processed
+        """
+        if self.portfolio.has_expired_positions(trade_date):
+            return True
+
+        # Same state refresh process_day does before deciding to open
+        return self._update_state()
+
     def _handle_expirations(
         self,
         trade_date: date,
@@ -157,6 +276,10 @@ class WheelStrategy:
         """
         events = []
 
+        # Most days nothing expires; skip the scan entirely
+        if not self.portfolio.has_expired_positions(trade_date):
+            return events
+
         # Process expired positions
         expired_positions = [
             pos for pos in self.portfolio.option_positions
@@ -173,7 +296,7 @@ class WheelStrategy:
                     pnl = self.portfolio.exercise_put_assignment(position, underlying_price)
 
                     # Calculate cost basis
-                    shares_acquired = position.quantity * self.portfolio.contract_multiplier
+                    shares_acquired = position.shares
                     self._cost_basis = position.strike - position.entry_price
 
                     self._state = WheelState.HOLDING_STOCK
@@ -204,7 +327,7 @@ class WheelStrategy:
                         self._state,
                         strike=position.strike,
                         underlying_price=underlying_price,
-                        shares_sold=position.quantity * self.portfolio.contract_multiplier,
+                        shares_sold=position.shares,
                         premium_received=position.entry_price,
                         pnl=pnl,
                     ))
@@ -234,45 +357,28 @@ class WheelStrategy:
 
         return events
 
-    def _update_state(self) -> None:
-        """Update state based on current holdings."""
-        has_shares = self.portfolio.shares > 0
-        has_short_puts = len(self.portfolio.get_short_puts()) > 0
-        has_short_calls = len(self.portfolio.get_short_calls()) > 0
-
-        if has_shares:
-            if has_short_calls:
-                self._state = WheelState.SELLING_CALLS
-            else:
-                self._state = WheelState.HOLDING_STOCK
-        else:
-            self._state = WheelState.SELLING_PUTS
+    def _update_state(self) -> bool:
+        """Update state based on current holdings.
 
-    def _should_open_position(self) -> bool:
-        """Check if we should open a new position.
+        State and the open decision are looked up from the portfolio's
+        position counts, which are only recomputed when positions change.
 
         Returns:
-            True if we should open a position
+            True if we should open a new position
         """
-        if self._state == WheelState.SELLING_PUTS:
-            # Open new put if no puts open
-            return len(self.portfolio.get_short_puts()) == 0
-
-        elif self._state == WheelState.HOLDING_STOCK:
-            # Open new call if no calls open
-            return len(self.portfolio.get_short_calls()) == 0
-
-        elif self._state == WheelState.SELLING_CALLS:
-            # Already have calls open
-            return False
-
-        return False
+        portfolio = self.portfolio
+        self._state, should_open = _TRANSITIONS[
+            portfolio.shares > 0,
+            portfolio.short_call_count > 0,
+            portfolio.short_put_count > 0,
+        ]
+        return should_open
 
     def _open_position(
         self,
         trade_date: date,
         underlying_price: float,
-        options_chain: pd.DataFrame,
+        options_chain: Union[pd.DataFrame, PreparedChain],
     ) -> list[WheelEvent]:
         """Open a new position.
 
@@ -286,11 +392,14 @@ class WheelStrategy:
         """
         events = []
 
+        # Group the chain once for every leg selected today
+        prepared_chain = self.selector.prepare_chain(options_chain)
+
         if self._state == WheelState.SELLING_PUTS:
-            events.extend(self._sell_put(trade_date, underlying_price, options_chain))
+            events.extend(self._sell_put(trade_date, underlying_price, prepared_chain))
 
         elif self._state == WheelState.HOLDING_STOCK:
-            events.extend(self._sell_call(trade_date, underlying_price, options_chain))
+            events.extend(self._sell_call(trade_date, underlying_price, prepared_chain))
 
         return events
 
@@ -298,7 +407,7 @@ class WheelStrategy:
         self,
         trade_date: date,
         underlying_price: float,
-        options_chain: pd.DataFrame,
+        options_chain: Union[pd.DataFrame, PreparedChain],
     ) -> list[WheelEvent]:
         """Sell a cash-secured put.
 
@@ -314,8 +423,8 @@ class WheelStrategy:
         state_before = self._state
 
         # Select best put to sell
-        option_info = self.selector.select_option_from_chain(
-            chain=options_chain,
+        option_info = self._selection()(
+            options_chain,
             option_type=OptionType.PUT,
             underlying_price=underlying_price,
             trade_date=trade_date,
@@ -325,21 +434,21 @@ class WheelStrategy:
             return events
 
         # Check if we have enough buying power
-        required_cash = option_info["strike"] * self.contracts_per_trade * 100
+        required_cash = option_info.strike * self._trade_shares
         if self.portfolio.cash < required_cash:
             return events
 
         # Open the position
-        total_commission = self.commission * self.contracts_per_trade
+        total_commission = self._trade_commission
         position = self.portfolio.open_short_option(
             option_type=OptionType.PUT,
-            strike=option_info["strike"],
-            expiration=option_info["expiration"],
+            strike=option_info.strike,
+            expiration=option_info.expiration,
             quantity=self.contracts_per_trade,
-            premium_per_share=option_info["mid_price"],
+            premium_per_share=option_info.mid_price,
             trade_date=trade_date,
             underlying_price=underlying_price,
-            delta=option_info.get("delta"),
+            delta=option_info.delta,
             commission=total_commission,
         )
 
@@ -348,11 +457,11 @@ class WheelStrategy:
             "sell_put",
             state_before,
             WheelState.SELLING_PUTS,
-            strike=option_info["strike"],
-            expiration=option_info["expiration"],
-            premium=option_info["mid_price"],
-            delta=option_info.get("delta"),
-            dte=option_info["dte"],
+            strike=option_info.strike,
+            expiration=option_info.expiration,
+            premium=option_info.mid_price,
+            delta=option_info.delta,
+            dte=option_info.dte,
             underlying_price=underlying_price,
             contracts=self.contracts_per_trade,
             commission=total_commission,
@@ -364,7 +473,7 @@ class WheelStrategy:
         self,
         trade_date: date,
         underlying_price: float,
-        options_chain: pd.DataFrame,
+        options_chain: Union[pd.DataFrame, PreparedChain],
     ) -> list[WheelEvent]:
         """Sell a covered call.
 
@@ -387,8 +496,8 @@ class WheelStrategy:
                 return events
 
         # Select best call to sell
-        option_info = self.selector.select_option_from_chain(
-            chain=options_chain,
+        option_info = self._selection()(
+            options_chain,
             option_type=OptionType.CALL,
             underlying_price=underlying_price,
             trade_date=trade_date,
@@ -399,21 +508,20 @@ class WheelStrategy:
             return events
 
         # Check if we have enough shares
-        shares_needed = self.contracts_per_trade * 100
-        if self.portfolio.shares < shares_needed:
+        if self.portfolio.shares < self._trade_shares:
             return events
 
         # Open the position
-        total_commission = self.commission * self.contracts_per_trade
+        total_commission = self._trade_commission
         position = self.portfolio.open_short_option(
             option_type=OptionType.CALL,
-            strike=option_info["strike"],
-            expiration=option_info["expiration"],
+            strike=option_info.strike,
+            expiration=option_info.expiration,
             quantity=self.contracts_per_trade,
-            premium_per_share=option_info["mid_price"],
+            premium_per_share=option_info.mid_price,
             trade_date=trade_date,
             underlying_price=underlying_price,
-            delta=option_info.get("delta"),
+            delta=option_info.delta,
             commission=total_commission,
         )
 
@@ -424,11 +532,11 @@ class WheelStrategy:
             "sell_call",
             state_before,
             WheelState.SELLING_CALLS,
-            strike=option_info["strike"],
-            expiration=option_info["expiration"],
-            premium=option_info["mid_price"],
-            delta=option_info.get("delta"),
-            dte=option_info["dte"],
+            strike=option_info.strike,
+            expiration=option_info.expiration,
+            premium=option_info.mid_price,
+            delta=option_info.delta,
+            dte=option_info.dte,
             underlying_price=underlying_price,
             cost_basis=self._cost_basis,
             contracts=self.contracts_per_trade,
@@ -443,22 +551,16 @@ class WheelStrategy:
         Returns:
             Summary statistics
         """
-        total_puts_sold = sum(1 for e in self._events if e.event_type == "sell_put")
-        total_calls_sold = sum(1 for e in self._events if e.event_type == "sell_call")
-        put_assignments = sum(1 for e in self._events if e.event_type == "put_assigned")
-        call_assignments = sum(1 for e in self._events if e.event_type == "call_assigned")
-        puts_expired = sum(1 for e in self._events if e.event_type == "put_expired")
-        calls_expired = sum(1 for e in self._events if e.event_type == "call_expired")
-
-        # Calculate total premium collected
-        premium_from_puts = sum(
-            e.details.get("premium", 0) * e.details.get("contracts", 1) * 100
-            for e in self._events if e.event_type == "sell_put"
-        )
-        premium_from_calls = sum(
-            e.details.get("premium", 0) * e.details.get("contracts", 1) * 100
-            for e in self._events if e.event_type == "sell_call"
-        )
+        counts = self._event_counts
+        total_puts_sold = counts["sell_put"]
+        total_calls_sold = counts["sell_call"]
+        put_assignments = counts["put_assigned"]
+        call_assignments = counts["call_assigned"]
+        puts_expired = counts["put_expired"]
+        calls_expired = counts["call_expired"]
+
+        premium_from_puts = self._premium_collected["sell_put"]
+        premium_from_calls = self._premium_collected["sell_call"]
 
         return {
             "total_puts_sold": total_puts_sold,
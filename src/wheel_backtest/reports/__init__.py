@@ -10,6 +10,7 @@ Usage:
 
 from wheel_backtest.reports.charts import (
     create_benchmark_report,
+    lttb_indices,
     plot_drawdown,
     plot_equity_comparison,
     plot_equity_curve,
@@ -18,6 +19,7 @@ from wheel_backtest.reports.charts import (
 
 __all__ = [
     "create_benchmark_report",
+    "lttb_indices",
     "plot_drawdown",
     "plot_equity_comparison",
     "plot_equity_curve",
@@ -1,117 +1,318 @@
 """Matplotlib chart generation for backtesting results.
 
-Provides visualization of equity curves and strategy comparison.
+Provides visualization of equity curves and strategy comparison. Data
+series are drawn as rasterized artists, so vector outputs (PDF, SVG)
+embed one image per series instead of a path segment per day, while axes
+and labels stay vector.
 """
 
 from pathlib import Path
+from typing import Literal
 
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
+import matplotlib.ticker as mticker
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
+import numpy as np
 import pandas as pd
 
 from wheel_backtest.analytics.equity import EquityCurve
 
 
-def plot_equity_curve(
-    curve: EquityCurve,
-    title: str = "Equity Curve",
-    output_path: Path | None = None,
-    show: bool = False,
-) -> plt.Figure:
-    """Plot a single equity curve.
+# A 12-inch figure at 150 DPI is 1800 pixels wide; more points than this
+# only overdraw
+DOWNSAMPLE_TARGET = 2000
+
+
+def lttb_indices(values: np.ndarray, target: int) -> np.ndarray:
+    """Pick points that preserve a series' shape (Largest-Triangle-Three-Buckets).
+
+    Points are treated as evenly spaced. The first and last points are
+    always kept; each bucket in between keeps the point forming the
+    largest triangle with the previously kept point and the average of
+    the next bucket.
 
     Args:
-        curve: EquityCurve to plot
-        title: Chart title
-        output_path: If provided, save chart to this path
-        show: If True, display chart interactively
+        values: Series values in order
+        target: Number of points to keep
 
     Returns:
-        Matplotlib figure object
+        Sorted positions of the kept points (all positions if the series
+        already has no more than target points)
     """
-    df = curve.to_dataframe()
+    n = len(values)
+    if target < 3 or n <= target:
+        return np.arange(n)
+
+    y = np.asarray(values, dtype=np.float64)
+    x = np.arange(n, dtype=np.float64)
+    # target - 2 buckets over the interior points
+    edges = np.linspace(1, n - 1, target - 1).astype(np.intp)
+    edges = np.append(edges, n)
+
+    kept = np.empty(target, dtype=np.intp)
+    kept[0] = 0
+    kept[-1] = n - 1
+    anchor = 0
+    for bucket in range(target - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_end = edges[bucket + 2]
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+
+        area = np.abs(
+            (x[anchor] - avg_x) * (y[start:end] - y[anchor])
+            - (x[anchor] - x[start:end]) * (avg_y - y[anchor])
+        )
+        anchor = start + int(np.argmax(area))
+        kept[bucket + 1] = anchor
+
+    return kept
 
-    fig, ax = plt.subplots(figsize=(12, 6))
 
-    ax.plot(df.index, df["total"], label="Total Equity", linewidth=2)
-    ax.fill_between(df.index, df["total"], alpha=0.3)
+def _plot_points(
+    index: pd.Index | np.ndarray, values: np.ndarray, downsample: bool
+) -> tuple[pd.Index | np.ndarray, np.ndarray]:
+    """Series coordinates to draw, downsampled when requested.
+
+    Args:
+        index: Dates of the series
+        values: Series values
+        downsample: If True, keep at most DOWNSAMPLE_TARGET points
+
+    Returns:
+        Tuple of (x, y) to plot
+    """
+    y = np.asarray(values, dtype=np.float64)
+    if not downsample or len(y) <= DOWNSAMPLE_TARGET:
+        return index, y
+    kept = lttb_indices(y, DOWNSAMPLE_TARGET)
+    return index[kept], y[kept]
 
+
+def _drawdown_pct(total: np.ndarray) -> np.ndarray:
+    """Percentage decline of each value from its running peak.
+
+    Args:
+        total: Equity values in date order
+
+    Returns:
+        Drawdown per value (0 at a peak, negative below it)
+    """
+    running_max = np.maximum.accumulate(total)
+    drawdown: np.ndarray = np.subtract(total, running_max)
+    np.divide(drawdown, running_max, out=drawdown)
+    drawdown *= 100.0
+    return drawdown
+
+
+_IMAGE_FORMATS = ("png", "svg", "pdf")
+
+_EQUITY_FIGSIZE = (12, 6)
+_DRAWDOWN_FIGSIZE = (12, 4)
+
+# Y tick label formats, rendered by matplotlib's StrMethodFormatter
+_DOLLAR_FMT = "${x:,.0f}"
+_PCT0_FMT = "{x:.0f}%"
+_PCT1_FMT = "{x:.1f}%"
+
+
+def _format_axes(ax: plt.Axes, title: str, ylabel: str, value_format: str) -> None:
+    """Apply the shared title, grid and date/value axis formatting.
+
+    Args:
+        ax: Axes to format
+        title: Chart title
+        ylabel: Y-axis label
+        value_format: str.format template for y tick values, one of the
+            module's _*_FMT constants
+    """
     ax.set_title(title, fontsize=14, fontweight="bold")
     ax.set_xlabel("Date")
-    ax.set_ylabel("Portfolio Value ($)")
-    ax.legend()
+    ax.set_ylabel(ylabel)
     ax.grid(True, alpha=0.3)
 
     # Format x-axis dates
     ax.xaxis.set_major_formatter(mdates.DateFormatter("%Y-%m"))
     ax.xaxis.set_major_locator(mdates.MonthLocator(interval=3))
-    plt.xticks(rotation=45)
+    ax.tick_params(axis="x", labelrotation=45)
+
+    # Formatters bind to their axis, so each axes gets its own
+    # StrMethodFormatter; it formats without a Python lambda per tick
+    ax.yaxis.set_major_formatter(mticker.StrMethodFormatter(value_format))
 
-    # Format y-axis with comma separators
-    ax.yaxis.set_major_formatter(
-        plt.FuncFormatter(lambda x, p: f"${x:,.0f}")
-    )
 
-    plt.tight_layout()
+def _finish(fig: plt.Figure, output_path: Path | None, show: bool) -> None:
+    """Save and/or show a figure.
 
+    Figures are created with the constrained layout engine, which fits
+    labels as part of drawing, so neither a separate layout pass nor a
+    tight bounding box is needed when saving.
+
+    Args:
+        fig: Figure to finish
+        output_path: If provided, save chart to this path
+        show: If True, display chart interactively
+    """
     if output_path:
-        fig.savefig(output_path, dpi=150, bbox_inches="tight")
+        fig.savefig(output_path, dpi=150)
 
     if show:
         plt.show()
 
-    return fig
 
+def _curve_points(
+    curve: EquityCurve, frame: pd.DataFrame | None
+) -> tuple[pd.Index | np.ndarray, np.ndarray]:
+    """Dates and totals to plot, from frame if given, else from the curve."""
+    if frame is None:
+        return curve.as_arrays()
+    return frame.index, frame["total"].to_numpy(dtype=np.float64)
 
-def plot_equity_comparison(
-    curves: dict[str, EquityCurve],
-    title: str = "Strategy Comparison",
+
+def _draw_equity(
+    ax: plt.Axes,
+    dates: pd.Index | np.ndarray,
+    total: np.ndarray,
+    title: str,
+    downsample: bool,
+) -> None:
+    """Draw a single equity curve onto ax."""
+    x, total = _plot_points(dates, total, downsample)
+
+    ax.plot(x, total, label="Total Equity", linewidth=2, rasterized=True)
+    ax.fill_between(x, total, alpha=0.3, rasterized=True)
+    ax.legend()
+
+    _format_axes(ax, title, "Portfolio Value ($)", _DOLLAR_FMT)
+
+
+def _draw_series(
+    ax: plt.Axes, series: list[tuple[str, pd.Index | np.ndarray, np.ndarray]]
+) -> None:
+    """Draw several named series onto ax as one LineCollection.
+
+    One collection is a single artist and draw call however many series
+    are compared. The legend is built from proxy lines in matching colors.
+
+    Args:
+        ax: Axes to draw on
+        series: (name, dates, values) for each series, in legend order
+    """
+    palette = plt.cm.tab10.colors
+    colors = [palette[i % len(palette)] for i in range(len(series))]
+    segments = [
+        np.column_stack([mdates.date2num(x), y]) for _, x, y in series
+    ]
+
+    ax.add_collection(
+        LineCollection(segments, colors=colors, linewidths=2, rasterized=True)
+    )
+    ax.xaxis_date()
+    ax.autoscale_view()
+
+    handles = [Line2D([], [], color=color, linewidth=2) for color in colors]
+    ax.legend(handles, [name for name, _, _ in series], loc="upper left")
+
+
+def _draw_equity_comparison(
+    ax: plt.Axes, curves: dict[str, EquityCurve], title: str, downsample: bool
+) -> None:
+    """Draw several equity curves onto ax."""
+    series = []
+    for name, curve in curves.items():
+        series.append((name, *_plot_points(*curve.as_arrays(), downsample)))
+
+    _draw_series(ax, series)
+    _format_axes(ax, title, "Portfolio Value ($)", _DOLLAR_FMT)
+
+
+def _draw_returns_comparison(
+    ax: plt.Axes, curves: dict[str, EquityCurve], title: str, downsample: bool
+) -> None:
+    """Draw several cumulative return series (in percent) onto ax."""
+    series = []
+    for name, curve in curves.items():
+        returns = curve.get_cumulative_returns() * 100  # Convert to percentage
+        series.append((name, *_plot_points(returns.index, returns.to_numpy(), downsample)))
+
+    _draw_series(ax, series)
+    ax.axhline(y=0, color="gray", linestyle="--", linewidth=1)
+    _format_axes(ax, title, "Cumulative Return (%)", _PCT0_FMT)
+
+
+def _draw_drawdown(
+    ax: plt.Axes,
+    dates: pd.Index | np.ndarray,
+    total: np.ndarray,
+    title: str,
+    downsample: bool,
+) -> None:
+    """Draw the drawdown of an equity series onto ax."""
+    drawdown = _drawdown_pct(total)
+    x, drawdown = _plot_points(dates, drawdown, downsample)
+
+    ax.fill_between(x, drawdown, 0, alpha=0.5, color="red", rasterized=True)
+    ax.plot(x, drawdown, color="darkred", linewidth=1, rasterized=True)
+
+    _format_axes(ax, title, "Drawdown (%)", _PCT1_FMT)
+
+
+def plot_equity_curve(
+    curve: EquityCurve,
+    title: str = "Equity Curve",
     output_path: Path | None = None,
     show: bool = False,
+    frame: pd.DataFrame | None = None,
+    downsample: bool = True,
 ) -> plt.Figure:
-    """Plot multiple equity curves for comparison.
+    """Plot a single equity curve.
 
     Args:
-        curves: Dictionary mapping strategy name to EquityCurve
+        curve: EquityCurve to plot
         title: Chart title
         output_path: If provided, save chart to this path
         show: If True, display chart interactively
+        frame: curve.to_dataframe() result, if the caller already has it
+        downsample: If True, long curves are reduced to DOWNSAMPLE_TARGET
+            shape-preserving points before drawing
 
     Returns:
         Matplotlib figure object
     """
-    fig, ax = plt.subplots(figsize=(12, 6))
-
-    colors = plt.cm.tab10.colors
-
-    for i, (name, curve) in enumerate(curves.items()):
-        df = curve.to_dataframe()
-        color = colors[i % len(colors)]
-        ax.plot(df.index, df["total"], label=name, linewidth=2, color=color)
+    dates, total = _curve_points(curve, frame)
 
-    ax.set_title(title, fontsize=14, fontweight="bold")
-    ax.set_xlabel("Date")
-    ax.set_ylabel("Portfolio Value ($)")
-    ax.legend(loc="upper left")
-    ax.grid(True, alpha=0.3)
+    fig, ax = plt.subplots(figsize=_EQUITY_FIGSIZE, layout="constrained")
+    _draw_equity(ax, dates, total, title, downsample)
+    _finish(fig, output_path, show)
 
-    # Format x-axis dates
-    ax.xaxis.set_major_formatter(mdates.DateFormatter("%Y-%m"))
-    ax.xaxis.set_major_locator(mdates.MonthLocator(interval=3))
-    plt.xticks(rotation=45)
+    return fig
 
-    # Format y-axis with comma separators
-    ax.yaxis.set_major_formatter(
-        plt.FuncFormatter(lambda x, p: f"${x:,.0f}")
-    )
 
-    plt.tight_layout()
+def plot_equity_comparison(
+    curves: dict[str, EquityCurve],
+    title: str = "Strategy Comparison",
+    output_path: Path | None = None,
+    show: bool = False,
+    downsample: bool = True,
+) -> plt.Figure:
+    """Plot multiple equity curves for comparison.
 
-    if output_path:
-        fig.savefig(output_path, dpi=150, bbox_inches="tight")
+    Args:
+        curves: Dictionary mapping strategy name to EquityCurve
+        title: Chart title
+        output_path: If provided, save chart to this path
+        show: If True, display chart interactively
+        downsample: If True, long curves are reduced to DOWNSAMPLE_TARGET
+            shape-preserving points before drawing
 
-    if show:
-        plt.show()
+    Returns:
+        Matplotlib figure object
+    """
+    fig, ax = plt.subplots(figsize=_EQUITY_FIGSIZE, layout="constrained")
+    _draw_equity_comparison(ax, curves, title, downsample)
+    _finish(fig, output_path, show)
 
     return fig
 
@@ -121,6 +322,7 @@ def plot_returns_comparison(
     title: str = "Cumulative Returns Comparison",
     output_path: Path | None = None,
     show: bool = False,
+    downsample: bool = True,
 ) -> plt.Figure:
     """Plot cumulative returns as percentages.
 
@@ -129,44 +331,15 @@ def plot_returns_comparison(
         title: Chart title
         output_path: If provided, save chart to this path
         show: If True, display chart interactively
+        downsample: If True, long curves are reduced to DOWNSAMPLE_TARGET
+            shape-preserving points before drawing
 
     Returns:
         Matplotlib figure object
     """
-    fig, ax = plt.subplots(figsize=(12, 6))
-
-    colors = plt.cm.tab10.colors
-
-    for i, (name, curve) in enumerate(curves.items()):
-        returns = curve.get_cumulative_returns() * 100  # Convert to percentage
-        color = colors[i % len(colors)]
-        ax.plot(returns.index, returns.values, label=name, linewidth=2, color=color)
-
-    ax.axhline(y=0, color="gray", linestyle="--", linewidth=1)
-
-    ax.set_title(title, fontsize=14, fontweight="bold")
-    ax.set_xlabel("Date")
-    ax.set_ylabel("Cumulative Return (%)")
-    ax.legend(loc="upper left")
-    ax.grid(True, alpha=0.3)
-
-    # Format x-axis dates
-    ax.xaxis.set_major_formatter(mdates.DateFormatter("%Y-%m"))
-    ax.xaxis.set_major_locator(mdates.MonthLocator(interval=3))
-    plt.xticks(rotation=45)
-
-    # Format y-axis as percentage
-    ax.yaxis.set_major_formatter(
-        plt.FuncFormatter(lambda x, p: f"{x:.0f}%")
-    )
-
-    plt.tight_layout()
-
-    if output_path:
-        fig.savefig(output_path, dpi=150, bbox_inches="tight")
-
-    if show:
-        plt.show()
+    fig, ax = plt.subplots(figsize=_EQUITY_FIGSIZE, layout="constrained")
+    _draw_returns_comparison(ax, curves, title, downsample)
+    _finish(fig, output_path, show)
 
     return fig
 
@@ -176,6 +349,8 @@ def plot_drawdown(
     title: str = "Drawdown",
     output_path: Path | None = None,
     show: bool = False,
+    frame: pd.DataFrame | None = None,
+    downsample: bool = True,
 ) -> plt.Figure:
     """Plot drawdown chart showing decline from peak.
 
@@ -184,45 +359,35 @@ def plot_drawdown(
         title: Chart title
         output_path: If provided, save chart to this path
         show: If True, display chart interactively
+        frame: curve.to_dataframe() result, if the caller already has it
+        downsample: If True, long curves are reduced to DOWNSAMPLE_TARGET
+            shape-preserving points before drawing (after the drawdown is
+            computed on the full curve)
 
     Returns:
         Matplotlib figure object
     """
-    df = curve.to_dataframe()
-
-    # Calculate running maximum and drawdown
-    running_max = df["total"].cummax()
-    drawdown = (df["total"] - running_max) / running_max * 100
-
-    fig, ax = plt.subplots(figsize=(12, 4))
+    dates, total = _curve_points(curve, frame)
 
-    ax.fill_between(df.index, drawdown, 0, alpha=0.5, color="red")
-    ax.plot(df.index, drawdown, color="darkred", linewidth=1)
+    fig, ax = plt.subplots(figsize=_DRAWDOWN_FIGSIZE, layout="constrained")
+    _draw_drawdown(ax, dates, total, title, downsample)
+    _finish(fig, output_path, show)
 
-    ax.set_title(title, fontsize=14, fontweight="bold")
-    ax.set_xlabel("Date")
-    ax.set_ylabel("Drawdown (%)")
-    ax.grid(True, alpha=0.3)
-
-    # Format x-axis dates
-    ax.xaxis.set_major_formatter(mdates.DateFormatter("%Y-%m"))
-    ax.xaxis.set_major_locator(mdates.MonthLocator(interval=3))
-    plt.xticks(rotation=45)
-
-    # Format y-axis as percentage
-    ax.yaxis.set_major_formatter(
-        plt.FuncFormatter(lambda x, p: f"{x:.1f}%")
-    )
+    return fig
 
-    plt.tight_layout()
 
-    if output_path:
-        fig.savefig(output_path, dpi=150, bbox_inches="tight")
+def _check_image_format(image_format: str) -> None:
+    """Raise ValueError unless image_format is a supported chart format."""
+    if image_format not in _IMAGE_FORMATS:
+        raise ValueError(
+            f"Invalid image_format: {image_format}. Must be one of {_IMAGE_FORMATS}"
+        )
 
-    if show:
-        plt.show()
 
-    return fig
+def _reuse(fig: plt.Figure, ax: plt.Axes, figsize: tuple[int, int]) -> None:
+    """Clear a report figure's axes and resize it for the next chart."""
+    ax.clear()
+    fig.set_size_inches(*figsize)
 
 
 def create_benchmark_report(
@@ -230,47 +395,64 @@ def create_benchmark_report(
     ticker: str,
     initial_capital: float,
     output_dir: Path,
+    data_format: Literal["parquet", "csv"] = "parquet",
+    image_format: Literal["png", "svg", "pdf"] = "png",
 ) -> dict[str, Path]:
     """Create full benchmark report with multiple charts.
 
+    All charts are drawn on one reused figure.
+
     Args:
         benchmark_curve: Buy-and-hold equity curve
         ticker: Stock symbol
         initial_capital: Starting capital
         output_dir: Directory to save charts
+        data_format: File format for the equity data, "parquet"
+            (zstd-compressed) or "csv"
+        image_format: File format for the charts, "png", "svg" or "pdf"
 
     Returns:
         Dictionary mapping chart name to file path
+
+    Raises:
+        ValueError: If data_format or image_format is not supported
     """
+    if data_format not in ("parquet", "csv"):
+        raise ValueError(f"Invalid data_format: {data_format}. Must be 'parquet' or 'csv'")
+    _check_image_format(image_format)
+
     output_dir.mkdir(parents=True, exist_ok=True)
 
     charts = {}
 
-    # Main equity curve
-    equity_path = output_dir / f"{ticker}_benchmark_equity.png"
-    plot_equity_curve(
-        benchmark_curve,
-        title=f"{ticker} Buy-and-Hold Equity Curve",
-        output_path=equity_path,
-    )
-    charts["equity"] = equity_path
-    plt.close()
-
-    # Drawdown
-    drawdown_path = output_dir / f"{ticker}_benchmark_drawdown.png"
-    plot_drawdown(
-        benchmark_curve,
-        title=f"{ticker} Buy-and-Hold Drawdown",
-        output_path=drawdown_path,
-    )
-    charts["drawdown"] = drawdown_path
-    plt.close()
-
-    # Save equity data as CSV
-    csv_path = output_dir / f"{ticker}_benchmark_equity.csv"
+    # Every chart and the data file share one conversion of the curve
     df = benchmark_curve.to_dataframe()
-    df.to_csv(csv_path)
-    charts["data"] = csv_path
+    total = df["total"].to_numpy(dtype=np.float64)
+
+    fig, ax = plt.subplots(figsize=_EQUITY_FIGSIZE, layout="constrained")
+    try:
+        # Main equity curve
+        equity_path = output_dir / f"{ticker}_benchmark_equity.{image_format}"
+        _draw_equity(ax, df.index, total, f"{ticker} Buy-and-Hold Equity Curve", downsample=True)
+        _finish(fig, equity_path, show=False)
+        charts["equity"] = equity_path
+
+        # Drawdown
+        drawdown_path = output_dir / f"{ticker}_benchmark_drawdown.{image_format}"
+        _reuse(fig, ax, _DRAWDOWN_FIGSIZE)
+        _draw_drawdown(ax, df.index, total, f"{ticker} Buy-and-Hold Drawdown", downsample=True)
+        _finish(fig, drawdown_path, show=False)
+        charts["drawdown"] = drawdown_path
+    finally:
+        plt.close(fig)
+
+    # Save equity data
+    data_path = output_dir / f"{ticker}_benchmark_equity.{data_format}"
+    if data_format == "parquet":
+        df.to_parquet(data_path, engine="pyarrow", compression="zstd")
+    else:
+        df.to_csv(data_path)
+    charts["data"] = data_path
 
     return charts
 
@@ -281,73 +463,79 @@ def create_backtest_report(
     ticker: str,
     output_dir: Path,
     strategy_name: str = "Wheel Strategy",
+    image_format: Literal["png", "svg", "pdf"] = "png",
 ) -> dict[str, Path]:
     """Create full backtest report with multiple charts.
 
+    All charts are drawn on one reused figure.
+
     Args:
         backtest_curve: Wheel strategy equity curve
         benchmark_curve: Buy-and-hold equity curve (optional)
         ticker: Stock symbol
         output_dir: Directory to save charts
         strategy_name: Name of strategy for labels
+        image_format: File format for the charts, "png", "svg" or "pdf"
 
     Returns:
         Dictionary mapping chart name to file path
+
+    Raises:
+        ValueError: If image_format is not supported
     """
+    _check_image_format(image_format)
+
     output_dir.mkdir(parents=True, exist_ok=True)
 
     charts = {}
 
-    # Strategy equity curve
-    equity_path = output_dir / f"{ticker}_backtest_equity.png"
-    plot_equity_curve(
-        backtest_curve,
-        title=f"{ticker} {strategy_name} Equity Curve",
-        output_path=equity_path,
-    )
-    charts["equity"] = equity_path
-    plt.close()
-
-    # Strategy drawdown
-    drawdown_path = output_dir / f"{ticker}_backtest_drawdown.png"
-    plot_drawdown(
-        backtest_curve,
-        title=f"{ticker} {strategy_name} Drawdown",
-        output_path=drawdown_path,
-    )
-    charts["drawdown"] = drawdown_path
-    plt.close()
-
-    # Comparison with benchmark (if provided)
-    if benchmark_curve:
-        comparison_path = output_dir / f"{ticker}_strategy_comparison.png"
-        plot_equity_comparison(
-            curves={
-                strategy_name: backtest_curve,
-                "Buy & Hold": benchmark_curve,
-            },
-            title=f"{ticker} Strategy Comparison",
-            output_path=comparison_path,
-        )
-        charts["comparison"] = comparison_path
-        plt.close()
-
-        # Returns comparison
-        returns_path = output_dir / f"{ticker}_returns_comparison.png"
-        plot_returns_comparison(
-            curves={
+    # The strategy charts and the CSV share one conversion of the curve
+    df = backtest_curve.to_dataframe()
+    total = df["total"].to_numpy(dtype=np.float64)
+
+    fig, ax = plt.subplots(figsize=_EQUITY_FIGSIZE, layout="constrained")
+    try:
+        # Strategy equity curve
+        equity_path = output_dir / f"{ticker}_backtest_equity.{image_format}"
+        _draw_equity(ax, df.index, total, f"{ticker} {strategy_name} Equity Curve", downsample=True)
+        _finish(fig, equity_path, show=False)
+        charts["equity"] = equity_path
+
+        # Strategy drawdown
+        drawdown_path = output_dir / f"{ticker}_backtest_drawdown.{image_format}"
+        _reuse(fig, ax, _DRAWDOWN_FIGSIZE)
+        _draw_drawdown(ax, df.index, total, f"{ticker} {strategy_name} Drawdown", downsample=True)
+        _finish(fig, drawdown_path, show=False)
+        charts["drawdown"] = drawdown_path
+
+        # Comparison with benchmark (if provided)
+        if benchmark_curve:
+            curves = {
                 strategy_name: backtest_curve,
                 "Buy & Hold": benchmark_curve,
-            },
-            title=f"{ticker} Returns Comparison",
-            output_path=returns_path,
-        )
-        charts["returns"] = returns_path
-        plt.close()
+            }
+
+            comparison_path = output_dir / f"{ticker}_strategy_comparison.{image_format}"
+            _reuse(fig, ax, _EQUITY_FIGSIZE)
+            _draw_equity_comparison(
+                ax, curves, f"{ticker} Strategy Comparison", downsample=True
+            )
+            _finish(fig, comparison_path, show=False)
+            charts["comparison"] = comparison_path
+
+            # Returns comparison
+            returns_path = output_dir / f"{ticker}_returns_comparison.{image_format}"
+            _reuse(fig, ax, _EQUITY_FIGSIZE)
+            _draw_returns_comparison(
+                ax, curves, f"{ticker} Returns Comparison", downsample=True
+            )
+            _finish(fig, returns_path, show=False)
+            charts["returns"] = returns_path
+    finally:
+        plt.close(fig)
 
     # Save equity data as CSV
     csv_path = output_dir / f"{ticker}_backtest_equity.csv"
-    df = backtest_curve.to_dataframe()
     df.to_csv(csv_path)
     charts["data"] = csv_path
 
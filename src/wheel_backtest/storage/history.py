@@ -7,16 +7,21 @@ different runs over time.
 import json
 import sqlite3
 import subprocess
-from dataclasses import asdict, dataclass
+import threading
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, fields
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterable, Iterator, Mapping, Optional
+
+import pandas as pd
 
 from wheel_backtest.analytics.metrics import PerformanceMetrics
 from wheel_backtest.config import BacktestConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class BacktestRecord:
     """A stored backtest record.
 
@@ -73,10 +78,72 @@ class BacktestRecord:
     transactions_csv_path: Optional[str] = None
 
 
+_INSERT_SQL = """
+    INSERT INTO backtest_history (
+        run_date, ticker, start_date, end_date,
+        initial_capital, final_equity, total_return, total_return_pct,
+        cagr, sharpe_ratio, sortino_ratio, max_drawdown,
+        volatility, win_rate, profit_factor,
+        dte_target, delta_target, commission, total_trades,
+        git_commit, config_json,
+        equity_csv_path, transactions_csv_path
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+# Selected in BacktestRecord field order so rows unpack positionally
+_RECORD_COLUMNS = ", ".join(field.name for field in fields(BacktestRecord))
+
+# Read-only connections kept open between reads
+_READER_POOL_SIZE = 4
+
+_INDEXED_METRICS = ("sharpe_ratio", "cagr", "total_return_pct", "max_drawdown")
+
+_CONFIG_JSON_FIELDS = (
+    "ticker",
+    "start_date",
+    "end_date",
+    "initial_capital",
+    "dte_target",
+    "dte_min",
+    "delta_target",
+    "commission_per_contract",
+    "data_provider",
+)
+
+
+@lru_cache(maxsize=256)
+def _config_json(values: tuple) -> str:
+    """Serialize the stored config fields to JSON.
+
+    Keyed on the field values rather than the config object, so a sweep
+    that saves the same settings repeatedly serializes them once, and a
+    config mutated between saves is never served stale JSON.
+
+    Args:
+        values: Config attribute values, in _CONFIG_JSON_FIELDS order
+
+    Returns:
+        JSON text for the config_json column
+    """
+    config_dict = dict(zip(_CONFIG_JSON_FIELDS, values))
+    for name in ("start_date", "end_date"):
+        config_dict[name] = str(config_dict[name]) if config_dict[name] else None
+    return json.dumps(config_dict)
+
+
 class BacktestHistory:
     """Manage backtest history storage.
 
     Uses SQLite to store backtest results for tracking and comparison.
+    Writes go through one connection per instance, serialized by a lock;
+    reads borrow a read-only connection from a small pool and hand it back
+    when done, so threads that come and go (such as Streamlit's per-rerun
+    script threads) do not leave connections open. The database runs in WAL
+    mode, so saves do not wait on a full sync and readers never block the
+    writer. An instance can therefore be shared across threads, e.g.
+    cached for every Streamlit session. Use it as a context manager, or
+    call close(), to release its connections.
     """
 
     def __init__(self, db_path: Path):
@@ -86,57 +153,114 @@ class BacktestHistory:
             db_path: Path to SQLite database file
         """
         self.db_path = db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-64000;
+        """)
+        self._write_lock = threading.Lock()
+        self._reader_lock = threading.Lock()
+        self._idle_readers: list[sqlite3.Connection] = []
         self._init_database()
 
-    def _init_database(self) -> None:
-        """Initialize database schema if not exists."""
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection for the duration of a read.
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS backtest_history (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                run_date TIMESTAMP NOT NULL,
-                ticker TEXT NOT NULL,
-                start_date TEXT NOT NULL,
-                end_date TEXT NOT NULL,
-                initial_capital REAL NOT NULL,
-                final_equity REAL NOT NULL,
-                total_return REAL NOT NULL,
-                total_return_pct REAL NOT NULL,
-                cagr REAL NOT NULL,
-                sharpe_ratio REAL NOT NULL,
-                sortino_ratio REAL NOT NULL,
-                max_drawdown REAL NOT NULL,
-                volatility REAL NOT NULL,
-                win_rate REAL NOT NULL,
-                profit_factor REAL NOT NULL,
-                dte_target INTEGER NOT NULL,
-                delta_target REAL NOT NULL,
-                commission REAL NOT NULL,
-                total_trades INTEGER NOT NULL,
-                git_commit TEXT,
-                config_json TEXT NOT NULL,
-                equity_csv_path TEXT,
-                transactions_csv_path TEXT
-            )
-        """)
+        Idle connections are reused; at most _READER_POOL_SIZE are kept
+        open between reads and any extra are closed when handed back.
+        """
+        with self._reader_lock:
+            conn = self._idle_readers.pop() if self._idle_readers else None
+        if conn is None:
+            uri = f"{self.db_path.resolve().as_uri()}?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        try:
+            yield conn
+        finally:
+            with self._reader_lock:
+                keep = len(self._idle_readers) < _READER_POOL_SIZE
+                if keep:
+                    self._idle_readers.append(conn)
+            if not keep:
+                conn.close()
+
+    def close(self) -> None:
+        """Close the write connection and the idle read connections."""
+        with self._reader_lock:
+            for conn in self._idle_readers:
+                conn.close()
+            self._idle_readers.clear()
+        with self._write_lock:
+            self._conn.close()
+
+    def __enter__(self) -> "BacktestHistory":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
-        # Create indexes for common queries
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_ticker
-            ON backtest_history(ticker)
-        """)
+    def _init_database(self) -> None:
+        """Initialize database schema if not exists."""
+        with self._conn:
+            cursor = self._conn.cursor()
 
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_run_date
-            ON backtest_history(run_date)
-        """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS backtest_history (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    run_date TIMESTAMP NOT NULL,
+                    ticker TEXT NOT NULL,
+                    start_date TEXT NOT NULL,
+                    end_date TEXT NOT NULL,
+                    initial_capital REAL NOT NULL,
+                    final_equity REAL NOT NULL,
+                    total_return REAL NOT NULL,
+                    total_return_pct REAL NOT NULL,
+                    cagr REAL NOT NULL,
+                    sharpe_ratio REAL NOT NULL,
+                    sortino_ratio REAL NOT NULL,
+                    max_drawdown REAL NOT NULL,
+                    volatility REAL NOT NULL,
+                    win_rate REAL NOT NULL,
+                    profit_factor REAL NOT NULL,
+                    dte_target INTEGER NOT NULL,
+                    delta_target REAL NOT NULL,
+                    commission REAL NOT NULL,
+                    total_trades INTEGER NOT NULL,
+                    git_commit TEXT,
+                    config_json TEXT NOT NULL,
+                    equity_csv_path TEXT,
+                    transactions_csv_path TEXT
+                )
+            """)
+
+            # Create indexes for common queries
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_ticker
+                ON backtest_history(ticker)
+            """)
 
-        conn.commit()
-        conn.close()
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_run_date
+                ON backtest_history(run_date)
+            """)
+
+            # Let get_best_by_metric read the top rows of the hot metrics
+            # straight off an index instead of sorting the whole table
+            for metric in _INDEXED_METRICS:
+                cursor.execute(f"""
+                    CREATE INDEX IF NOT EXISTS idx_ticker_{metric}
+                    ON backtest_history(ticker, {metric} DESC)
+                """)
+                cursor.execute(f"""
+                    CREATE INDEX IF NOT EXISTS idx_{metric}
+                    ON backtest_history({metric} DESC)
+                """)
+
+            cursor.execute("ANALYZE")
 
     def save_backtest(
         self,
@@ -164,36 +288,59 @@ class BacktestHistory:
         Returns:
             Record ID of saved backtest
         """
+        row = self._record_row(
+            config=config,
+            metrics=metrics,
+            start_date=start_date,
+            end_date=end_date,
+            final_equity=final_equity,
+            total_trades=total_trades,
+            git_commit=self._get_git_commit(),
+            equity_csv_path=equity_csv_path,
+            transactions_csv_path=transactions_csv_path,
+        )
+
+        with self._write_lock, self._conn:
+            cursor = self._conn.execute(_INSERT_SQL, row)
+
+        return cursor.lastrowid
+
+    def save_backtests_bulk(self, runs: Iterable[Mapping[str, Any]]) -> int:
+        """Save several backtest results in a single transaction.
+
+        A parameter sweep pays for one commit instead of one per result.
+
+        Args:
+            runs: One mapping per result, holding save_backtest's arguments
+                by keyword
+
+        Returns:
+            Number of records saved
+        """
         git_commit = self._get_git_commit()
+        rows = (self._record_row(git_commit=git_commit, **run) for run in runs)
+
+        with self._write_lock, self._conn:
+            cursor = self._conn.executemany(_INSERT_SQL, rows)
 
-        # Convert config to JSON
-        config_dict = {
-            "ticker": config.ticker,
-            "start_date": str(config.start_date) if config.start_date else None,
-            "end_date": str(config.end_date) if config.end_date else None,
-            "initial_capital": config.initial_capital,
-            "dte_target": config.dte_target,
-            "dte_min": config.dte_min,
-            "delta_target": config.delta_target,
-            "commission_per_contract": config.commission_per_contract,
-            "data_provider": config.data_provider,
-        }
-        config_json = json.dumps(config_dict)
-
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            INSERT INTO backtest_history (
-                run_date, ticker, start_date, end_date,
-                initial_capital, final_equity, total_return, total_return_pct,
-                cagr, sharpe_ratio, sortino_ratio, max_drawdown,
-                volatility, win_rate, profit_factor,
-                dte_target, delta_target, commission, total_trades,
-                git_commit, config_json,
-                equity_csv_path, transactions_csv_path
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        return cursor.rowcount
+
+    @staticmethod
+    def _record_row(
+        config: BacktestConfig,
+        metrics: PerformanceMetrics,
+        start_date: str,
+        end_date: str,
+        final_equity: float,
+        total_trades: int,
+        git_commit: Optional[str],
+        equity_csv_path: Optional[Path] = None,
+        transactions_csv_path: Optional[Path] = None,
+    ) -> tuple:
+        """Build the INSERT parameters for one backtest result."""
+        config_json = _config_json(tuple(getattr(config, name) for name in _CONFIG_JSON_FIELDS))
+
+        return (
             datetime.now(),
             config.ticker,
             start_date,
@@ -217,13 +364,7 @@ class BacktestHistory:
             config_json,
             str(equity_csv_path) if equity_csv_path else None,
             str(transactions_csv_path) if transactions_csv_path else None,
-        ))
-
-        record_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-
-        return record_id
+        )
 
     def get_backtest(self, record_id: int) -> Optional[BacktestRecord]:
         """Retrieve a specific backtest record.
@@ -234,16 +375,10 @@ class BacktestHistory:
         Returns:
             BacktestRecord if found, None otherwise
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT * FROM backtest_history WHERE id = ?
-        """, (record_id,))
-
-        row = cursor.fetchone()
-        conn.close()
+        with self._reader() as conn:
+            row = conn.execute(f"""
+                SELECT {_RECORD_COLUMNS} FROM backtest_history WHERE id = ?
+            """, (record_id,)).fetchone()
 
         if row:
             return self._row_to_record(row)
@@ -265,28 +400,72 @@ class BacktestHistory:
         Returns:
             List of BacktestRecords, ordered by run_date descending
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        with self._reader() as conn:
+            rows = conn.execute(*self._list_query(ticker, limit, offset)).fetchall()
+
+        return [self._row_to_record(row) for row in rows]
 
+    def list_backtests_df(
+        self,
+        ticker: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> pd.DataFrame:
+        """List backtest records as a DataFrame.
+
+        Same rows as list_backtests, read column-wise without building a
+        BacktestRecord per row.
+
+        Args:
+            ticker: Filter by ticker (optional)
+            limit: Maximum number of records to return
+            offset: Number of records to skip
+
+        Returns:
+            DataFrame with one column per BacktestRecord field, ordered by
+            run_date descending
+        """
+        sql, params = self._list_query(ticker, limit, offset)
+        with self._reader() as conn:
+            return pd.read_sql_query(sql, conn, params=params, parse_dates=["run_date"])
+
+    @staticmethod
+    def _list_query(ticker: Optional[str], limit: int, offset: int) -> tuple[str, tuple]:
+        """Build the SQL and parameters shared by the list methods."""
         if ticker:
-            cursor.execute("""
-                SELECT * FROM backtest_history
+            return f"""
+                SELECT {_RECORD_COLUMNS} FROM backtest_history
                 WHERE ticker = ?
                 ORDER BY run_date DESC
                 LIMIT ? OFFSET ?
-            """, (ticker, limit, offset))
-        else:
-            cursor.execute("""
-                SELECT * FROM backtest_history
-                ORDER BY run_date DESC
-                LIMIT ? OFFSET ?
-            """, (limit, offset))
+            """, (ticker, limit, offset)
 
-        rows = cursor.fetchall()
-        conn.close()
+        return f"""
+            SELECT {_RECORD_COLUMNS} FROM backtest_history
+            ORDER BY run_date DESC
+            LIMIT ? OFFSET ?
+        """, (limit, offset)
 
-        return [self._row_to_record(row) for row in rows]
+    def dashboard_stats(self) -> dict[str, Any]:
+        """Summarize the whole history in one aggregate query.
+
+        Returns:
+            Dictionary with total_backtests, tickers_tested, avg_return_pct,
+            avg_sharpe_ratio and best_return_pct. The averages and best
+            return are None when the history is empty.
+        """
+        with self._reader() as conn:
+            cursor = conn.execute("""
+                SELECT
+                    COUNT(*) AS total_backtests,
+                    COUNT(DISTINCT ticker) AS tickers_tested,
+                    AVG(total_return_pct) AS avg_return_pct,
+                    AVG(sharpe_ratio) AS avg_sharpe_ratio,
+                    MAX(total_return_pct) AS best_return_pct
+                FROM backtest_history
+            """)
+            names = [column[0] for column in cursor.description]
+            return dict(zip(names, cursor.fetchone()))
 
     def get_best_by_metric(
         self,
@@ -313,28 +492,24 @@ class BacktestHistory:
         if metric not in valid_metrics:
             raise ValueError(f"Invalid metric: {metric}. Must be one of {valid_metrics}")
 
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
         if ticker:
             query = f"""
-                SELECT * FROM backtest_history
+                SELECT {_RECORD_COLUMNS} FROM backtest_history
                 WHERE ticker = ?
                 ORDER BY {metric} DESC
                 LIMIT ?
             """
-            cursor.execute(query, (ticker, limit))
+            params: tuple = (ticker, limit)
         else:
             query = f"""
-                SELECT * FROM backtest_history
+                SELECT {_RECORD_COLUMNS} FROM backtest_history
                 ORDER BY {metric} DESC
                 LIMIT ?
             """
-            cursor.execute(query, (limit,))
+            params = (limit,)
 
-        rows = cursor.fetchall()
-        conn.close()
+        with self._reader() as conn:
+            rows = conn.execute(query, params).fetchall()
 
         return [self._row_to_record(row) for row in rows]
 
@@ -347,51 +522,25 @@ class BacktestHistory:
         Returns:
             True if deleted, False if not found
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            DELETE FROM backtest_history WHERE id = ?
-        """, (record_id,))
-
-        deleted = cursor.rowcount > 0
-        conn.commit()
-        conn.close()
-
-        return deleted
-
-    def _row_to_record(self, row: sqlite3.Row) -> BacktestRecord:
-        """Convert database row to BacktestRecord."""
-        return BacktestRecord(
-            id=row['id'],
-            run_date=datetime.fromisoformat(row['run_date']),
-            ticker=row['ticker'],
-            start_date=row['start_date'],
-            end_date=row['end_date'],
-            initial_capital=row['initial_capital'],
-            final_equity=row['final_equity'],
-            total_return=row['total_return'],
-            total_return_pct=row['total_return_pct'],
-            cagr=row['cagr'],
-            sharpe_ratio=row['sharpe_ratio'],
-            sortino_ratio=row['sortino_ratio'],
-            max_drawdown=row['max_drawdown'],
-            volatility=row['volatility'],
-            win_rate=row['win_rate'],
-            profit_factor=row['profit_factor'],
-            dte_target=row['dte_target'],
-            delta_target=row['delta_target'],
-            commission=row['commission'],
-            total_trades=row['total_trades'],
-            git_commit=row['git_commit'],
-            config_json=row['config_json'],
-            equity_csv_path=row['equity_csv_path'],
-            transactions_csv_path=row['transactions_csv_path'],
-        )
+        with self._write_lock, self._conn:
+            cursor = self._conn.execute("""
+                DELETE FROM backtest_history WHERE id = ?
+            """, (record_id,))
+
+        return cursor.rowcount > 0
 
-    def _get_git_commit(self) -> Optional[str]:
+    def _row_to_record(self, row: tuple) -> BacktestRecord:
+        """Convert a row selected with _RECORD_COLUMNS to a BacktestRecord."""
+        return BacktestRecord(row[0], datetime.fromisoformat(row[1]), *row[2:])
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _get_git_commit() -> Optional[str]:
         """Get current git commit hash if available.
 
+        The checkout does not move while the process runs, so git is only
+        asked once.
+
         Returns:
             Git commit hash or None
         """
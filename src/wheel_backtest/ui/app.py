@@ -7,7 +7,7 @@ from datetime import date, datetime
 from pathlib import Path
 
 import streamlit as st
-from wheel_backtest.ui.utils import get_history
+from wheel_backtest.ui.utils import dashboard_stats, recent_backtests
 
 # Page configuration
 st.set_page_config(
@@ -67,31 +67,16 @@ def main():
         st.header("📋 Recent Backtests")
 
         try:
-            history = get_history()
-            records = history.list_backtests(limit=10)
-
-            if records:
-                # Create summary table
-                data = []
-                for record in records:
-                    data.append({
-                        "ID": record.id,
-                        "Date": record.run_date.strftime("%Y-%m-%d %H:%M"),
-                        "Ticker": record.ticker,
-                        "Period": f"{record.start_date} to {record.end_date}",
-                        "Return": f"{record.total_return_pct:.2f}%",
-                        "CAGR": f"{record.cagr:.2f}%",
-                        "Sharpe": f"{record.sharpe_ratio:.2f}",
-                        "Max DD": f"{record.max_drawdown:.2f}%",
-                    })
+            data = recent_backtests()
 
+            if not data.empty:
                 st.dataframe(
                     data,
                     use_container_width=True,
                     hide_index=True,
                 )
 
-                st.markdown(f"*Showing {len(records)} most recent backtests*")
+                st.markdown(f"*Showing {len(data)} most recent backtests*")
             else:
                 st.info("No backtests found. Run your first backtest to get started!")
 
@@ -102,23 +87,14 @@ def main():
         st.header("📈 Quick Stats")
 
         try:
-            history = get_history()
-            all_records = history.list_backtests(limit=1000)
-
-            if all_records:
-                # Calculate aggregate stats
-                avg_return = sum(r.total_return_pct for r in all_records) / len(all_records)
-                avg_sharpe = sum(r.sharpe_ratio for r in all_records) / len(all_records)
-                best_return = max(r.total_return_pct for r in all_records)
-
-                # Count tickers
-                tickers = set(r.ticker for r in all_records)
-
-                st.metric("Total Backtests", len(all_records))
-                st.metric("Tickers Tested", len(tickers))
-                st.metric("Avg Return", f"{avg_return:.2f}%")
-                st.metric("Avg Sharpe Ratio", f"{avg_sharpe:.2f}")
-                st.metric("Best Return", f"{best_return:.2f}%")
+            stats = dashboard_stats()
+
+            if stats["total_backtests"]:
+                st.metric("Total Backtests", stats["total_backtests"])
+                st.metric("Tickers Tested", stats["tickers_tested"])
+                st.metric("Avg Return", f"{stats['avg_return_pct']:.2f}%")
+                st.metric("Avg Sharpe Ratio", f"{stats['avg_sharpe_ratio']:.2f}")
+                st.metric("Best Return", f"{stats['best_return_pct']:.2f}%")
 
             else:
                 st.info("Run backtests to see statistics")
@@ -4,8 +4,10 @@ Inspired by tastytrade's interface design for options backtesting.
 """
 
 from datetime import date
-from typing import Optional
+from pathlib import Path
+from typing import Optional, Sequence
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import streamlit as st
@@ -16,6 +18,11 @@ from wheel_backtest.analytics.metrics import MetricsCalculator, PerformanceMetri
 from wheel_backtest.config import BacktestConfig
 from wheel_backtest.data import DataCache, YFinanceProvider
 from wheel_backtest.engine.backtest import BacktestResult
+from wheel_backtest.engine.wheel import WheelEvent
+from wheel_backtest.reports import lttb_indices
+
+# Points per line trace sent to the browser; more only overdraw
+LINE_POINTS = 1000
 
 
 def display_results_tabs(result: BacktestResult, transactions_df: pd.DataFrame):
@@ -26,34 +33,19 @@ def display_results_tabs(result: BacktestResult, transactions_df: pd.DataFrame):
         transactions_df: DataFrame with all transactions
     """
     # Calculate the actual capital used by the wheel strategy
-    # This is the capital needed to secure 1 contract initially
+    # This is the capital needed to secure 1 contract initially; computed
+    # once here and passed to every tab
     used_capital = _calculate_used_capital(result, transactions_df)
 
     # Calculate buy-and-hold benchmark using the same capital as wheel strategy
-    cache = DataCache(result.config.cache_dir)
-    yf_provider = YFinanceProvider(cache)
-    benchmark_calc = BuyAndHoldBenchmark(yf_provider)
-
-    benchmark_curve = benchmark_calc.calculate(
-        ticker=result.ticker,
-        start_date=result.start_date,
-        end_date=result.end_date,
-        initial_capital=used_capital,
+    benchmark_curve, benchmark_metrics = _compute_benchmark(
+        result.ticker,
+        result.start_date,
+        result.end_date,
+        used_capital,
+        result.config.cache_dir,
     )
 
-    # Calculate benchmark metrics using the same capital as wheel strategy
-    benchmark_df = benchmark_curve.to_dataframe()
-    if not benchmark_df.empty:
-        metrics_calc = MetricsCalculator()
-        benchmark_metrics = metrics_calc.calculate(
-            equity_curve=benchmark_curve,
-            start_date=result.start_date,
-            end_date=result.end_date,
-            initial_capital=used_capital,
-        )
-    else:
-        benchmark_metrics = None
-
     # Create tabs
     tab1, tab2, tab3 = st.tabs(["📊 Summary", "📈 Details", "📋 Logs"])
 
@@ -61,10 +53,60 @@ def display_results_tabs(result: BacktestResult, transactions_df: pd.DataFrame):
         _display_summary_tab(result, benchmark_curve, benchmark_metrics, used_capital)
 
     with tab2:
-        _display_details_tab(result, transactions_df)
+        _display_details_tab(result, transactions_df, used_capital)
 
     with tab3:
-        _display_logs_tab(result, transactions_df)
+        _display_logs_tab(result, transactions_df, used_capital)
+
+
+@st.cache_resource
+def _get_benchmark_calc(cache_dir: Path) -> BuyAndHoldBenchmark:
+    """Build the benchmark calculator once per cache directory.
+
+    The provider and its on-disk price cache then persist across reruns.
+    """
+    return BuyAndHoldBenchmark(YFinanceProvider(DataCache(cache_dir)))
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _compute_benchmark(
+    ticker: str,
+    start_date: date,
+    end_date: date,
+    initial_capital: float,
+    cache_dir: Path,
+) -> tuple[EquityCurve, Optional[PerformanceMetrics]]:
+    """Buy-and-hold curve and metrics, cached across Streamlit reruns.
+
+    Args:
+        ticker: Stock symbol
+        start_date: Backtest start date
+        end_date: Backtest end date
+        initial_capital: Capital invested in the benchmark
+        cache_dir: Data cache directory for the price provider
+
+    Returns:
+        Tuple of (benchmark curve, benchmark metrics or None if the curve
+        is empty)
+    """
+    benchmark_curve = _get_benchmark_calc(cache_dir).calculate(
+        ticker=ticker,
+        start_date=start_date,
+        end_date=end_date,
+        initial_capital=initial_capital,
+    )
+
+    # Calculate benchmark metrics using the same capital as wheel strategy
+    if len(benchmark_curve) == 0:
+        return benchmark_curve, None
+
+    benchmark_metrics = MetricsCalculator().calculate(
+        equity_curve=benchmark_curve,
+        start_date=start_date,
+        end_date=end_date,
+        initial_capital=initial_capital,
+    )
+    return benchmark_curve, benchmark_metrics
 
 
 def _display_summary_tab(
@@ -103,7 +145,7 @@ def _display_summary_tab(
 
     # Dual-axis chart: Strategy equity vs Underlying price
     st.subheader("Performance Comparison")
-    _display_dual_axis_chart(result, benchmark_curve)
+    _display_dual_axis_chart(result, benchmark_curve, used_capital)
 
     st.markdown("---")
 
@@ -175,11 +217,10 @@ def _display_summary_tab(
             st.info("Benchmark metrics not available")
 
 
-def _display_details_tab(result: BacktestResult, transactions_df: pd.DataFrame):
+def _display_details_tab(
+    result: BacktestResult, transactions_df: pd.DataFrame, used_capital: float
+):
     """Display details tab with trade-by-trade profit/loss and detailed stats."""
-    # Calculate used capital
-    used_capital = _calculate_used_capital(result, transactions_df)
-
     # Trade-by-trade profit/loss chart
     st.subheader("Profit/Loss for All Trades")
     _display_trade_pnl_chart(transactions_df)
@@ -187,16 +228,17 @@ def _display_details_tab(result: BacktestResult, transactions_df: pd.DataFrame):
     st.markdown("---")
 
     # Detailed statistics grid
+    trade_stats = _trade_value_stats(transactions_df)
     col1, col2, col3 = st.columns(3)
 
     with col1:
         st.metric("Number of trades", result.summary.get("total_puts_sold", 0) + result.summary.get("total_calls_sold", 0))
-        st.metric("Trades with profits", _count_profitable_trades(transactions_df))
+        st.metric("Trades with profits", trade_stats["n_wins"])
         st.metric("Profit rate", f"{result.metrics.win_rate:.2f}%")
-        st.metric("Largest individual profit", f"${_get_largest_profit(transactions_df):,.2f}")
-        st.metric("Trades with losses", _count_losing_trades(transactions_df))
+        st.metric("Largest individual profit", f"${trade_stats['largest_profit']:,.2f}")
+        st.metric("Trades with losses", trade_stats["n_losses"])
         st.metric("Loss rate", f"{100 - result.metrics.win_rate:.2f}%")
-        st.metric("Largest individual loss", f"${_get_largest_loss(transactions_df):,.2f}")
+        st.metric("Largest individual loss", f"${trade_stats['largest_loss']:,.2f}")
 
     with col2:
         premium_collected = result.summary.get("total_premium_collected", 0)
@@ -208,8 +250,8 @@ def _display_details_tab(result: BacktestResult, transactions_df: pd.DataFrame):
         st.metric("Avg. BPR per trade", "N/A")  # TODO: Calculate buying power reduction
         st.metric("Avg. premium", f"${avg_premium:,.2f}")
         st.metric("Avg. profit/loss per trade", f"${result.metrics.total_return / num_trades if num_trades > 0 else 0:,.2f}")
-        st.metric("Avg. win size", f"${_get_avg_win(transactions_df):,.2f}")
-        st.metric("Avg. loss size", f"${_get_avg_loss(transactions_df):,.2f}")
+        st.metric("Avg. win size", f"${trade_stats['avg_win']:,.2f}")
+        st.metric("Avg. loss size", f"${trade_stats['avg_loss']:,.2f}")
 
     with col3:
         st.metric("Total profit/loss", f"${result.metrics.total_return:,.2f}")
@@ -221,16 +263,15 @@ def _display_details_tab(result: BacktestResult, transactions_df: pd.DataFrame):
         st.metric("Max drawdown", f"{result.metrics.max_drawdown:.2f}%")
 
 
-def _display_logs_tab(result: BacktestResult, transactions_df: pd.DataFrame):
+def _display_logs_tab(
+    result: BacktestResult, transactions_df: pd.DataFrame, used_capital: float
+):
     """Display logs tab with transaction table."""
-    # Calculate used capital
-    used_capital = _calculate_used_capital(result, transactions_df)
-
     st.subheader("Trades")
 
     # Add download button
     if not transactions_df.empty:
-        csv = transactions_df.to_csv(index=False).encode('utf-8')
+        csv = _df_to_csv_bytes(transactions_df)
         st.download_button(
             "📥 Download trades",
             csv,
@@ -270,10 +311,17 @@ def _display_logs_tab(result: BacktestResult, transactions_df: pd.DataFrame):
         st.info("No transactions recorded")
 
 
-def _display_dual_axis_chart(result: BacktestResult, benchmark_curve: EquityCurve):
+@st.cache_data(max_entries=16, show_spinner=False)
+def _df_to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """CSV download payload, encoded once per distinct frame across reruns."""
+    return df.to_csv(index=False).encode("utf-8")
+
+
+def _display_dual_axis_chart(
+    result: BacktestResult, benchmark_curve: EquityCurve, used_capital: float
+):
     """Display dual-axis chart with strategy equity and underlying price."""
-    # Calculate used capital for normalization
-    used_capital = _calculate_used_capital(result, pd.DataFrame())
+    # Normalize by the capital left idle by the strategy
     unused_capital = result.initial_capital - used_capital
 
     # Prepare data
@@ -300,37 +348,69 @@ def _display_dual_axis_chart(result: BacktestResult, benchmark_curve: EquityCurv
         st.error("Benchmark data missing required columns")
         return
 
-    # Normalize wheel strategy equity by subtracting unused capital
-    # This makes both strategies start from the same capital base
-    equity_df["total_adjusted"] = equity_df["total"] - unused_capital
+    fig = _build_dual_axis_figure(
+        equity_df, benchmark_df, tuple(result.events), unused_capital
+    )
+    st.plotly_chart(fig, use_container_width=True)
 
-    # Create figure with single y-axis
-    fig = go.Figure()
 
-    # Add buy & hold equity (gray, in background)
-    fig.add_trace(
-        go.Scatter(
-            x=benchmark_df["date"],
-            y=benchmark_df["total"],
+@st.cache_resource(max_entries=16, show_spinner=False)
+def _build_dual_axis_figure(
+    equity_df: pd.DataFrame,
+    benchmark_df: pd.DataFrame,
+    events: tuple[WheelEvent, ...],
+    unused_capital: float,
+) -> go.Figure:
+    """Build the strategy vs buy-and-hold figure.
+
+    Cached on the content of its inputs, so reruns that only switch tabs
+    or move unrelated widgets reuse the built figure. The figure is shared
+    between sessions and must not be modified by callers.
+
+    Args:
+        equity_df: Strategy equity with "date" and "total" columns
+        benchmark_df: Benchmark equity with "date" and "total" columns
+        events: Strategy events to mark on the chart
+        unused_capital: Capital the strategy never deployed, subtracted
+            from its equity so both lines start from the same base
+
+    Returns:
+        Plotly figure
+    """
+    # Normalize wheel strategy equity by subtracting unused capital
+    # This makes both strategies start from the same capital base
+    equity_df = equity_df.assign(total_adjusted=equity_df["total"] - unused_capital)
+
+    # Lines are thinned to a screen's worth of shape-preserving points and
+    # drawn with WebGL; the markers below still use the full-resolution equity
+    benchmark_line = _downsample_line(benchmark_df, "total")
+    equity_line = _downsample_line(equity_df, "total_adjusted")
+
+    traces = [
+        # Buy & hold equity (gray, in background)
+        go.Scattergl(
+            x=benchmark_line["date"],
+            y=benchmark_line["total"],
             name="Buy & Hold",
             line=dict(color="#999999", width=2),
             mode="lines",
-        )
-    )
-
-    # Add strategy equity (orange, in foreground) - using adjusted values
-    fig.add_trace(
-        go.Scatter(
-            x=equity_df["date"],
-            y=equity_df["total_adjusted"],
+        ),
+        # Strategy equity (orange, in foreground) - using adjusted values
+        go.Scattergl(
+            x=equity_line["date"],
+            y=equity_line["total_adjusted"],
             name="Wheel Strategy",
             line=dict(color="#FF6B35", width=2),
             mode="lines",
-        )
-    )
+        ),
+    ]
+
+    # Trade markers from events (using adjusted equity)
+    traces += _trade_marker_traces(events, equity_df, use_adjusted=True)
 
-    # Add trade markers from events (using adjusted equity)
-    _add_trade_markers(fig, result, equity_df, use_adjusted=True)
+    # Create figure with single y-axis, adding every trace in one call
+    fig = go.Figure()
+    fig.add_traces(traces)
 
     # Update layout
     fig.update_layout(
@@ -350,7 +430,22 @@ def _display_dual_axis_chart(result: BacktestResult, benchmark_curve: EquityCurv
     fig.update_xaxes(title_text="Date", showgrid=True, gridcolor="#f0f0f0")
     fig.update_yaxes(title_text="Portfolio Value ($)", showgrid=True, gridcolor="#f0f0f0")
 
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
+
+
+def _downsample_line(df: pd.DataFrame, column: str) -> pd.DataFrame:
+    """Rows of df to draw as a line, at most LINE_POINTS of them.
+
+    Args:
+        df: Frame with a "date" column and the plotted column
+        column: Column whose shape the kept points preserve (LTTB)
+
+    Returns:
+        df itself if short enough, otherwise the selected rows
+    """
+    if len(df) <= LINE_POINTS:
+        return df
+    return df.iloc[lttb_indices(df[column].to_numpy(dtype=np.float64), LINE_POINTS)]
 
 
 def _display_trade_pnl_chart(transactions_df: pd.DataFrame):
@@ -366,25 +461,33 @@ def _display_trade_pnl_chart(transactions_df: pd.DataFrame):
 
     # Extract profit/loss per trade
     # For simplicity, we'll use the 'value' column when action contains 'expired' or 'assigned'
-    pnl_data = []
-
-    for idx, row in transactions_df.iterrows():
-        if "expired" in row["action"].lower() or "assigned" in row["action"].lower():
-            pnl = row["value"]
-            pnl_data.append({
-                "date": row["date"],
-                "pnl": pnl,
-                "action": row["action"],
-            })
-
-    if not pnl_data:
+    completed = transactions_df["action"].str.contains(
+        "expired|assigned", case=False, regex=True, na=False
+    )
+    pnl_df = transactions_df.loc[completed, ["date", "value", "action"]].rename(
+        columns={"value": "pnl"}
+    )
+
+    if pnl_df.empty:
         st.info("No completed trades to display")
         return
 
-    pnl_df = pd.DataFrame(pnl_data)
+    fig = _build_trade_pnl_figure(pnl_df)
+    st.plotly_chart(fig, use_container_width=True)
+
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def _build_trade_pnl_figure(pnl_df: pd.DataFrame) -> go.Figure:
+    """Build the trade-by-trade P&L bar chart, cached on pnl_df's content.
+
+    Args:
+        pnl_df: Completed trades with "date" and "pnl" columns
 
+    Returns:
+        Plotly figure, shared between sessions and not to be modified
+    """
     # Create bar chart
-    colors = ["#00C853" if pnl >= 0 else "#FF1744" for pnl in pnl_df["pnl"]]
+    colors = np.where(pnl_df["pnl"].to_numpy() >= 0, "#00C853", "#FF1744")
 
     fig = go.Figure(data=[
         go.Bar(
@@ -407,7 +510,7 @@ def _display_trade_pnl_chart(transactions_df: pd.DataFrame):
     fig.update_xaxes(showgrid=True, gridcolor="#f0f0f0")
     fig.update_yaxes(showgrid=True, gridcolor="#f0f0f0", zeroline=True, zerolinecolor="#666")
 
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
 
 def _calculate_used_capital(result: BacktestResult, transactions_df: pd.DataFrame) -> float:
@@ -454,181 +557,95 @@ def _calculate_used_capital(result: BacktestResult, transactions_df: pd.DataFram
     return result.initial_capital
 
 
-def _add_trade_markers(fig: go.Figure, result: BacktestResult, equity_df: pd.DataFrame, use_adjusted: bool = False):
-    """Add markers for trade events on the chart.
+# Marker trace per event type: (legend name, color, symbol, size)
+_TRADE_MARKERS = {
+    "sell_put": ("Sell Put", "#FF1744", "circle", 10),
+    "sell_call": ("Sell Call", "#00C853", "circle", 10),
+    "put_assigned": ("Put Assigned", "#FF1744", "triangle-down", 12),
+    "call_assigned": ("Call Assigned", "#00C853", "triangle-up", 12),
+}
+
+_SALE_HOVER = (
+    "Strike: $%{customdata[0]:.2f}<br>"
+    "Premium: $%{customdata[1]:.2f}<br>"
+    "Delta: %{customdata[2]:.2f}<br>"
+    "DTE: %{customdata[3]}<br>"
+)
+
+_ASSIGNMENT_HOVER = "Strike: $%{customdata[0]:.2f}<br>"
+
+
+def _trade_marker_traces(
+    events: Sequence[WheelEvent], equity_df: pd.DataFrame, use_adjusted: bool = False
+) -> list[go.Scattergl]:
+    """Build marker traces for trade events on the chart.
+
+    Events are joined to the equity curve by date in one lookup, then
+    split into one trace per event type.
 
     Args:
-        fig: Plotly figure to add markers to
-        result: Backtest result with events
+        events: Strategy events to mark
         equity_df: Equity dataframe for getting y-values
         use_adjusted: Whether to use adjusted equity values
+
+    Returns:
+        One WebGL scatter trace per event type present
     """
-    # Convert equity_df date to datetime for matching
-    equity_df["date"] = pd.to_datetime(equity_df["date"])
+    events = [e for e in events if e.event_type in _TRADE_MARKERS]
+    if not events:
+        return []
 
     # Determine which equity column to use
     equity_col = "total_adjusted" if use_adjusted and "total_adjusted" in equity_df.columns else "total"
-
-    # Extract trade events
-    put_sales = []
-    call_sales = []
-    put_assignments = []
-    call_assignments = []
-
-    for event in result.events:
-        event_date = pd.Timestamp(event.date)
-
-        # Find equity value at this date
-        equity_at_date = equity_df[equity_df["date"] == event_date]
-        if equity_at_date.empty:
+    equity = pd.Series(
+        equity_df[equity_col].to_numpy(), index=pd.to_datetime(equity_df["date"])
+    )
+    equity = equity[~equity.index.duplicated()]
+
+    events_df = pd.DataFrame({
+        "date": pd.to_datetime([e.date for e in events]),
+        "event_type": [e.event_type for e in events],
+        "strike": [e.details.get("strike", "N/A") for e in events],
+        "premium": [e.details.get("premium", 0.0) for e in events],
+        "delta": [e.details.get("delta", "N/A") for e in events],
+        "dte": [e.details.get("dte", "N/A") for e in events],
+    })
+    # Find equity value at each event date; events off the curve are skipped
+    events_df["equity"] = equity.reindex(events_df["date"]).to_numpy()
+    events_df = events_df.dropna(subset=["equity"])
+
+    groups = dict(tuple(events_df.groupby("event_type", sort=False)))
+    traces = []
+    for event_type, (name, color, symbol, size) in _TRADE_MARKERS.items():
+        group = groups.get(event_type)
+        if group is None:
             continue
 
-        equity_value = equity_at_date.iloc[0][equity_col]
-
-        # Extract details
-        details = event.details
-        strike = details.get("strike", "N/A")
-        premium = details.get("premium", 0.0)
-        dte = details.get("dte", "N/A")
-        delta = details.get("delta", "N/A")
-
-        # Categorize events
-        if event.event_type == "sell_put":
-            put_sales.append({
-                "date": event_date,
-                "equity": equity_value,
-                "strike": strike,
-                "premium": premium,
-                "delta": delta,
-                "dte": dte,
-            })
-        elif event.event_type == "sell_call":
-            call_sales.append({
-                "date": event_date,
-                "equity": equity_value,
-                "strike": strike,
-                "premium": premium,
-                "delta": delta,
-                "dte": dte,
-            })
-        elif event.event_type == "put_assigned":
-            put_assignments.append({
-                "date": event_date,
-                "equity": equity_value,
-                "strike": strike,
-            })
-        elif event.event_type == "call_assigned":
-            call_assignments.append({
-                "date": event_date,
-                "equity": equity_value,
-                "strike": strike,
-            })
-
-    # Add put sales markers (red circles)
-    if put_sales:
-        put_df = pd.DataFrame(put_sales)
-        fig.add_trace(
-            go.Scatter(
-                x=put_df["date"],
-                y=put_df["equity"],
+        is_sale = event_type.startswith("sell_")
+        columns = ["strike", "premium", "delta", "dte"] if is_sale else ["strike"]
+        traces.append(
+            go.Scattergl(
+                x=group["date"],
+                y=group["equity"],
                 mode="markers",
-                name="Sell Put",
+                name=name,
                 marker=dict(
-                    size=10,
-                    color="#FF1744",
-                    symbol="circle",
+                    size=size,
+                    color=color,
+                    symbol=symbol,
                     line=dict(width=2, color="white"),
                 ),
                 hovertemplate=(
-                    "<b>Sell Put</b><br>"
+                    f"<b>{name}</b><br>"
                     "Date: %{x}<br>"
-                    "Strike: $%{customdata[0]:.2f}<br>"
-                    "Premium: $%{customdata[1]:.2f}<br>"
-                    "Delta: %{customdata[2]:.2f}<br>"
-                    "DTE: %{customdata[3]}<br>"
-                    "<extra></extra>"
+                    + (_SALE_HOVER if is_sale else _ASSIGNMENT_HOVER)
+                    + "<extra></extra>"
                 ),
-                customdata=put_df[["strike", "premium", "delta", "dte"]].values,
+                customdata=group[columns].infer_objects().values,
             )
         )
 
-    # Add call sales markers (green circles)
-    if call_sales:
-        call_df = pd.DataFrame(call_sales)
-        fig.add_trace(
-            go.Scatter(
-                x=call_df["date"],
-                y=call_df["equity"],
-                mode="markers",
-                name="Sell Call",
-                marker=dict(
-                    size=10,
-                    color="#00C853",
-                    symbol="circle",
-                    line=dict(width=2, color="white"),
-                ),
-                hovertemplate=(
-                    "<b>Sell Call</b><br>"
-                    "Date: %{x}<br>"
-                    "Strike: $%{customdata[0]:.2f}<br>"
-                    "Premium: $%{customdata[1]:.2f}<br>"
-                    "Delta: %{customdata[2]:.2f}<br>"
-                    "DTE: %{customdata[3]}<br>"
-                    "<extra></extra>"
-                ),
-                customdata=call_df[["strike", "premium", "delta", "dte"]].values,
-            )
-        )
-
-    # Add put assignment markers (red triangles down)
-    if put_assignments:
-        put_assign_df = pd.DataFrame(put_assignments)
-        fig.add_trace(
-            go.Scatter(
-                x=put_assign_df["date"],
-                y=put_assign_df["equity"],
-                mode="markers",
-                name="Put Assigned",
-                marker=dict(
-                    size=12,
-                    color="#FF1744",
-                    symbol="triangle-down",
-                    line=dict(width=2, color="white"),
-                ),
-                hovertemplate=(
-                    "<b>Put Assigned</b><br>"
-                    "Date: %{x}<br>"
-                    "Strike: $%{customdata[0]:.2f}<br>"
-                    "<extra></extra>"
-                ),
-                customdata=put_assign_df[["strike"]].values,
-            )
-        )
-
-    # Add call assignment markers (green triangles up)
-    if call_assignments:
-        call_assign_df = pd.DataFrame(call_assignments)
-        fig.add_trace(
-            go.Scatter(
-                x=call_assign_df["date"],
-                y=call_assign_df["equity"],
-                mode="markers",
-                name="Call Assigned",
-                marker=dict(
-                    size=12,
-                    color="#00C853",
-                    symbol="triangle-up",
-                    line=dict(width=2, color="white"),
-                ),
-                hovertemplate=(
-                    "<b>Call Assigned</b><br>"
-                    "Date: %{x}<br>"
-                    "Strike: $%{customdata[0]:.2f}<br>"
-                    "<extra></extra>"
-                ),
-                customdata=call_assign_df[["strike"]].values,
-            )
-        )
+    return traces
 
 
 def _display_metric_card(label: str, value: str, color: str = "black"):
@@ -660,6 +677,16 @@ def _display_metric_row(label: str, value: str, subtext: str = ""):
     """, unsafe_allow_html=True)
 
 
+# Display format per money column, applied with str.format
+_DISPLAY_FORMATS = {
+    "price": "${:.2f}",
+    "value": "${:,.2f}",
+    "commission": "${:.2f}",
+    "cash_after": "${:,.0f}",
+    "equity_after": "${:,.0f}",
+}
+
+
 def _prepare_transactions_for_display(transactions_df: pd.DataFrame) -> pd.DataFrame:
     """Prepare transactions dataframe for display."""
     display_df = transactions_df.copy()
@@ -668,27 +695,21 @@ def _prepare_transactions_for_display(transactions_df: pd.DataFrame) -> pd.DataF
     if "date" in display_df.columns:
         display_df["date"] = pd.to_datetime(display_df["date"]).dt.strftime("%Y-%m-%d")
 
-    if "price" in display_df.columns:
-        display_df["price"] = display_df["price"].apply(lambda x: f"${x:.2f}")
-
-    if "value" in display_df.columns:
-        display_df["value"] = display_df["value"].apply(lambda x: f"${x:,.2f}")
-
-    if "commission" in display_df.columns:
-        display_df["commission"] = display_df["commission"].apply(lambda x: f"${x:.2f}")
-
-    if "cash_after" in display_df.columns:
-        display_df["cash_after"] = display_df["cash_after"].apply(lambda x: f"${x:,.0f}")
-
-    if "equity_after" in display_df.columns:
-        display_df["equity_after"] = display_df["equity_after"].apply(lambda x: f"${x:,.0f}")
+    for column, spec in _DISPLAY_FORMATS.items():
+        if column in display_df.columns:
+            display_df[column] = display_df[column].map(spec.format)
 
     if "delta" in display_df.columns:
         display_df["delta"] = display_df["delta"].apply(lambda x: f"{x:.2f}" if pd.notna(x) and x != "N/A" else "N/A")
 
     # Add visual indicator for assignments
     if "action" in display_df.columns:
-        display_df["action"] = display_df["action"].apply(_format_action_with_indicator)
+        actions = display_df["action"]
+        assigned = actions.str.contains("assigned", case=False, na=False)
+        expired = actions.str.contains("expired", case=False, na=False)
+        display_df["action"] = np.where(
+            assigned, "⚠️ " + actions, np.where(expired, "✓ " + actions, actions)
+        )
 
     # Rename columns
     column_map = {
@@ -710,77 +731,30 @@ def _prepare_transactions_for_display(transactions_df: pd.DataFrame) -> pd.DataF
     return display_df
 
 
-def _format_action_with_indicator(action: str) -> str:
-    """Format action with visual indicator for assignments."""
-    if "assigned" in action.lower():
-        return f"⚠️ {action}"
-    elif "expired" in action.lower():
-        return f"✓ {action}"
-    else:
-        return action
-
-
-def _count_profitable_trades(transactions_df: pd.DataFrame) -> int:
-    """Count number of profitable trades."""
-    if transactions_df.empty or "value" not in transactions_df.columns:
-        return 0
-
-    # Count trades where value is positive (profit)
-    return len(transactions_df[transactions_df["value"] > 0])
-
-
-def _count_losing_trades(transactions_df: pd.DataFrame) -> int:
-    """Count number of losing trades."""
-    if transactions_df.empty or "value" not in transactions_df.columns:
-        return 0
-
-    # Count trades where value is negative (loss)
-    return len(transactions_df[transactions_df["value"] < 0])
-
-
-def _get_largest_profit(transactions_df: pd.DataFrame) -> float:
-    """Get largest individual profit."""
-    if transactions_df.empty or "value" not in transactions_df.columns:
-        return 0.0
-
-    profitable = transactions_df[transactions_df["value"] > 0]
-    if profitable.empty:
-        return 0.0
-
-    return profitable["value"].max()
-
-
-def _get_largest_loss(transactions_df: pd.DataFrame) -> float:
-    """Get largest individual loss."""
-    if transactions_df.empty or "value" not in transactions_df.columns:
-        return 0.0
-
-    losing = transactions_df[transactions_df["value"] < 0]
-    if losing.empty:
-        return 0.0
-
-    return abs(losing["value"].min())
-
-
-def _get_avg_win(transactions_df: pd.DataFrame) -> float:
-    """Get average win size."""
-    if transactions_df.empty or "value" not in transactions_df.columns:
-        return 0.0
-
-    profitable = transactions_df[transactions_df["value"] > 0]
-    if profitable.empty:
-        return 0.0
-
-    return profitable["value"].mean()
+def _trade_value_stats(transactions_df: pd.DataFrame) -> dict[str, float]:
+    """Win/loss statistics over the transaction values in a single pass.
 
+    Args:
+        transactions_df: DataFrame with all transactions
 
-def _get_avg_loss(transactions_df: pd.DataFrame) -> float:
-    """Get average loss size."""
+    Returns:
+        Dictionary with n_wins, n_losses, largest_profit, largest_loss,
+        avg_win and avg_loss. Loss figures are reported as positive sizes
+        and every statistic is 0 when there are no matching trades.
+    """
     if transactions_df.empty or "value" not in transactions_df.columns:
-        return 0.0
-
-    losing = transactions_df[transactions_df["value"] < 0]
-    if losing.empty:
-        return 0.0
-
-    return abs(losing["value"].mean())
+        values = np.empty(0)
+    else:
+        values = transactions_df["value"].to_numpy(dtype=np.float64)
+
+    wins = values[values > 0]
+    losses = values[values < 0]
+
+    return {
+        "n_wins": wins.size,
+        "n_losses": losses.size,
+        "largest_profit": float(wins.max()) if wins.size else 0.0,
+        "largest_loss": float(-losses.min()) if losses.size else 0.0,
+        "avg_win": float(wins.mean()) if wins.size else 0.0,
+        "avg_loss": float(-losses.mean()) if losses.size else 0.0,
+    }
@@ -8,7 +8,12 @@ import streamlit as st
 from wheel_backtest.config import BacktestConfig
 from wheel_backtest.engine import WheelBacktest
 from wheel_backtest.ui.components import display_results_tabs
-from wheel_backtest.ui.utils import get_cache_dir, get_history, get_output_dir
+from wheel_backtest.ui.utils import (
+    clear_history_caches,
+    get_cache_dir,
+    get_history,
+    get_output_dir,
+)
 
 st.set_page_config(
     page_title="Run Backtest",
@@ -298,6 +303,8 @@ def main():
                     equity_csv_path=equity_csv_path,
                     transactions_csv_path=transactions_csv_path if not transactions_df.empty else None,
                 )
+                # Dashboard tables are cached; show the new record right away
+                clear_history_caches()
 
                 # Display results
                 st.success(f"✅ Backtest complete! Saved as record #{record_id}")
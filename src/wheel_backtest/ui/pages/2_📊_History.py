@@ -3,7 +3,7 @@
 from pathlib import Path
 
 import streamlit as st
-from wheel_backtest.ui.utils import get_history
+from wheel_backtest.ui.utils import clear_history_caches, get_history
 
 st.set_page_config(
     page_title="Backtest History",
@@ -179,6 +179,7 @@ def main():
                     st.markdown("---")
                     if st.button(f"🗑️ Delete Record #{selected_id}", type="secondary"):
                         if history.delete_backtest(selected_id):
+                            clear_history_caches()
                             st.success(f"✅ Deleted record #{selected_id}")
                             st.rerun()
                         else:
@@ -99,7 +99,7 @@ def main():
                     initial_capital=initial_capital,
                 )
 
-                if not curve.points:
+                if len(curve) == 0:
                     st.error("❌ No price data available for the specified period")
                     return
 
@@ -3,6 +3,9 @@
 import os
 from pathlib import Path
 
+import pandas as pd
+import streamlit as st
+
 from wheel_backtest.storage import BacktestHistory
 
 
@@ -18,8 +21,52 @@ def get_output_dir() -> Path:
     return Path(output_dir)
 
 
+@st.cache_resource
+def _open_history(db_path: Path) -> BacktestHistory:
+    """Open the history database once per path for the whole server."""
+    return BacktestHistory(db_path)
+
+
 def get_history() -> BacktestHistory:
-    """Get BacktestHistory instance."""
+    """Get the shared BacktestHistory instance.
+
+    The instance is reused across reruns and sessions and pools its
+    read-only connections, so callers must not close it.
+    """
     cache_dir = get_cache_dir()
     db_path = cache_dir / "backtest_history.db"
-    return BacktestHistory(db_path)
+    return _open_history(db_path)
+
+
+@st.cache_data(ttl=30)
+def recent_backtests(limit: int = 10) -> pd.DataFrame:
+    """Summary table rows for the most recent backtests."""
+    records = get_history().list_backtests_df(limit=limit)
+
+    table: pd.DataFrame = pd.DataFrame({
+        "ID": records["id"],
+        "Date": records["run_date"].dt.strftime("%Y-%m-%d %H:%M"),
+        "Ticker": records["ticker"],
+        "Period": records["start_date"] + " to " + records["end_date"],
+        "Return": records["total_return_pct"].map("{:.2f}%".format),
+        "CAGR": records["cagr"].map("{:.2f}%".format),
+        "Sharpe": records["sharpe_ratio"].map("{:.2f}".format),
+        "Max DD": records["max_drawdown"].map("{:.2f}%".format),
+    })
+    return table
+
+
+@st.cache_data(ttl=60)
+def dashboard_stats() -> dict:
+    """Aggregate stats over the whole backtest history."""
+    return get_history().dashboard_stats()
+
+
+def clear_history_caches() -> None:
+    """Drop the cached dashboard data after the history changes.
+
+    Only the history-backed caches are cleared; benchmark and download
+    caches are left alone.
+    """
+    recent_backtests.clear()
+    dashboard_stats.clear()
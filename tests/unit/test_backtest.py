@@ -1,5 +1,6 @@
 """Tests for backtest orchestrator."""
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
@@ -8,7 +9,15 @@ import pandas as pd
 import pytest
 
 from wheel_backtest.config import BacktestConfig
-from wheel_backtest.engine.backtest import Transaction, WheelBacktest
+from wheel_backtest.engine.backtest import (
+    _EMPTY_CHAIN,
+    Transaction,
+    TransactionLog,
+    WheelBacktest,
+    _downcast_options,
+    run_backtests_parallel,
+)
+from wheel_backtest.engine.wheel import WheelEvent, WheelState
 
 
 class TestWheelBacktest:
@@ -90,6 +99,23 @@ class TestWheelBacktest:
             assert len(prices) == 5
             mock_provider.get_prices.assert_called_once()
 
+    def test_get_price_data_trims_to_range(
+        self, config: BacktestConfig, mock_price_data: pd.DataFrame
+    ) -> None:
+        """Test prices outside the configured range are dropped."""
+        config.start_date = date(2024, 1, 2)
+        config.end_date = date(2024, 1, 4)
+        with patch("wheel_backtest.engine.backtest.DataCache"), \
+             patch("wheel_backtest.engine.backtest.PhilippdubachProvider"), \
+             patch("wheel_backtest.engine.backtest.YFinanceProvider") as mock_yf:
+            mock_provider = Mock()
+            mock_provider.get_prices.return_value = mock_price_data.iloc[::-1]
+            mock_yf.return_value = mock_provider
+
+            prices = WheelBacktest(config)._get_price_data()
+
+            assert prices["close"].tolist() == [472.0, 473.0, 474.0]
+
     def test_get_options_chain_success(
         self, config: BacktestConfig, mock_options_chain: pd.DataFrame
     ) -> None:
@@ -113,7 +139,7 @@ class TestWheelBacktest:
              patch("wheel_backtest.engine.backtest.PhilippdubachProvider") as mock_pd, \
              patch("wheel_backtest.engine.backtest.YFinanceProvider"):
             mock_provider = Mock()
-            mock_provider.get_options_chain.side_effect = Exception("No data")
+            mock_provider.get_options_chain.side_effect = ValueError("No data")
             mock_pd.return_value = mock_provider
 
             backtest = WheelBacktest(config)
@@ -122,6 +148,162 @@ class TestWheelBacktest:
             # Should return empty DataFrame on error
             assert chain.empty
 
+    def test_get_options_chain_unexpected_error(self, config: BacktestConfig) -> None:
+        """Test unexpected provider errors are not swallowed."""
+        with patch("wheel_backtest.engine.backtest.DataCache"), \
+             patch("wheel_backtest.engine.backtest.PhilippdubachProvider") as mock_pd, \
+             patch("wheel_backtest.engine.backtest.YFinanceProvider"):
+            mock_provider = Mock()
+            mock_provider.get_options_chain.side_effect = TypeError("bug")
+            mock_pd.return_value = mock_provider
+
+            backtest = WheelBacktest(config)
+
+            with pytest.raises(TypeError):
+                backtest._get_options_chain(date(2024, 1, 2))
+
+    def test_get_options_chain_fallback_cached(
+        self, config: BacktestConfig, mock_options_chain: pd.DataFrame
+    ) -> None:
+        """Test repeated fallback lookups hit the provider once per date."""
+        with patch("wheel_backtest.engine.backtest.DataCache"), \
+             patch("wheel_backtest.engine.backtest.PhilippdubachProvider") as mock_pd, \
+             patch("wheel_backtest.engine.backtest.YFinanceProvider"):
+            mock_provider = Mock()
+            mock_provider.get_options_chain.return_value = mock_options_chain
+            mock_pd.return_value = mock_provider
+
+            backtest = WheelBacktest(config)
+            backtest._get_options_chain(date(2024, 1, 2))
+            chain = backtest._get_options_chain(date(2024, 1, 2))
+
+            assert len(chain) == 2
+            mock_provider.get_options_chain.assert_called_once()
+
+    def test_get_options_chain_prefiltered(
+        self, config: BacktestConfig, mock_options_chain: pd.DataFrame
+    ) -> None:
+        """Test per-day chain lookup from pre-filtered data."""
+        with patch("wheel_backtest.engine.backtest.DataCache"), \
+             patch("wheel_backtest.engine.backtest.PhilippdubachProvider") as mock_pd, \
+             patch("wheel_backtest.engine.backtest.YFinanceProvider"):
+            day1 = mock_options_chain.assign(trade_date=pd.Timestamp("2024-01-02 16:00"))
+            day2 = mock_options_chain.head(1).assign(trade_date=pd.Timestamp("2024-01-03"))
+            mock_provider = Mock()
+            mock_provider.get_filtered_options.return_value = pd.concat(
+                [day1, day2], ignore_index=True
+            )
+            mock_pd.return_value = mock_provider
+
+            backtest = WheelBacktest(config)
+            backtest._prefilter_options_data(date(2024, 1, 1), date(2024, 1, 31))
+
+            assert len(backtest._get_options_chain(date(2024, 1, 2))) == 2
+            assert len(backtest._get_options_chain(date(2024, 1, 3))) == 1
+            assert backtest._get_options_chain(date(2024, 1, 4)) is _EMPTY_CHAIN
+            mock_provider.get_options_chain.assert_not_called()
+
+    def test_run_records_daily_equity(
+        self,
+        config: BacktestConfig,
+        mock_price_data: pd.DataFrame,
+        mock_options_chain: pd.DataFrame,
+    ) -> None:
+        """Test equity is recorded for every day, including no-event days."""
+        with patch("wheel_backtest.engine.backtest.DataCache"), \
+             patch("wheel_backtest.engine.backtest.PhilippdubachProvider") as mock_pd, \
+             patch("wheel_backtest.engine.backtest.YFinanceProvider") as mock_yf:
+            mock_options = Mock()
+            mock_options.get_filtered_options.return_value = mock_options_chain.assign(
+                trade_date=pd.Timestamp("2024-01-02")
+            )
+            mock_pd.return_value = mock_options
+            mock_prices = Mock()
+            mock_prices.get_prices.return_value = mock_price_data
+            mock_yf.return_value = mock_prices
+
+            result = WheelBacktest(config).run()
+
+            df = result.equity_curve.to_dataframe()
+            # Initial point plus one per trading day
+            assert len(df) == 6
+            assert df["cash"].iloc[:2].tolist() == [100_000.0, 100_000.0]
+            # Put sold on Jan 2 at mid 4.75 less $1 commission, held after
+            assert df["cash"].iloc[2:].tolist() == [100_474.0] * 4
+            assert result.final_equity == 100_474.0
+            assert result.summary["total_puts_sold"] == 1
+
+    def test_quiet_run_prints_nothing(
+        self,
+        config: BacktestConfig,
+        mock_price_data: pd.DataFrame,
+        mock_options_chain: pd.DataFrame,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Test a quiet backtest draws no progress bar or summary."""
+        with patch("wheel_backtest.engine.backtest.DataCache"), \
+             patch("wheel_backtest.engine.backtest.PhilippdubachProvider") as mock_pd, \
+             patch("wheel_backtest.engine.backtest.YFinanceProvider") as mock_yf:
+            mock_options = Mock()
+            mock_options.get_filtered_options.return_value = mock_options_chain.assign(
+                trade_date=pd.Timestamp("2024-01-02")
+            )
+            mock_pd.return_value = mock_options
+            mock_prices = Mock()
+            mock_prices.get_prices.return_value = mock_price_data
+            mock_yf.return_value = mock_prices
+
+            result = WheelBacktest(config, quiet=True).run()
+
+        assert result.final_equity == 100_474.0
+        assert capsys.readouterr().out == ""
+
+    def test_log_event_values(self, config: BacktestConfig) -> None:
+        """Test transaction values derived from different event types."""
+        with patch("wheel_backtest.engine.backtest.DataCache"), \
+             patch("wheel_backtest.engine.backtest.PhilippdubachProvider"), \
+             patch("wheel_backtest.engine.backtest.YFinanceProvider"):
+            backtest = WheelBacktest(config)
+            events = [
+                WheelEvent(
+                    date=date(2024, 1, 2),
+                    event_type="sell_put",
+                    state_before=WheelState.SELLING_PUTS,
+                    state_after=WheelState.SELLING_PUTS,
+                    details={
+                        "strike": 450.0,
+                        "expiration": date(2024, 2, 1),
+                        "premium": 4.75,
+                        "contracts": 1,
+                        "commission": 1.0,
+                        "delta": -0.25,
+                    },
+                ),
+                WheelEvent(
+                    date=date(2024, 2, 1),
+                    event_type="put_assigned",
+                    state_before=WheelState.SELLING_PUTS,
+                    state_after=WheelState.HOLDING_STOCK,
+                    details={"strike": 450.0, "shares_acquired": 100},
+                ),
+                WheelEvent(
+                    date=date(2024, 2, 2),
+                    event_type="dividend",
+                    state_before=WheelState.HOLDING_STOCK,
+                    state_after=WheelState.HOLDING_STOCK,
+                    details={},
+                ),
+            ]
+            for event in events:
+                backtest._log_event(event, 440.0)
+
+            df = backtest.get_transactions_df()
+
+            assert df["instrument"].tolist() == ["PUT $450 2024-02-01", "PUT $450 ", "SPY"]
+            assert df["quantity"].tolist() == [1, 100, 0]
+            assert df["value"].tolist() == [475.0, 45_000.0, 0.0]
+            assert df["notes"].tolist()[1] == "State: holding_stock"
+
     def test_get_transactions_df_empty(self, config: BacktestConfig) -> None:
         """Test getting transactions DataFrame when empty."""
         with patch("wheel_backtest.engine.backtest.DataCache"), \
@@ -161,6 +343,124 @@ class TestWheelBacktest:
             assert df.iloc[0]["action"] == "sell_put"
 
 
+class TestRunBacktestsParallel:
+    """Tests for running several backtests in parallel."""
+
+    def test_results_keep_config_order(self, tmp_path: Path) -> None:
+        """Test results are returned in the order of the configs."""
+        configs = [
+            BacktestConfig(ticker=ticker, cache_dir=tmp_path / "cache")
+            for ticker in ("SPY", "QQQ", "IWM")
+        ]
+
+        def fake_backtest(config: BacktestConfig, quiet: bool = False) -> Mock:
+            assert quiet
+            backtest = Mock()
+            backtest.run.return_value = config.ticker
+            return backtest
+
+        with patch("wheel_backtest.engine.backtest.ProcessPoolExecutor", ThreadPoolExecutor), \
+             patch("wheel_backtest.engine.backtest.WheelBacktest", side_effect=fake_backtest):
+            results = run_backtests_parallel(configs, max_workers=2)
+
+        assert results == ["SPY", "QQQ", "IWM"]
+
+    def test_empty_configs(self) -> None:
+        """Test no configs gives no results."""
+        assert run_backtests_parallel([]) == []
+
+
+class TestDowncastOptions:
+    """Tests for option chain dtype downcasting."""
+
+    def test_downcast_options(self) -> None:
+        """Test option_type becomes categorical while pricing columns keep precision."""
+        df = pd.DataFrame(
+            {
+                "option_type": ["put", "call"],
+                "strike": [450.0, 490.0],
+                "bid": [4.5, 3.0],
+                "ask": [5.0, 3.5],
+                "delta": [-0.25, 0.25],
+            }
+        )
+
+        result = _downcast_options(df)
+
+        assert isinstance(result["option_type"].dtype, pd.CategoricalDtype)
+        for col in ("strike", "bid", "ask", "delta"):
+            assert result[col].dtype == "float64"
+        assert (result["option_type"] == "put").tolist() == [True, False]
+
+
+class TestTransactionLog:
+    """Tests for the columnar transaction log."""
+
+    def test_add_and_to_dataframe(self) -> None:
+        """Test recording transactions and building a DataFrame."""
+        log = TransactionLog()
+        log.add(
+            date=date(2024, 1, 2),
+            action="sell_put",
+            instrument="PUT $450 2024-02-01",
+            quantity=1,
+            price=5.0,
+            value=500.0,
+            commission=1.0,
+            cash_after=100_499.0,
+            shares_after=0,
+            equity_after=100_499.0,
+            delta=-0.25,
+        )
+        log.add(
+            date=date(2024, 2, 1),
+            action="put_expired",
+            instrument="PUT $450 2024-02-01",
+            quantity=0,
+            price=0.0,
+            value=0.0,
+            commission=0.0,
+            cash_after=100_499.0,
+            shares_after=0,
+            equity_after=100_499.0,
+        )
+
+        df = log.to_dataframe()
+
+        assert len(log) == 2
+        assert list(df.columns) == [
+            "date", "action", "instrument", "quantity", "price", "value",
+            "commission", "cash_after", "shares_after", "equity_after",
+            "delta", "notes",
+        ]
+        assert df["quantity"].dtype == "int64"
+        assert df["delta"].dtype == "float64"
+        assert df["action"].dtype == "string[pyarrow]"
+        assert isinstance(df["instrument"].dtype, pd.CategoricalDtype)
+        assert df["instrument"].nunique() == 1
+        assert pd.isna(df.iloc[1]["delta"])
+        assert df.iloc[0]["value"] == 500.0
+
+    def test_append_round_trip(self) -> None:
+        """Test appended Transaction objects can be iterated back."""
+        transaction = Transaction(
+            date=date(2024, 1, 2),
+            action="sell_put",
+            instrument="PUT $450",
+            quantity=1,
+            price=5.0,
+            value=500.0,
+            commission=1.0,
+            cash_after=100_499.0,
+            shares_after=0,
+            equity_after=100_499.0,
+        )
+        log = TransactionLog()
+        log.append(transaction)
+
+        assert list(log) == [transaction]
+
+
 class TestTransaction:
     """Tests for Transaction dataclass."""
 
@@ -1,16 +1,22 @@
 """Tests for chart generation."""
 
-from datetime import date
+from datetime import date, timedelta
 from pathlib import Path
+from unittest.mock import patch
 
 import matplotlib
 matplotlib.use("Agg")  # Non-interactive backend for testing
 import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
 import pytest
 
 from wheel_backtest.analytics.equity import EquityCurve
 from wheel_backtest.reports.charts import (
+    DOWNSAMPLE_TARGET,
+    create_backtest_report,
     create_benchmark_report,
+    lttb_indices,
     plot_drawdown,
     plot_equity_comparison,
     plot_equity_curve,
@@ -48,6 +54,40 @@ class TestPlotEquityCurve:
         assert output_path.stat().st_size > 0
         plt.close(fig)
 
+    def test_series_are_rasterized(self, sample_curve: EquityCurve, temp_dir: Path) -> None:
+        """Test data series are rasterized while the figure saves as vector."""
+        output_path = temp_dir / "equity.svg"
+        fig = plot_equity_curve(sample_curve, output_path=output_path)
+        ax = fig.axes[0]
+
+        assert all(line.get_rasterized() for line in ax.lines)
+        assert all(fill.get_rasterized() for fill in ax.collections)
+        assert "<image" in output_path.read_text()
+        plt.close(fig)
+
+    def test_plots_without_dataframe(self, sample_curve: EquityCurve) -> None:
+        """Test single-curve charts read the curve's arrays directly."""
+        with patch.object(sample_curve, "to_dataframe") as to_dataframe:
+            equity = plot_equity_curve(sample_curve)
+            drawdown = plot_drawdown(sample_curve)
+
+        to_dataframe.assert_not_called()
+        np.testing.assert_array_equal(
+            equity.axes[0].lines[0].get_ydata(), [100_000.0, 101_000.0, 99_000.0, 102_000.0, 103_000.0]
+        )
+        assert drawdown.axes[0].lines[0].get_ydata()[2] == pytest.approx(-2_000.0 / 101_000.0 * 100)
+        plt.close(equity)
+        plt.close(drawdown)
+
+    def test_uses_constrained_layout(self, sample_curve: EquityCurve) -> None:
+        """Test that figures are laid out by the constrained engine."""
+        with patch.object(plt.Figure, "tight_layout") as tight_layout:
+            fig = plot_equity_curve(sample_curve)
+
+        tight_layout.assert_not_called()
+        assert isinstance(fig.get_layout_engine(), matplotlib.layout_engine.ConstrainedLayoutEngine)
+        plt.close(fig)
+
     def test_custom_title(self, sample_curve: EquityCurve) -> None:
         """Test custom title."""
         fig = plot_equity_curve(sample_curve, title="My Custom Title")
@@ -56,6 +96,56 @@ class TestPlotEquityCurve:
         plt.close(fig)
 
 
+def _long_curve(days: int) -> EquityCurve:
+    """Build a noisy curve with a single sharp dip in the middle."""
+    rng = np.random.default_rng(7)
+    totals = 100_000.0 + np.cumsum(rng.normal(0.0, 100.0, days))
+    totals[days // 2] -= 20_000.0
+    start = date(2000, 1, 3)
+    return EquityCurve.from_arrays(
+        [start + timedelta(days=i) for i in range(days)],
+        cash=totals,
+        stock_value=np.zeros(days),
+    )
+
+
+class TestDownsampling:
+    """Tests for shape-preserving downsampling of long series."""
+
+    def test_short_series_untouched(self) -> None:
+        """Test series at or under the target keep every point."""
+        np.testing.assert_array_equal(lttb_indices(np.arange(10.0), 10), np.arange(10))
+
+    def test_keeps_endpoints_and_extremes(self) -> None:
+        """Test the first, last and spike points survive downsampling."""
+        values = np.zeros(10_000)
+        values[4_321] = 50.0
+        kept = lttb_indices(values, 100)
+
+        assert len(kept) == 100
+        assert kept[0] == 0 and kept[-1] == 9_999
+        assert np.all(np.diff(kept) > 0)
+        assert 4_321 in kept
+
+    def test_long_curve_plotted_downsampled(self) -> None:
+        """Test long curves are drawn with at most the target point count."""
+        curve = _long_curve(6_000)
+        dip = curve.to_dataframe()["total"].min()
+
+        fig = plot_drawdown(curve)
+        line = fig.axes[0].lines[0]
+        assert len(line.get_ydata()) == DOWNSAMPLE_TARGET
+        plt.close(fig)
+
+        fig = plot_equity_curve(curve)
+        assert fig.axes[0].lines[0].get_ydata().min() == dip
+        plt.close(fig)
+
+        fig = plot_equity_curve(curve, downsample=False)
+        assert len(fig.axes[0].lines[0].get_ydata()) == 6_000
+        plt.close(fig)
+
+
 class TestPlotEquityComparison:
     """Tests for plot_equity_comparison function."""
 
@@ -77,8 +167,13 @@ class TestPlotEquityComparison:
         fig = plot_equity_comparison(curves)
         ax = fig.axes[0]
 
-        # Should have 2 lines
-        assert len(ax.lines) == 2
+        # Both curves share one collection, with a legend entry each
+        assert len(ax.collections) == 1
+        segments = ax.collections[0].get_segments()
+        assert len(segments) == 2
+        np.testing.assert_array_equal(segments[1][:, 1], curve2.to_dataframe()["total"])
+        assert [t.get_text() for t in ax.get_legend().get_texts()] == ["Strategy A", "Strategy B"]
+        assert ax.get_ylim()[0] <= 99_000.0 and ax.get_ylim()[1] >= 102_000.0
         plt.close(fig)
 
     def test_saves_to_file(self, sample_curve: EquityCurve, temp_dir: Path) -> None:
@@ -104,6 +199,18 @@ class TestPlotReturnsComparison:
         assert "%" in ax.get_ylabel()
         plt.close(fig)
 
+    def test_tick_label_formats(self, sample_curve: EquityCurve) -> None:
+        """Test y tick labels on each chart type."""
+        equity = plot_equity_curve(sample_curve)
+        returns = plot_returns_comparison({"Test": sample_curve})
+        drawdown = plot_drawdown(sample_curve)
+
+        assert equity.axes[0].yaxis.get_major_formatter()(125_000.4) == "$125,000"
+        assert returns.axes[0].yaxis.get_major_formatter()(12.6) == "13%"
+        assert drawdown.axes[0].yaxis.get_major_formatter()(-2.54) == "\N{MINUS SIGN}2.5%"
+        for fig in (equity, returns, drawdown):
+            plt.close(fig)
+
 
 class TestPlotDrawdown:
     """Tests for plot_drawdown function."""
@@ -116,6 +223,19 @@ class TestPlotDrawdown:
         assert "Drawdown" in ax.get_ylabel()
         plt.close(fig)
 
+    def test_drawdown_values(self, sample_curve: EquityCurve) -> None:
+        """Test plotted drawdown matches the running-peak definition."""
+        fig = plot_drawdown(sample_curve)
+        plotted = fig.axes[0].lines[0].get_ydata()
+
+        total = sample_curve.to_dataframe()["total"]
+        running_max = total.cummax()
+        expected = (total - running_max) / running_max * 100
+
+        np.testing.assert_array_equal(plotted, expected.to_numpy())
+        assert plotted[2] == pytest.approx(-2_000.0 / 101_000.0 * 100)
+        plt.close(fig)
+
     def test_saves_to_file(self, sample_curve: EquityCurve, temp_dir: Path) -> None:
         """Test saving drawdown chart."""
         output_path = temp_dir / "drawdown.png"
@@ -147,8 +267,59 @@ class TestCreateBenchmarkReport:
         assert charts["drawdown"].exists()
         assert charts["data"].exists()
 
-        # Check data CSV
+        # Equity data defaults to Parquet
+        assert charts["data"].suffix == ".parquet"
+        pd.testing.assert_frame_equal(
+            pd.read_parquet(charts["data"]), sample_curve.to_dataframe(), check_freq=False
+        )
+
+    def test_csv_data_format(self, sample_curve: EquityCurve, temp_dir: Path) -> None:
+        """Test that the equity data can still be written as CSV."""
+        charts = create_benchmark_report(
+            benchmark_curve=sample_curve,
+            ticker="SPY",
+            initial_capital=100_000.0,
+            output_dir=temp_dir / "output",
+            data_format="csv",
+        )
+
         assert charts["data"].suffix == ".csv"
+        assert charts["data"].exists()
+
+    def test_invalid_data_format(self, sample_curve: EquityCurve, temp_dir: Path) -> None:
+        """Test that an unknown data format is rejected."""
+        with pytest.raises(ValueError, match="Invalid data_format"):
+            create_benchmark_report(
+                benchmark_curve=sample_curve,
+                ticker="SPY",
+                initial_capital=100_000.0,
+                output_dir=temp_dir / "output",
+                data_format="xlsx",
+            )
+
+    def test_converts_curve_once(self, sample_curve: EquityCurve, temp_dir: Path) -> None:
+        """Test the charts and data file share a single DataFrame conversion."""
+        with patch.object(
+            sample_curve, "to_dataframe", wraps=sample_curve.to_dataframe
+        ) as to_dataframe:
+            create_benchmark_report(
+                benchmark_curve=sample_curve,
+                ticker="SPY",
+                initial_capital=100_000.0,
+                output_dir=temp_dir / "output",
+            )
+
+        assert to_dataframe.call_count == 1
+
+    def test_plot_with_precomputed_frame(self, sample_curve: EquityCurve) -> None:
+        """Test a supplied frame is plotted instead of reconverting."""
+        frame = sample_curve.to_dataframe()
+        with patch.object(sample_curve, "to_dataframe") as to_dataframe:
+            fig = plot_equity_curve(sample_curve, frame=frame)
+
+        to_dataframe.assert_not_called()
+        np.testing.assert_array_equal(fig.axes[0].lines[0].get_ydata(), frame["total"])
+        plt.close(fig)
 
     def test_creates_output_directory(self, sample_curve: EquityCurve, temp_dir: Path) -> None:
         """Test that output directory is created if missing."""
@@ -163,3 +334,54 @@ class TestCreateBenchmarkReport:
         )
 
         assert output_dir.exists()
+
+
+class TestCreateBacktestReport:
+    """Tests for create_backtest_report function."""
+
+    def test_all_charts_share_one_figure(self, sample_curve: EquityCurve, temp_dir: Path) -> None:
+        """Test every chart is written from a single reused figure."""
+        plt.close("all")
+        with patch(
+            "wheel_backtest.reports.charts.plt.subplots", wraps=plt.subplots
+        ) as subplots:
+            charts = create_backtest_report(
+                backtest_curve=sample_curve,
+                benchmark_curve=sample_curve,
+                ticker="SPY",
+                output_dir=temp_dir / "output",
+            )
+
+        assert subplots.call_count == 1
+        assert set(charts) == {"equity", "drawdown", "comparison", "returns", "data"}
+        assert all(path.stat().st_size > 0 for path in charts.values())
+        assert plt.get_fignums() == []
+
+    def test_svg_image_format(self, sample_curve: EquityCurve, temp_dir: Path) -> None:
+        """Test charts can be written as SVG."""
+        charts = create_backtest_report(
+            backtest_curve=sample_curve,
+            benchmark_curve=sample_curve,
+            ticker="SPY",
+            output_dir=temp_dir / "output",
+            image_format="svg",
+        )
+
+        for name in ("equity", "drawdown", "comparison", "returns"):
+            assert charts[name].suffix == ".svg"
+            assert charts[name].read_text().lstrip().startswith("<?xml")
+
+    def test_invalid_image_format(self, sample_curve: EquityCurve, temp_dir: Path) -> None:
+        """Test that an unknown image format is rejected before any work."""
+        output_dir = temp_dir / "output"
+
+        with pytest.raises(ValueError, match="Invalid image_format"):
+            create_backtest_report(
+                backtest_curve=sample_curve,
+                benchmark_curve=None,
+                ticker="SPY",
+                output_dir=output_dir,
+                image_format="bmp",
+            )
+
+        assert not output_dir.exists()
@@ -2,10 +2,11 @@
 
 from datetime import date
 
+import numpy as np
 import pandas as pd
 import pytest
 
-from wheel_backtest.engine.options import OptionSelector
+from wheel_backtest.engine.options import OptionSelector, _pick_delta_index
 from wheel_backtest.engine.portfolio import OptionType
 
 
@@ -71,6 +72,11 @@ class TestDeltaBasedSelection:
         assert selector.put_delta == 0.30
         assert selector.call_delta == 0.15
 
+    def test_selector_accepts_put_delta(self) -> None:
+        """Test the selector takes per-type deltas and selects by delta."""
+        assert OptionSelector(put_delta=0.2).put_delta == 0.2
+        assert hasattr(OptionSelector, "select_strike_by_delta")
+
     def test_selector_fallback_to_delta_target(self) -> None:
         """Test that separate deltas fall back to delta_target when not set."""
         selector = OptionSelector(delta_target=0.25)
@@ -163,9 +169,9 @@ class TestDeltaBasedSelection:
         )
 
         assert result is not None
-        assert result["strike"] == 450.0  # Delta = -0.20
-        assert result["option_type"] == OptionType.PUT
-        assert result["delta"] == -0.20
+        assert result.strike == 450.0  # Delta = -0.20
+        assert result.option_type == OptionType.PUT
+        assert result.delta == -0.20
 
     def test_select_option_from_chain_fallback(self, options_without_delta: pd.DataFrame) -> None:
         """Test that selection falls back to OTM when delta unavailable."""
@@ -185,8 +191,8 @@ class TestDeltaBasedSelection:
 
         assert result is not None
         # Should use OTM selection: 5% below 460 = 437, closest is 450
-        assert result["strike"] in [440.0, 445.0, 450.0]
-        assert result["delta"] is None  # No delta in data
+        assert result.strike in [440.0, 445.0, 450.0]
+        assert result.delta is None  # No delta in data
 
     def test_empty_chain_returns_none(self) -> None:
         """Test that empty chain returns None."""
@@ -219,6 +225,73 @@ class TestDeltaBasedSelection:
 
         assert strike is None
 
+    def test_delta_ties_and_missing_values(self) -> None:
+        """Test rows without delta are skipped and ties keep the first row."""
+        selector = OptionSelector(delta_target=0.25)
+
+        put_chain = pd.DataFrame({
+            "strike": [455.0, 450.0, 445.0, 440.0],
+            "delta": [None, -0.375, -0.125, -0.25],
+        })
+
+        # -0.375 and -0.125 are equally close to -0.25 but -0.25 is exact
+        assert selector.select_strike_by_delta(
+            put_chain, OptionType.PUT, 0.25, 460.0
+        ) == 440.0
+        # Equidistant deltas resolve to the earlier row
+        assert selector.select_strike_by_delta(
+            put_chain.iloc[:3], OptionType.PUT, 0.25, 460.0
+        ) == 450.0
+
+    def test_delta_selection_leaves_chain_untouched(
+        self, options_with_delta: pd.DataFrame
+    ) -> None:
+        """Test delta selection adds no columns and does not modify the chain."""
+        selector = OptionSelector(delta_target=0.20)
+        put_chain = options_with_delta[options_with_delta["option_type"] == "put"]
+        before = put_chain.copy()
+
+        strike = selector.select_strike_by_delta(put_chain, OptionType.PUT, 0.20, 460.0)
+
+        assert strike == 450.0
+        assert "delta_diff" not in put_chain.columns
+        pd.testing.assert_frame_equal(put_chain, before)
+
+    def test_pick_delta_index_kernel(self) -> None:
+        """Test the array kernel returns row positions and -1 when nothing qualifies."""
+        strikes = np.array([460.0, 470.0, 480.0, 490.0])
+        deltas = np.array([0.45, 0.30, np.nan, 0.12])
+
+        assert _pick_delta_index(strikes, deltas, 0.15, 465.0, None, is_put=False) == 3
+        assert _pick_delta_index(strikes, deltas, 0.30, 465.0, None, is_put=False) == 1
+        assert _pick_delta_index(strikes, deltas, 0.30, 465.0, 495.0, is_put=False) == -1
+        assert _pick_delta_index(strikes, deltas, 0.30, 455.0, None, is_put=True) == -1
+
+    def test_leg_delta_pick_matches_kernel(self) -> None:
+        """Test the strike-ordered leg pick agrees with the row-order kernel."""
+        rng = np.random.default_rng(7)
+        for _ in range(200):
+            size = int(rng.integers(1, 12))
+            strikes = rng.choice(np.arange(440.0, 500.0, 5.0), size=size)
+            deltas = np.round(rng.uniform(-0.6, 0.6, size=size), 1)
+            deltas[rng.random(size) < 0.2] = np.nan
+            chain = pd.DataFrame({
+                "expiration": [pd.Timestamp("2024-02-01")] * size,
+                "option_type": ["call"] * size,
+                "strike": strikes,
+                "bid": np.ones(size),
+                "ask": np.ones(size),
+                "delta": deltas,
+            })
+            leg = OptionSelector.prepare_chain(chain).leg("call", date(2024, 2, 1))
+            underlying = float(rng.uniform(440.0, 500.0))
+            cost_basis = None if rng.random() < 0.5 else float(rng.uniform(440.0, 500.0))
+
+            for is_put in (True, False):
+                assert leg.nearest_delta_row(0.3, underlying, cost_basis, is_put) == (
+                    _pick_delta_index(strikes, deltas, 0.3, underlying, cost_basis, is_put)
+                )
+
     def test_different_delta_targets(self, options_with_delta: pd.DataFrame) -> None:
         """Test selection with various delta targets."""
         put_chain = options_with_delta[options_with_delta["option_type"] == "put"]
@@ -267,7 +340,7 @@ class TestDeltaBasedSelection:
             trade_date=date(2024, 1, 2),
         )
         assert put_result is not None
-        assert put_result["strike"] == 445.0  # Delta = -0.28, closest to -0.30
+        assert put_result.strike == 445.0  # Delta = -0.28, closest to -0.30
 
         # Test call selection with 0.15 delta
         call_result = selector.select_option_from_chain(
@@ -277,4 +350,4 @@ class TestDeltaBasedSelection:
             trade_date=date(2024, 1, 2),
         )
         assert call_result is not None
-        assert call_result["strike"] == 470.0  # Delta = 0.14, closest to 0.15
+        assert call_result.strike == 470.0  # Delta = 0.14, closest to 0.15
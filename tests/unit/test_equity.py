@@ -2,6 +2,7 @@
 
 from datetime import date
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -103,6 +104,21 @@ class TestEquityCurve:
         assert df.empty
         assert "total" in df.columns
 
+    def test_as_arrays(self) -> None:
+        """Test dates and totals match the DataFrame conversion."""
+        curve = EquityCurve()
+        curve.add_point(date(2024, 1, 2), 50_000.0, 50_000.0, 1_000.0)
+        curve.add_point(date(2024, 1, 3), 49_000.0, 52_000.0, 500.0)
+
+        dates, total = curve.as_arrays()
+
+        assert dates.dtype == np.dtype("datetime64[D]")
+        assert dates.tolist() == [date(2024, 1, 2), date(2024, 1, 3)]
+        np.testing.assert_array_equal(total, curve.to_dataframe()["total"])
+
+        empty_dates, empty_total = EquityCurve().as_arrays()
+        assert len(empty_dates) == 0 and len(empty_total) == 0
+
     def test_from_dataframe(self) -> None:
         """Test creating curve from DataFrame."""
         df = pd.DataFrame({
@@ -117,6 +133,95 @@ class TestEquityCurve:
         assert curve[0].cash == 50_000.0
         assert curve[1].stock_value == 53_000.0
 
+    def test_from_arrays(self) -> None:
+        """Test creating curve from column arrays."""
+        curve = EquityCurve.from_arrays(
+            dates=[date(2024, 1, 2), date(2024, 1, 3)],
+            cash=np.array([100_000.0, 50_000.0]),
+            stock_value=np.array([0.0, 51_000.0]),
+        )
+
+        assert len(curve) == 2
+        assert curve[1].options_value == 0.0
+        assert curve.end_value == 101_000.0
+        assert curve.to_dataframe()["total"].tolist() == [100_000.0, 101_000.0]
+
+    def test_from_arrays_length_mismatch(self) -> None:
+        """Test arrays of different lengths are rejected."""
+        with pytest.raises(ValueError):
+            EquityCurve.from_arrays(
+                dates=[date(2024, 1, 2)],
+                cash=[100_000.0, 100_000.0],
+                stock_value=[0.0],
+            )
+
+    def test_from_arrays_keeps_float_arrays(self) -> None:
+        """Test float64 columns are wrapped, not copied."""
+        cash = np.array([100_000.0, 50_000.0])
+        curve = EquityCurve.from_arrays(
+            dates=[date(2024, 1, 2), date(2024, 1, 3)],
+            cash=cash,
+            stock_value=np.zeros(2),
+        )
+
+        assert curve._cash is cash
+
+        curve.add_point(date(2024, 1, 4), 1.0, 0.0)
+        assert len(curve) == 3
+        assert cash.tolist() == [100_000.0, 50_000.0]
+
+    def test_slicing(self) -> None:
+        """Test slices return lists of points."""
+        curve = EquityCurve()
+        for day in range(2, 6):
+            curve.add_point(date(2024, 1, day), 100_000.0 + day, 0.0)
+
+        assert [p.date.day for p in curve[1:3]] == [3, 4]
+        assert curve[-1].date == date(2024, 1, 5)
+        with pytest.raises(IndexError):
+            curve[4]
+
+    def test_points_list_backs_the_curve(self) -> None:
+        """Test edits to the points list are seen by the rest of the curve."""
+        curve = EquityCurve()
+        curve.add_point(date(2024, 1, 2), 100_000.0, 0.0)
+
+        points = curve.points
+        assert points == [EquityPoint(date(2024, 1, 2), 100_000.0, 0.0)]
+        assert curve.points is points
+
+        points.append(EquityPoint(date(2024, 1, 3), 50_000.0, 51_000.0))
+        curve.add_point(date(2024, 1, 4), 50_000.0, 52_000.0)
+        assert len(points) == 3
+        assert curve.end_date == date(2024, 1, 4)
+        assert curve.to_dataframe()["total"].tolist() == [100_000.0, 101_000.0, 102_000.0]
+
+        points[0] = EquityPoint(date(2024, 1, 2), 90_000.0, 0.0)
+        assert curve.start_value == 90_000.0
+        assert curve.as_arrays()[1][0] == 90_000.0
+
+        curve.points = [EquityPoint(date(2024, 2, 1), 1.0, 2.0, 3.0)]
+        assert curve == EquityCurve(curve.points)
+        assert curve.get_returns().empty
+
+    def test_equality(self) -> None:
+        """Test curves compare by their points."""
+        points = [
+            EquityPoint(date(2024, 1, 2), 100_000.0, 0.0),
+            EquityPoint(date(2024, 1, 3), 50_000.0, 51_000.0),
+        ]
+        curve = EquityCurve(points)
+        same = EquityCurve.from_arrays(
+            dates=[p.date for p in points],
+            cash=[p.cash for p in points],
+            stock_value=[p.stock_value for p in points],
+        )
+
+        assert curve == same
+        assert curve != EquityCurve(points[:1])
+        assert EquityCurve() == EquityCurve()
+        assert repr(EquityCurve(points[:1])) == f"EquityCurve(points={points[:1]!r})"
+
     def test_get_returns(self) -> None:
         """Test daily returns calculation."""
         curve = EquityCurve()
@@ -1,14 +1,20 @@
 """Tests for backtest history storage."""
 
 import json
+import sqlite3
+import subprocess
+import threading
 from datetime import date, datetime
 from pathlib import Path
+from typing import Iterator
+from unittest.mock import patch
 
 import pytest
 
 from wheel_backtest.analytics.metrics import PerformanceMetrics
 from wheel_backtest.config import BacktestConfig
 from wheel_backtest.storage import BacktestHistory, BacktestRecord
+from wheel_backtest.storage.history import _READER_POOL_SIZE, _config_json
 
 
 class TestBacktestHistory:
@@ -20,9 +26,10 @@ class TestBacktestHistory:
         return tmp_path / "test_history.db"
 
     @pytest.fixture
-    def history(self, temp_db: Path) -> BacktestHistory:
+    def history(self, temp_db: Path) -> Iterator[BacktestHistory]:
         """Create BacktestHistory instance."""
-        return BacktestHistory(temp_db)
+        with BacktestHistory(temp_db) as history:
+            yield history
 
     @pytest.fixture
     def sample_config(self) -> BacktestConfig:
@@ -119,6 +126,7 @@ class TestBacktestHistory:
         assert record.delta_target == 0.20
         assert record.commission == 0.50
         assert record.total_trades == 50
+        assert not hasattr(record, "__dict__")
 
     def test_get_nonexistent_backtest(self, history: BacktestHistory) -> None:
         """Test retrieving a record that doesn't exist."""
@@ -354,6 +362,53 @@ class TestBacktestHistory:
         assert config_dict["delta_target"] == 0.20
         assert config_dict["commission_per_contract"] == 0.50
 
+    def test_config_json_tracks_mutated_config(
+        self,
+        history: BacktestHistory,
+        sample_config: BacktestConfig,
+        sample_metrics: PerformanceMetrics,
+    ) -> None:
+        """Test that cached config JSON follows changes to the same config."""
+        ids = []
+        for dte in (30, 45):
+            sample_config.dte_target = dte
+            ids.append(history.save_backtest(
+                config=sample_config,
+                metrics=sample_metrics,
+                start_date="2023-01-01",
+                end_date="2023-12-31",
+                final_equity=125_100.0,
+                total_trades=50,
+            ))
+
+        dtes = [json.loads(history.get_backtest(i).config_json)["dte_target"] for i in ids]
+        assert dtes == [30, 45]
+        assert json.loads(history.get_backtest(ids[0]).config_json)["start_date"] == "2023-01-01"
+
+    def test_config_serialized_once_per_settings(
+        self,
+        history: BacktestHistory,
+        sample_config: BacktestConfig,
+        sample_metrics: PerformanceMetrics,
+    ) -> None:
+        """Test that repeated saves of the same settings reuse the JSON."""
+        _config_json.cache_clear()
+
+        with patch("wheel_backtest.storage.history.json.dumps", wraps=json.dumps) as dumps:
+            history.save_backtests_bulk(
+                {
+                    "config": sample_config,
+                    "metrics": sample_metrics,
+                    "start_date": "2023-01-01",
+                    "end_date": "2023-12-31",
+                    "final_equity": 125_100.0,
+                    "total_trades": 50,
+                }
+                for _ in range(5)
+            )
+
+        assert dumps.call_count == 1
+
     def test_csv_paths_storage(
         self,
         history: BacktestHistory,
@@ -412,3 +467,215 @@ class TestBacktestHistory:
 
         best = history.get_best_by_metric(metric="cagr")
         assert len(best) == 0
+
+    def test_save_backtests_bulk(
+        self,
+        history: BacktestHistory,
+        sample_config: BacktestConfig,
+        sample_metrics: PerformanceMetrics,
+    ) -> None:
+        """Test saving several results in one transaction."""
+        runs = [
+            {
+                "config": sample_config,
+                "metrics": sample_metrics,
+                "start_date": "2023-01-01",
+                "end_date": "2023-12-31",
+                "final_equity": 120_000.0 + i,
+                "total_trades": i,
+            }
+            for i in range(3)
+        ]
+
+        saved = history.save_backtests_bulk(runs)
+
+        assert saved == 3
+        records = history.list_backtests()
+        assert sorted(r.final_equity for r in records) == [120_000.0, 120_001.0, 120_002.0]
+
+    def test_wal_journal_mode(self, history: BacktestHistory) -> None:
+        """Test that the database runs in WAL mode."""
+        mode = history._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_context_manager_closes_connection(self, temp_db: Path) -> None:
+        """Test that leaving the with block closes the connections."""
+        with BacktestHistory(temp_db) as history:
+            assert history.list_backtests() == []
+            reader = history._idle_readers[0]
+
+        assert history._idle_readers == []
+        with pytest.raises(sqlite3.ProgrammingError):
+            reader.execute("SELECT 1")
+        with pytest.raises(sqlite3.ProgrammingError):
+            history._conn.execute("SELECT 1")
+
+    def test_read_after_close_reopens_reader(self, temp_db: Path) -> None:
+        """Test that a read after close() opens a fresh read connection."""
+        history = BacktestHistory(temp_db)
+        history.list_backtests()
+        history.close()
+
+        assert history.list_backtests() == []
+
+    def test_git_commit_looked_up_once(
+        self,
+        history: BacktestHistory,
+        sample_config: BacktestConfig,
+        sample_metrics: PerformanceMetrics,
+    ) -> None:
+        """Test that repeated saves reuse the cached git commit."""
+        BacktestHistory._get_git_commit.cache_clear()
+        completed = subprocess.CompletedProcess([], 0, stdout="abc123\n")
+
+        with patch("wheel_backtest.storage.history.subprocess.run", return_value=completed) as run:
+            for _ in range(3):
+                record_id = history.save_backtest(
+                    config=sample_config,
+                    metrics=sample_metrics,
+                    start_date="2023-01-01",
+                    end_date="2023-12-31",
+                    final_equity=125_100.0,
+                    total_trades=50,
+                )
+        BacktestHistory._get_git_commit.cache_clear()
+
+        assert run.call_count == 1
+        record = history.get_backtest(record_id)
+        assert record is not None
+        assert record.git_commit == "abc123"
+
+    @pytest.mark.parametrize("ticker", [None, "SPY"])
+    def test_best_by_metric_uses_index(self, history: BacktestHistory, ticker: str | None) -> None:
+        """Test that ranking a hot metric reads an index instead of sorting."""
+        if ticker:
+            query, params = "WHERE ticker = ? ORDER BY cagr DESC LIMIT ?", (ticker, 5)
+        else:
+            query, params = "ORDER BY cagr DESC LIMIT ?", (5,)
+
+        plan = history._conn.execute(
+            f"EXPLAIN QUERY PLAN SELECT * FROM backtest_history {query}", params
+        ).fetchall()
+
+        details = " ".join(row[3] for row in plan)
+        assert "idx_" in details
+        assert "TEMP B-TREE" not in details
+
+    def test_dashboard_stats(
+        self,
+        history: BacktestHistory,
+        sample_config: BacktestConfig,
+        sample_metrics: PerformanceMetrics,
+    ) -> None:
+        """Test aggregate stats across the whole history."""
+        assert history.dashboard_stats() == {
+            "total_backtests": 0,
+            "tickers_tested": 0,
+            "avg_return_pct": None,
+            "avg_sharpe_ratio": None,
+            "best_return_pct": None,
+        }
+
+        for ticker, return_pct in [("SPY", 10.0), ("SPY", 20.0), ("QQQ", 30.0)]:
+            sample_config.ticker = ticker
+            sample_metrics.total_return_pct = return_pct
+            history.save_backtest(
+                config=sample_config,
+                metrics=sample_metrics,
+                start_date="2023-01-01",
+                end_date="2023-12-31",
+                final_equity=125_100.0,
+                total_trades=50,
+            )
+
+        stats = history.dashboard_stats()
+        assert stats["total_backtests"] == 3
+        assert stats["tickers_tested"] == 2
+        assert stats["avg_return_pct"] == pytest.approx(20.0)
+        assert stats["avg_sharpe_ratio"] == pytest.approx(sample_metrics.sharpe_ratio)
+        assert stats["best_return_pct"] == 30.0
+
+    def test_list_backtests_df(
+        self,
+        history: BacktestHistory,
+        sample_config: BacktestConfig,
+        sample_metrics: PerformanceMetrics,
+    ) -> None:
+        """Test that the DataFrame listing matches list_backtests."""
+        for ticker in ["SPY", "QQQ", "SPY"]:
+            sample_config.ticker = ticker
+            history.save_backtest(
+                config=sample_config,
+                metrics=sample_metrics,
+                start_date="2023-01-01",
+                end_date="2023-12-31",
+                final_equity=125_100.0,
+                total_trades=50,
+            )
+
+        records = history.list_backtests(ticker="SPY")
+        df = history.list_backtests_df(ticker="SPY")
+
+        assert list(df.columns) == list(BacktestRecord.__dataclass_fields__)
+        assert df["id"].tolist() == [r.id for r in records]
+        assert df["run_date"].tolist() == [r.run_date for r in records]
+        assert history.list_backtests_df(limit=1, offset=1)["id"].tolist() == [
+            history.list_backtests(limit=1, offset=1)[0].id
+        ]
+        assert history.list_backtests_df(ticker="IWM").empty
+
+    def test_reads_reuse_read_only_connection(
+        self,
+        history: BacktestHistory,
+        sample_config: BacktestConfig,
+        sample_metrics: PerformanceMetrics,
+    ) -> None:
+        """Test that reads borrow a pooled read-only connection and hand it back."""
+        record_id = history.save_backtest(
+            config=sample_config,
+            metrics=sample_metrics,
+            start_date="2023-01-01",
+            end_date="2023-12-31",
+            final_equity=125_100.0,
+            total_trades=50,
+        )
+
+        with history._reader() as reader:
+            with pytest.raises(sqlite3.OperationalError, match="readonly"):
+                reader.execute("DELETE FROM backtest_history")
+        with history._reader() as again:
+            assert again is reader
+
+        seen = {}
+
+        def read() -> None:
+            seen["record"] = history.get_backtest(record_id)
+
+        thread = threading.Thread(target=read)
+        thread.start()
+        thread.join()
+
+        assert seen["record"] is not None
+        assert seen["record"].id == record_id
+        assert history._idle_readers == [reader]
+
+    def test_reader_pool_stays_bounded_across_threads(
+        self, history: BacktestHistory
+    ) -> None:
+        """Test that many short-lived reading threads do not accumulate connections."""
+        start = threading.Barrier(10)
+
+        def read() -> None:
+            start.wait()
+            for _ in range(5):
+                history.list_backtests()
+                history.dashboard_stats()
+
+        for _ in range(5):
+            threads = [threading.Thread(target=read) for _ in range(10)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert 1 <= len(history._idle_readers) <= _READER_POOL_SIZE
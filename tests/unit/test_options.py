@@ -1,15 +1,21 @@
 """Tests for option selection and order management."""
 
+import dataclasses
 from datetime import date
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from wheel_backtest.engine.options import (
+    EXPIRATION_DAY_COLUMN,
     Fill,
     OptionOrder,
     OptionSelector,
     OrderAction,
+    PreparedChain,
+    SelectedOption,
+    expiration_days,
 )
 from wheel_backtest.engine.portfolio import OptionType
 
@@ -57,6 +63,47 @@ class TestOptionSelector:
         selected = selector.select_expiration(expirations, date(2024, 1, 2))
         assert selected is None
 
+    def test_select_expiration_list_ties_keep_first(self) -> None:
+        """Test list input keeps the first of equally close expirations."""
+        selector = OptionSelector(dte_target=30, dte_min=7)
+
+        expirations = [date(2024, 2, 7), date(2024, 1, 26)]  # 36 and 24 DTE
+
+        assert selector.select_expiration(expirations, date(2024, 1, 2)) == date(2024, 2, 7)
+        assert selector.select_expiration([], date(2024, 1, 2)) is None
+
+    def test_select_expiration_array(self) -> None:
+        """Test expiration selection from a datetime64 array."""
+        selector = OptionSelector(dte_target=30, dte_min=14)
+
+        expirations = np.array(
+            ["2024-01-12", "2024-01-26", "2024-02-07", "2024-02-16"],
+            dtype="datetime64[D]",
+        )
+
+        # 24 and 36 DTE are equally close to 30; the earlier one wins
+        selected = selector.select_expiration(expirations, date(2024, 1, 2))
+        assert selected == date(2024, 1, 26)
+        assert isinstance(selected, date)
+
+        late = OptionSelector(dte_target=30, dte_min=60)
+        assert late.select_expiration(expirations, date(2024, 1, 2)) is None
+
+    def test_from_lists(self) -> None:
+        """Test list inputs convert to arrays with the same selections."""
+        selector = OptionSelector(dte_target=30, dte_min=7, otm_pct=0.05)
+        expiration_list = [date(2024, 1, 19), date(2024, 2, 2)]
+        strike_list = [105.0, 95.0, 100.0, 90.0]
+
+        expirations, strikes = OptionSelector.from_lists(expiration_list, strike_list)
+
+        assert expirations.dtype == np.dtype("datetime64[D]")
+        assert strikes.tolist() == [90.0, 95.0, 100.0, 105.0]
+        assert selector.select_expiration(expirations, date(2024, 1, 2)) == (
+            selector.select_expiration(expiration_list, date(2024, 1, 2))
+        )
+        assert selector.select_put_strike(100.0, strikes) == 95.0
+
     def test_select_put_strike(self) -> None:
         """Test put strike selection (OTM)."""
         selector = OptionSelector(otm_pct=0.05)  # 5% OTM
@@ -87,6 +134,26 @@ class TestOptionSelector:
         selected = selector.select_call_strike(100.0, strikes)
         assert selected == 105.0
 
+    def test_select_strike_ties_go_lower(self) -> None:
+        """Test equidistant strikes resolve to the lower strike."""
+        selector = OptionSelector(otm_pct=0.05)
+        strikes = np.array([90.0, 92.5, 97.5, 100.0, 102.5, 107.5, 110.0])
+
+        # Put target 95 sits between 92.5 and 97.5
+        assert selector.select_put_strike(100.0, strikes) == 92.5
+        # Call target 105 sits between 102.5 and 107.5
+        assert selector.select_call_strike(100.0, strikes) == 102.5
+
+    def test_select_strike_bounds(self) -> None:
+        """Test strikes outside the OTM range are never selected."""
+        selector = OptionSelector(otm_pct=0.05)
+        strikes = np.array([101.0, 102.0, 103.0])
+
+        assert selector.select_put_strike(100.0, strikes) is None
+        assert selector.select_put_strike(100.0, []) is None
+        assert selector.select_call_strike(100.0, strikes, cost_basis=110.0) is None
+        assert selector.select_call_strike(100.0, strikes, cost_basis=102.0) == 103.0
+
     def test_select_option_from_chain(self) -> None:
         """Test selecting option from full chain."""
         selector = OptionSelector(dte_target=30, dte_min=7, otm_pct=0.05)
@@ -112,10 +179,144 @@ class TestOptionSelector:
         )
 
         assert result is not None
-        assert result["expiration"] == date(2024, 2, 2)
-        assert result["strike"] == 450.0
-        assert result["mid_price"] == 6.25  # (6.00 + 6.50) / 2
-        assert result["delta"] == -0.35
+        assert result.expiration == date(2024, 2, 2)
+        assert result.strike == 450.0
+        assert result.mid_price == 6.25  # (6.00 + 6.50) / 2
+        assert result.delta == -0.35
+        assert isinstance(result, SelectedOption)
+        assert result.dte == 31
+
+    def test_prepare_chain_groups_rows(self) -> None:
+        """Test prepared chain groups rows by type and expiration."""
+        chain = pd.DataFrame({
+            "expiration": pd.to_datetime([
+                "2024-02-02", "2024-01-19", "2024-02-02", "2024-01-19",
+            ]),
+            "strike": [470.0, 450.0, 450.0, 455.0],
+            "option_type": ["put", "put", "put", "call"],
+        })
+
+        prepared = OptionSelector.prepare_chain(chain)
+
+        assert isinstance(prepared, PreparedChain)
+        assert OptionSelector.prepare_chain(prepared) is prepared
+        assert prepared.expirations("put").tolist() == [date(2024, 1, 19), date(2024, 2, 2)]
+        assert prepared.expirations("call").tolist() == [date(2024, 1, 19)]
+        # Rows keep their original frame order
+        assert prepared.rows("put", date(2024, 2, 2))["strike"].tolist() == [470.0, 450.0]
+        assert prepared.rows("call", date(2024, 2, 2)).empty
+        # Expirations are computed once and shared between calls
+        assert prepared.expirations("put") is prepared.expirations("put")
+        assert not prepared.expirations("put").flags.writeable
+        # Repeated lookups reuse the same view
+        assert prepared.rows("put", date(2024, 2, 2)) is prepared.rows("put", date(2024, 2, 2))
+
+    def test_prepare_chain_uses_expiration_days(self) -> None:
+        """Test precomputed expiration days are used instead of the datetimes."""
+        chain = pd.DataFrame({
+            "expiration": pd.to_datetime(["2024-02-02 16:00", "2024-02-16 09:30"]),
+            "strike": [450.0, 470.0],
+            "option_type": ["put", "put"],
+        })
+        days = expiration_days(chain["expiration"])
+
+        assert days.dtype == np.int32
+        assert days.astype("datetime64[D]").tolist() == [date(2024, 2, 2), date(2024, 2, 16)]
+
+        # Day column wins over the datetime column
+        chain[EXPIRATION_DAY_COLUMN] = days[::-1]
+        prepared = OptionSelector.prepare_chain(chain)
+        assert prepared.rows("put", date(2024, 2, 16))["strike"].tolist() == [450.0]
+
+    def test_prepare_chain_categorical_types(self) -> None:
+        """Test categorical option types group by code, skipping unused categories."""
+        chain = pd.DataFrame({
+            "expiration": pd.to_datetime(["2024-02-02", "2024-02-02"]),
+            "strike": [450.0, 470.0],
+            "option_type": pd.Categorical(["put", "put"], categories=["call", "put"]),
+        })
+
+        prepared = OptionSelector.prepare_chain(chain)
+
+        assert prepared.expirations("put").tolist() == [date(2024, 2, 2)]
+        assert len(prepared.expirations("call")) == 0
+
+    def test_select_option_repeated_strike_uses_first_row(self) -> None:
+        """Test a strike quoted twice prices from its first row."""
+        selector = OptionSelector(dte_target=30, dte_min=7, delta_target=0.20)
+
+        chain = pd.DataFrame({
+            "expiration": pd.to_datetime(["2024-02-02"] * 3),
+            "strike": [445.0, 450.0, 450.0],
+            "option_type": ["put"] * 3,
+            "bid": [4.00, 5.00, 5.20],
+            "ask": [4.40, 5.40, 5.60],
+            "delta": [-0.30, -0.25, -0.20],
+        })
+
+        result = selector.select_option_from_chain(
+            chain=chain,
+            option_type=OptionType.PUT,
+            underlying_price=472.0,
+            trade_date=date(2024, 1, 2),
+        )
+
+        assert result is not None
+        assert result.strike == 450.0
+        assert result.bid == 5.00
+        assert result.delta == -0.25
+
+    def test_compile_binds_settings(self) -> None:
+        """Test a compiled selector matches the method and keeps its settings."""
+        chain = pd.DataFrame({
+            "expiration": pd.to_datetime(["2024-01-19", "2024-02-02", "2024-02-02"]),
+            "strike": [450.0, 450.0, 470.0],
+            "option_type": ["put", "put", "put"],
+            "bid": [4.50, 6.00, 3.00],
+            "ask": [5.00, 6.50, 3.50],
+        })
+        selector = OptionSelector(dte_target=30, dte_min=7, otm_pct=0.05)
+
+        select = selector.compile()
+        expected = selector.select_option_from_chain(
+            chain, OptionType.PUT, 472.0, date(2024, 1, 2)
+        )
+        assert select(chain, OptionType.PUT, 472.0, date(2024, 1, 2)) == expected
+
+        # Later changes only affect new compilations
+        selector.dte_target = 17
+        assert select(chain, OptionType.PUT, 472.0, date(2024, 1, 2)).dte == 31
+        assert selector.compile()(chain, OptionType.PUT, 472.0, date(2024, 1, 2)).dte == 17
+
+    def test_select_all_matches_daily_selection(self) -> None:
+        """Test batch selection equals per-day selection and skips unpriced days."""
+        day = pd.DataFrame({
+            "expiration": pd.to_datetime(["2024-02-02", "2024-02-02", "2024-02-16"]),
+            "strike": [450.0, 460.0, 450.0],
+            "option_type": ["put", "put", "put"],
+            "bid": [6.00, 8.00, 7.00],
+            "ask": [6.50, 8.50, 7.50],
+            "delta": [-0.22, -0.31, -0.25],
+        })
+        history = pd.concat([
+            day.assign(trade_date=pd.Timestamp("2024-01-02 16:00")),
+            day.assign(trade_date=pd.Timestamp("2024-01-03 16:00")),
+            day.assign(trade_date=pd.Timestamp("2024-01-04 16:00")),
+        ], ignore_index=True)
+        prices = pd.Series(
+            [472.0, 455.0],
+            index=pd.to_datetime(["2024-01-02", "2024-01-03"]),
+        )
+        selector = OptionSelector(dte_target=30, dte_min=7, delta_target=0.30)
+
+        table = selector.select_all(history, prices, OptionType.PUT)
+
+        assert list(table.index) == [pd.Timestamp("2024-01-02"), pd.Timestamp("2024-01-03")]
+        for trade_ts, price in prices.items():
+            expected = selector.select_option_from_chain(
+                day, OptionType.PUT, price, trade_ts.date()
+            )
+            assert tuple(table.loc[trade_ts]) == tuple(expected)
 
     def test_select_option_from_chain_empty(self) -> None:
         """Test selection from empty chain."""
@@ -135,16 +336,16 @@ class TestOptionSelector:
         """Test creating sell order from option info."""
         selector = OptionSelector()
 
-        option_info = {
-            "expiration": date(2024, 1, 19),
-            "strike": 450.0,
-            "option_type": OptionType.PUT,
-            "bid": 4.50,
-            "ask": 5.00,
-            "mid_price": 4.75,
-            "delta": -0.25,
-            "dte": 17,
-        }
+        option_info = SelectedOption(
+            expiration=date(2024, 1, 19),
+            strike=450.0,
+            option_type=OptionType.PUT,
+            bid=4.50,
+            ask=5.00,
+            mid_price=4.75,
+            delta=-0.25,
+            dte=17,
+        )
 
         order = selector.create_sell_order(option_info, quantity=2)
 
@@ -220,3 +421,64 @@ class TestFill:
 
         # Buy: pay premium plus commission (negative)
         assert fill.net_premium == -301.0  # -(300 + 1)
+
+    def test_net_premium_sell_to_close(self) -> None:
+        """Test closing a long position also receives premium."""
+        order = OptionOrder(
+            action=OrderAction.SELL_TO_CLOSE,
+            option_type=OptionType.CALL,
+            strike=480.0,
+            expiration=date(2024, 1, 19),
+            quantity=1,
+        )
+
+        fill = Fill(
+            order=order,
+            fill_price=2.00,
+            fill_date=date(2024, 1, 10),
+            underlying_price=478.0,
+            commission=1.00,
+        )
+
+        assert fill.net_premium == 199.0  # 200 - 1
+
+    def test_fill_is_immutable(self) -> None:
+        """Test premiums are fixed at construction."""
+        order = OptionOrder(
+            action=OrderAction.SELL_TO_OPEN,
+            option_type=OptionType.PUT,
+            strike=450.0,
+            expiration=date(2024, 1, 19),
+            quantity=1,
+        )
+
+        fill = Fill(
+            order=order,
+            fill_price=5.00,
+            fill_date=date(2024, 1, 2),
+            underlying_price=472.0,
+        )
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            fill.fill_price = 6.00  # type: ignore[misc]
+        assert fill.total_premium == 500.0
+
+    def test_orders_and_fills_use_slots(self) -> None:
+        """Test orders and fills carry no per-instance __dict__."""
+        order = OptionOrder(
+            action=OrderAction.SELL_TO_OPEN,
+            option_type=OptionType.PUT,
+            strike=450.0,
+            expiration=date(2024, 1, 19),
+            quantity=1,
+        )
+        fill = Fill(
+            order=order,
+            fill_price=5.00,
+            fill_date=date(2024, 1, 2),
+            underlying_price=472.0,
+        )
+
+        assert not hasattr(order, "__dict__")
+        assert not hasattr(fill, "__dict__")
+        assert fill.net_premium == 500.0
@@ -1,5 +1,6 @@
 """Tests for portfolio management."""
 
+import dataclasses
 from datetime import date
 
 import pytest
@@ -107,6 +108,29 @@ class TestOptionPosition:
         assert call.intrinsic_value(100.0) == 0.0  # ATM
         assert call.intrinsic_value(95.0) == 0.0  # OTM
 
+    def test_intrinsic_value_matches_payoff(self) -> None:
+        """Test intrinsic value and moneyness equal the textbook payoffs exactly."""
+        for option_type in (OptionType.PUT, OptionType.CALL):
+            position = OptionPosition(
+                option_type=option_type,
+                side=PositionSide.SHORT,
+                strike=447.37,
+                expiration=date(2024, 1, 19),
+                quantity=1,
+                entry_price=2.50,
+                entry_date=date(2024, 1, 2),
+                underlying_price_at_entry=450.0,
+            )
+            for price in (0.1, 101.3, 447.36, 447.37, 447.38, 512.93):
+                if option_type == OptionType.PUT:
+                    payoff = max(0.0, 447.37 - price)
+                    itm = price < 447.37
+                else:
+                    payoff = max(0.0, price - 447.37)
+                    itm = price > 447.37
+                assert position.intrinsic_value(price) == payoff
+                assert position.is_itm(price) is itm
+
     def test_is_expired(self) -> None:
         """Test expiration check."""
         position = OptionPosition(
@@ -125,6 +149,27 @@ class TestOptionPosition:
         assert position.is_expired(date(2024, 1, 20)) is True
 
 
+    def test_flags_fixed_at_construction(self) -> None:
+        """Test derived flags and immutability of a position."""
+        position = OptionPosition(
+            option_type=OptionType.CALL,
+            side=PositionSide.SHORT,
+            strike=110.0,
+            expiration=date(2024, 1, 19),
+            quantity=2,
+            entry_price=1.50,
+            entry_date=date(2024, 1, 2),
+            underlying_price_at_entry=105.0,
+        )
+
+        assert (position.is_short, position.is_put, position.is_call) == (True, False, True)
+        assert position.shares == 200
+        assert position.notional_value == 22_000.0
+        assert not hasattr(position, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            position.strike = 120.0  # type: ignore[misc]
+
+
 class TestPortfolio:
     """Tests for Portfolio."""
 
@@ -135,6 +180,13 @@ class TestPortfolio:
         assert portfolio.shares == 0
         assert len(portfolio.option_positions) == 0
 
+    def test_no_instance_dict(self) -> None:
+        """Test the portfolio keeps its state in fixed slots."""
+        portfolio = Portfolio(cash=1_000.0)
+        assert not hasattr(portfolio, "__dict__")
+        with pytest.raises(AttributeError):
+            portfolio.margin = 0.0  # type: ignore[attr-defined]
+
     def test_deposit(self) -> None:
         """Test depositing cash."""
         portfolio = Portfolio()
@@ -313,6 +365,27 @@ class TestPortfolio:
         # P&L is just the premium (we "lose" upside above strike)
         assert pnl == 350.0
 
+    def test_positions_use_portfolio_multiplier(self) -> None:
+        """Test opened positions carry the portfolio's contract multiplier."""
+        portfolio = Portfolio(cash=10_000.0, contract_multiplier=10)
+        position = portfolio.open_short_option(
+            option_type=OptionType.PUT,
+            strike=450.0,
+            expiration=date(2024, 1, 19),
+            quantity=2,
+            premium_per_share=5.00,
+            trade_date=date(2024, 1, 2),
+            underlying_price=472.0,
+        )
+
+        assert position.shares == 20
+        assert portfolio.cash == pytest.approx(10_100.0)
+        assert portfolio.get_buying_power() == pytest.approx(1_100.0)
+
+        pnl = portfolio.exercise_put_assignment(position, underlying_price=440.0)
+        assert portfolio.shares == 20
+        assert pnl == pytest.approx(5.00 * 20 - 10.0 * 20)
+
     def test_get_equity(self) -> None:
         """Test equity calculation."""
         portfolio = Portfolio(cash=50_000.0, shares=100)
@@ -321,6 +394,25 @@ class TestPortfolio:
 
         assert equity == 95_000.0  # 50,000 + 100*450
 
+    def test_get_equity_after_book_empties(self) -> None:
+        """Test equity once the last option position has expired."""
+        portfolio = Portfolio(cash=50_000.0, shares=100)
+        position = portfolio.open_short_option(
+            option_type=OptionType.CALL,
+            strike=460.0,
+            expiration=date(2024, 1, 19),
+            quantity=1,
+            premium_per_share=3.00,
+            trade_date=date(2024, 1, 2),
+            underlying_price=450.0,
+        )
+        assert portfolio.has_open_positions() is True
+        assert portfolio.get_equity(470.0) == pytest.approx(95_300.0 + 2_000.0 - 1_000.0)
+
+        portfolio.expire_option_worthless(position)
+        assert portfolio.has_open_positions() is False
+        assert portfolio.get_equity(450.0) == 95_300.0
+
     def test_get_buying_power_with_short_puts(self) -> None:
         """Test buying power calculation with short puts."""
         portfolio = Portfolio(cash=100_000.0)
@@ -340,6 +432,161 @@ class TestPortfolio:
         buying_power = portfolio.get_buying_power()
         assert buying_power == pytest.approx(55_500.0)
 
+    def test_buying_power_released_when_put_closes(self) -> None:
+        """Test that the put reserve follows positions as they open and close."""
+        portfolio = Portfolio(cash=100_000.0)
+        position = portfolio.open_short_option(
+            option_type=OptionType.PUT,
+            strike=450.0,
+            expiration=date(2024, 1, 19),
+            quantity=2,
+            premium_per_share=5.00,
+            trade_date=date(2024, 1, 2),
+            underlying_price=472.0,
+        )
+        assert portfolio.get_buying_power() == pytest.approx(11_000.0)
+
+        portfolio.expire_option_worthless(position)
+        assert portfolio.get_buying_power() == pytest.approx(portfolio.cash)
+        assert portfolio.short_put_count == 0
+
+    def test_buying_power_with_positions_at_construction(self) -> None:
+        """Test that positions passed to the constructor are reserved."""
+        position = OptionPosition(
+            option_type=OptionType.PUT,
+            side=PositionSide.SHORT,
+            strike=450.0,
+            expiration=date(2024, 1, 19),
+            quantity=1,
+            entry_price=5.00,
+            entry_date=date(2024, 1, 2),
+            underlying_price_at_entry=472.0,
+        )
+        portfolio = Portfolio(cash=50_000.0, option_positions=[position])
+        assert portfolio.get_buying_power() == pytest.approx(5_000.0)
+
+    def test_close_position_matches_by_identity(self) -> None:
+        """Test that closing removes that exact holding, not an equal one."""
+        portfolio = Portfolio(cash=100_000.0)
+        terms = dict(
+            option_type=OptionType.PUT,
+            strike=450.0,
+            expiration=date(2024, 1, 19),
+            quantity=1,
+            premium_per_share=5.00,
+            trade_date=date(2024, 1, 2),
+            underlying_price=472.0,
+        )
+        first = portfolio.open_short_option(**terms)
+        second = portfolio.open_short_option(**terms)
+
+        portfolio.close_option_position(second, close_price=1.00)
+        assert portfolio.option_positions == (first,)
+        assert portfolio.option_positions[0] is first
+
+        with pytest.raises(ValueError, match="not found"):
+            portfolio.expire_option_worthless(second)
+
+    def test_option_positions_is_read_only(self) -> None:
+        """Test open positions can only change through the portfolio methods."""
+        portfolio = Portfolio(cash=100_000.0)
+        portfolio.open_short_option(
+            option_type=OptionType.PUT,
+            strike=450.0,
+            expiration=date(2024, 1, 19),
+            quantity=1,
+            premium_per_share=5.00,
+            trade_date=date(2024, 1, 2),
+            underlying_price=472.0,
+        )
+
+        with pytest.raises(AttributeError):
+            portfolio.option_positions = ()  # type: ignore[misc]
+        with pytest.raises(AttributeError):
+            portfolio.option_positions.append(None)  # type: ignore[attr-defined]
+        assert len(portfolio.option_positions) == 1
+
+    def test_unknown_position_leaves_portfolio_untouched(self) -> None:
+        """Test every close path rejects a foreign position before mutating."""
+        portfolio = Portfolio(cash=100_000.0, shares=100)
+        other = Portfolio(cash=100_000.0, shares=100)
+        foreign_put = other.open_short_option(
+            option_type=OptionType.PUT,
+            strike=450.0,
+            expiration=date(2024, 1, 19),
+            quantity=1,
+            premium_per_share=5.00,
+            trade_date=date(2024, 1, 2),
+            underlying_price=472.0,
+        )
+        foreign_call = other.open_short_option(
+            option_type=OptionType.CALL,
+            strike=490.0,
+            expiration=date(2024, 1, 19),
+            quantity=1,
+            premium_per_share=3.00,
+            trade_date=date(2024, 1, 2),
+            underlying_price=472.0,
+        )
+
+        attempts = [
+            lambda: portfolio.close_option_position(foreign_put, close_price=1.00),
+            lambda: portfolio.expire_option_worthless(foreign_call),
+            lambda: portfolio.exercise_put_assignment(foreign_put, underlying_price=440.0),
+            lambda: portfolio.exercise_call_assignment(foreign_call, underlying_price=500.0),
+        ]
+        for attempt in attempts:
+            with pytest.raises(ValueError, match="not found"):
+                attempt()
+            assert (portfolio.cash, portfolio.shares) == (100_000.0, 100)
+
+    def test_get_equity_with_position_mid_prices(self) -> None:
+        """Test that positions can key the mid-price mapping."""
+        portfolio = Portfolio(cash=100_000.0)
+        position = portfolio.open_short_option(
+            option_type=OptionType.PUT,
+            strike=450.0,
+            expiration=date(2024, 1, 19),
+            quantity=1,
+            premium_per_share=5.00,
+            trade_date=date(2024, 1, 2),
+            underlying_price=472.0,
+        )
+        equity = portfolio.get_equity(472.0, option_mid_prices={position: 2.00})
+        assert equity == pytest.approx(100_500.0 - 200.0)
+
+    def test_next_expiration_tracks_open_positions(self) -> None:
+        """Test the earliest expiration follows positions as they change."""
+        portfolio = Portfolio(cash=100_000.0, shares=100)
+        assert portfolio.next_expiration is None
+        assert portfolio.has_expired_positions(date(2030, 1, 1)) is False
+
+        put = portfolio.open_short_option(
+            option_type=OptionType.PUT,
+            strike=450.0,
+            expiration=date(2024, 1, 19),
+            quantity=1,
+            premium_per_share=5.00,
+            trade_date=date(2024, 1, 2),
+            underlying_price=472.0,
+        )
+        portfolio.open_short_option(
+            option_type=OptionType.CALL,
+            strike=490.0,
+            expiration=date(2024, 2, 16),
+            quantity=1,
+            premium_per_share=3.00,
+            trade_date=date(2024, 1, 2),
+            underlying_price=472.0,
+        )
+        assert portfolio.next_expiration == date(2024, 1, 19)
+        assert portfolio.has_expired_positions(date(2024, 1, 18)) is False
+        assert portfolio.has_expired_positions(date(2024, 1, 19)) is True
+
+        portfolio.expire_option_worthless(put)
+        assert portfolio.next_expiration == date(2024, 2, 16)
+        assert portfolio.has_expired_positions(date(2024, 1, 19)) is False
+
     def test_get_short_puts_and_calls(self) -> None:
         """Test filtering positions by type."""
         portfolio = Portfolio(cash=100_000.0, shares=100)
@@ -370,3 +617,8 @@ class TestPortfolio:
         assert len(portfolio.get_short_calls()) == 1
         assert portfolio.get_short_puts()[0].strike == 450.0
         assert portfolio.get_short_calls()[0].strike == 490.0
+        assert portfolio.get_short_options() == (
+            portfolio.get_short_puts(),
+            portfolio.get_short_calls(),
+        )
+        assert (portfolio.short_put_count, portfolio.short_call_count) == (1, 1)
@@ -66,6 +66,54 @@ class TestPhilippdubachProvider:
         assert len(chain) == 2
         assert list(chain["strike"]) == [470.0, 475.0]
 
+    def test_options_chain_by_date(self, temp_dir: Path) -> None:
+        """Test chain lookup matches the trade date regardless of row order."""
+        cache = DataCache(temp_dir / "cache")
+        provider = PhilippdubachProvider(cache)
+
+        mock_df = pd.DataFrame({
+            "trade_date": pd.to_datetime([
+                "2024-01-03 16:00", "2024-01-02 16:00", "2024-01-03 09:30", "2024-01-02 09:30",
+            ]),
+            "expiration": pd.to_datetime(["2024-01-05"] * 4),
+            "strike": [480.0, 470.0, 485.0, 475.0],
+            "option_type": ["call", "call", "put", "put"],
+        })
+        cache.put("philippdubach", "SPY", "options", mock_df)
+
+        chain = provider.get_options_chain("SPY", date(2024, 1, 3))
+
+        assert list(chain["strike"]) == [480.0, 485.0]
+        assert list(chain.index) == [0, 2]
+        assert provider.get_options_chain("SPY", date(2024, 1, 4)).empty
+
+    def test_filtered_options_projection(self, temp_dir: Path) -> None:
+        """Test date-range filtering with column projection from cached data."""
+        cache = DataCache(temp_dir / "cache")
+        provider = PhilippdubachProvider(cache)
+
+        mock_df = pd.DataFrame({
+            "trade_date": pd.to_datetime(["2024-01-02", "2024-01-03", "2024-01-04"]),
+            "expiration": pd.to_datetime(["2024-01-19"] * 3),
+            "strike": [470.0, 475.0, 480.0],
+            "option_type": ["put", "put", "call"],
+            "gamma": [0.01, 0.02, 0.03],
+        })
+        cache.put("philippdubach", "SPY", "options", mock_df)
+
+        df = provider.get_filtered_options(
+            "SPY",
+            date(2024, 1, 3),
+            date(2024, 1, 4),
+            columns=["trade_date", "strike", "option_type", "delta"],
+        )
+
+        assert list(df.columns) == ["trade_date", "strike", "option_type"]
+        assert list(df["strike"]) == [475.0, 480.0]
+
+        full = provider.get_filtered_options("SPY", date(2024, 1, 3), date(2024, 1, 4))
+        assert "gamma" in full.columns
+
     def test_underlying_not_implemented(self, temp_dir: Path) -> None:
         """Test that underlying prices raise NotImplementedError."""
         cache = DataCache(temp_dir / "cache")
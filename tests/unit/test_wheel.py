@@ -6,8 +6,8 @@ import pandas as pd
 import pytest
 
 from wheel_backtest.engine.options import OptionSelector
-from wheel_backtest.engine.portfolio import OptionType, Portfolio
-from wheel_backtest.engine.wheel import WheelState, WheelStrategy
+from wheel_backtest.engine.portfolio import OptionPosition, OptionType, Portfolio, PositionSide
+from wheel_backtest.engine.wheel import WheelEvent, WheelState, WheelStrategy
 
 
 def create_mock_chain(
@@ -51,6 +51,77 @@ def create_mock_chain(
 class TestWheelStrategy:
     """Tests for WheelStrategy."""
 
+    def test_has_pending_work(self) -> None:
+        """Test days with an open, unexpired position are skippable."""
+        portfolio = Portfolio(cash=100_000.0)
+        selector = OptionSelector(dte_target=30, otm_pct=0.05)
+        strategy = WheelStrategy(portfolio, selector)
+        trade_date = date(2024, 1, 2)
+
+        # Nothing open yet: a put should be sold
+        assert strategy.has_pending_work(trade_date)
+
+        strategy.process_day(trade_date, 450.0, create_mock_chain(trade_date, 450.0))
+        expiration = portfolio.option_positions[0].expiration
+
+        assert not strategy.has_pending_work(date(2024, 1, 3))
+        assert strategy.has_pending_work(expiration)
+
+    def test_has_pending_work_while_holding_stock(self) -> None:
+        """Test the stock leg: pending until a call is open, then quiet."""
+        portfolio = Portfolio(cash=100_000.0, shares=100)
+        selector = OptionSelector(dte_target=30, dte_min=7, otm_pct=0.05)
+        strategy = WheelStrategy(portfolio, selector)
+        trade_date = date(2024, 1, 22)
+
+        assert strategy.has_pending_work(trade_date)
+        assert strategy.state == WheelState.HOLDING_STOCK
+
+        chain = create_mock_chain(trade_date, 455.0, call_strikes=[480.0])
+        strategy.process_day(trade_date, 455.0, chain)
+
+        assert not strategy.has_pending_work(date(2024, 1, 23))
+        assert strategy.state == WheelState.SELLING_CALLS
+
+    def test_state_for_every_holding_combination(self) -> None:
+        """Test state and open decision across all holding combinations."""
+        selector = OptionSelector(dte_target=30, dte_min=7, otm_pct=0.05)
+
+        def short(option_type: OptionType) -> OptionPosition:
+            return OptionPosition(
+                option_type=option_type,
+                side=PositionSide.SHORT,
+                strike=450.0,
+                expiration=date(2024, 2, 16),
+                quantity=1,
+                entry_price=3.00,
+                entry_date=date(2024, 1, 2),
+                underlying_price_at_entry=450.0,
+            )
+
+        for shares in (0, 100):
+            for has_call in (False, True):
+                for has_put in (False, True):
+                    positions = []
+                    if has_call:
+                        positions.append(short(OptionType.CALL))
+                    if has_put:
+                        positions.append(short(OptionType.PUT))
+                    portfolio = Portfolio(cash=100_000.0, shares=shares, option_positions=positions)
+                    strategy = WheelStrategy(portfolio, selector)
+
+                    should_open = strategy.has_pending_work(date(2024, 1, 3))
+
+                    if not shares:
+                        assert strategy.state == WheelState.SELLING_PUTS
+                        assert should_open is not has_put
+                    elif has_call:
+                        assert strategy.state == WheelState.SELLING_CALLS
+                        assert should_open is False
+                    else:
+                        assert strategy.state == WheelState.HOLDING_STOCK
+                        assert should_open is True
+
     def test_initial_state(self) -> None:
         """Test initial state is SELLING_PUTS."""
         portfolio = Portfolio(cash=100_000.0)
@@ -74,6 +145,20 @@ class TestWheelStrategy:
         assert strategy.state == WheelState.SELLING_PUTS
         assert len(portfolio.get_short_puts()) == 1
 
+    def test_process_day_with_prepared_chain(self) -> None:
+        """Test a prepared chain is used without regrouping."""
+        portfolio = Portfolio(cash=100_000.0)
+        selector = OptionSelector(dte_target=30, dte_min=7, otm_pct=0.05)
+        strategy = WheelStrategy(portfolio, selector)
+
+        chain = create_mock_chain(date(2024, 1, 2), 472.0, put_strikes=[448.0])
+        prepared = selector.prepare_chain(chain)
+        events = strategy.process_day(date(2024, 1, 2), 472.0, prepared)
+
+        assert [e.event_type for e in events] == ["sell_put"]
+        # The selection read the caller's prepared chain
+        assert prepared._legs
+
     def test_put_expires_worthless(self) -> None:
         """Test put expiring OTM (worthless)."""
         portfolio = Portfolio(cash=100_000.0)
@@ -248,6 +333,73 @@ class TestWheelStrategy:
         assert summary["put_assignments"] == 0
         assert summary["current_state"] == "selling_puts"
 
+    def test_get_summary_premium_totals(self) -> None:
+        """Test premium totals cover every put and call sale."""
+        portfolio = Portfolio(cash=100_000.0)
+        selector = OptionSelector(dte_target=15, dte_min=7, otm_pct=0.05)
+        strategy = WheelStrategy(portfolio, selector, contracts_per_trade=2)
+
+        # Put sale, then assignment followed by a call sale
+        chain1 = create_mock_chain(date(2024, 1, 2), 472.0, put_strikes=[448.0], dte=17)
+        strategy.process_day(date(2024, 1, 2), 472.0, chain1)
+        chain2 = create_mock_chain(date(2024, 1, 19), 440.0, call_strikes=[465.0], dte=21)
+        strategy.process_day(date(2024, 1, 19), 440.0, chain2)
+
+        summary = strategy.get_summary()
+
+        assert summary["total_puts_sold"] == 1
+        assert summary["put_assignments"] == 1
+        assert summary["total_calls_sold"] == 1
+        assert summary["calls_expired_otm"] == 0
+
+        # Mid prices: put 4.75, call 3.25, two contracts each
+        assert summary["total_premium_from_puts"] == pytest.approx(950.0)
+        assert summary["total_premium_from_calls"] == pytest.approx(650.0)
+        assert summary["total_premium_collected"] == pytest.approx(1_600.0)
+
+    def test_trade_size_and_commission(self) -> None:
+        """Test multi-contract trades carry the per-trade commission."""
+        portfolio = Portfolio(cash=100_000.0)
+        selector = OptionSelector(dte_target=30, dte_min=7, otm_pct=0.05)
+        strategy = WheelStrategy(
+            portfolio, selector, contracts_per_trade=2, commission_per_contract=0.65
+        )
+
+        chain = create_mock_chain(date(2024, 1, 2), 472.0, put_strikes=[448.0])
+        events = strategy.process_day(date(2024, 1, 2), 472.0, chain)
+
+        assert events[0].details["contracts"] == 2
+        assert events[0].details["commission"] == pytest.approx(1.30)
+        assert portfolio.cash == pytest.approx(100_000.0 + 4.75 * 200 - 1.30)
+
+    def test_trade_settings_changed_after_init(self) -> None:
+        """Test trade size and commission set later are used for new trades."""
+        portfolio = Portfolio(cash=100_000.0)
+        selector = OptionSelector(dte_target=30, dte_min=7, otm_pct=0.05)
+        strategy = WheelStrategy(portfolio, selector)
+
+        strategy.contracts_per_trade = 2
+        strategy.commission = 0.65
+        chain = create_mock_chain(date(2024, 1, 2), 472.0, put_strikes=[448.0])
+        events = strategy.process_day(date(2024, 1, 2), 472.0, chain)
+
+        assert events[0].details["contracts"] == 2
+        assert events[0].details["commission"] == pytest.approx(1.30)
+        assert portfolio.cash == pytest.approx(100_000.0 + 4.75 * 200 - 1.30)
+
+    def test_selector_changes_take_effect(self) -> None:
+        """Test changed selector settings and a replaced selector are both used."""
+        selector = OptionSelector(dte_target=30, dte_min=7, otm_pct=0.05)
+        strategy = WheelStrategy(Portfolio(cash=100_000.0), selector)
+        chain = create_mock_chain(date(2024, 1, 2), 472.0, put_strikes=[448.0])
+
+        selector.dte_min = 45
+        assert strategy.process_day(date(2024, 1, 2), 472.0, chain) == []
+
+        strategy.selector = OptionSelector(dte_target=30, dte_min=7, otm_pct=0.05)
+        events = strategy.process_day(date(2024, 1, 2), 472.0, chain)
+        assert [e.event_type for e in events] == ["sell_put"]
+
     def test_insufficient_buying_power(self) -> None:
         """Test that put is not sold without enough buying power."""
         portfolio = Portfolio(cash=10_000.0)  # Not enough for a 448 strike put
@@ -260,3 +412,51 @@ class TestWheelStrategy:
         # No put should be sold
         assert len(events) == 0
         assert len(portfolio.get_short_puts()) == 0
+
+    def test_events_are_slotted(self) -> None:
+        """Test that recorded events carry no per-instance __dict__."""
+        portfolio = Portfolio(cash=100_000.0)
+        selector = OptionSelector(dte_target=30, dte_min=7, otm_pct=0.05)
+        strategy = WheelStrategy(portfolio, selector)
+
+        chain = create_mock_chain(date(2024, 1, 2), 472.0, put_strikes=[448.0])
+        events = strategy.process_day(date(2024, 1, 2), 472.0, chain)
+
+        assert isinstance(events[0], WheelEvent)
+        assert not hasattr(events[0], "__dict__")
+
+    def test_events_returned_without_copy(self) -> None:
+        """Test the events property hands out the recorded list itself."""
+        portfolio = Portfolio(cash=100_000.0)
+        selector = OptionSelector(dte_target=30, dte_min=7, otm_pct=0.05)
+        strategy = WheelStrategy(portfolio, selector)
+
+        chain = create_mock_chain(date(2024, 1, 2), 472.0, put_strikes=[448.0])
+        day_events = strategy.process_day(date(2024, 1, 2), 472.0, chain)
+
+        assert strategy.events is strategy.events
+        assert strategy.events == day_events
+
+    def test_reset_for_another_run(self) -> None:
+        """Test reset clears run state and keeps earlier results intact."""
+        portfolio = Portfolio(cash=100_000.0)
+        selector = OptionSelector(dte_target=30, dte_min=7, otm_pct=0.05)
+        strategy = WheelStrategy(portfolio, selector, contracts_per_trade=2)
+
+        chain = create_mock_chain(date(2024, 1, 2), 472.0, put_strikes=[448.0])
+        strategy.process_day(date(2024, 1, 2), 472.0, chain)
+        first_run_events = strategy.events
+
+        fresh_portfolio = Portfolio(cash=100_000.0)
+        strategy.reset(fresh_portfolio)
+
+        assert strategy.portfolio is fresh_portfolio
+        assert strategy.state == WheelState.SELLING_PUTS
+        assert strategy.events == []
+        assert strategy.get_summary()["total_premium_collected"] == 0.0
+        assert len(first_run_events) == 1
+        assert strategy.contracts_per_trade == 2
+
+        events = strategy.process_day(date(2024, 1, 2), 472.0, chain)
+        assert [e.event_type for e in events] == ["sell_put"]
+        assert strategy.get_summary()["total_puts_sold"] == 1